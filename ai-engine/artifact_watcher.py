@@ -0,0 +1,148 @@
+"""
+MuleHunter AI  ·  Artifact Watcher  ·  v1.0
+============================================
+Polling file watcher for the serving artifacts in ``SHARED_DATA``.
+
+A daemon thread stats each watched path every ``interval_sec`` and builds a
+signature of (mtime_ns, size) per file.  When the signature changes, the
+watcher waits until it has stayed the same for ``settle_polls`` further
+polls — ``train_model.py`` writes several files one after another, and a
+half-written ``.pth`` must not trigger a reload — then calls
+``on_change(changed_names)`` once.
+
+Polling (rather than inotify) works the same on bind mounts, Docker volumes
+and network shares, and costs a handful of ``stat`` calls per interval.
+
+(mtime, size) is only the watcher's cheap "did anything happen" check.
+Compiled artifacts (the serving snapshot, the TorchScript export) record
+``content_signature`` — a streamed hash of each source file's bytes — so a
+copy, checkout or rebuild that leaves the bytes identical does not make
+them stale, and an edit that keeps mtime and size does.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("MuleHunter-Inference")
+
+Signature = Dict[str, Optional[tuple[int, int]]]
+Digests   = Dict[str, Optional[str]]
+
+HASH_CHUNK = 1 << 20
+
+
+def artifact_signature(paths: List[Path]) -> Signature:
+    """name → (mtime_ns, size), or None for a missing file."""
+    sig: Signature = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            sig[path.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            sig[path.name] = None
+    return sig
+
+
+def content_signature(paths: List[Path]) -> Digests:
+    """name → BLAKE2b-128 hex digest of the file's bytes, or None for a missing file."""
+    sig: Digests = {}
+    for path in paths:
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                    digest.update(chunk)
+        except OSError:
+            sig[path.name] = None
+            continue
+        sig[path.name] = digest.hexdigest()
+    return sig
+
+
+class ArtifactWatcher:
+
+    def __init__(
+        self,
+        name:         str,
+        paths:        List[Path],
+        on_change:    Callable[[List[str]], Any],
+        interval_sec: float = 5.0,
+        settle_polls: int   = 1,
+    ) -> None:
+        self.name         = name
+        self.paths        = list(paths)
+        self.interval_sec = max(0.1, float(interval_sec))
+        self.settle_polls = max(0, int(settle_polls))
+        self._on_change   = on_change
+        self._stop        = threading.Event()
+        self._thread:  Optional[threading.Thread] = None
+        self._seen:    Signature = {}
+        self._pending: Optional[Signature] = None
+        self._stable   = 0
+
+        self._polls    = 0
+        self._triggers = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._seen   = artifact_signature(self.paths)
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        logger.info(
+            "%s: watching %d artifacts every %.1fs", self.name, len(self.paths), self.interval_sec,
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_sec + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_sec):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("%s: poll failed", self.name)
+
+    def poll(self) -> Optional[List[str]]:
+        """
+        One watcher step.  Returns the changed file names when ``on_change``
+        was called, else None.
+        """
+        self._polls += 1
+        sig = artifact_signature(self.paths)
+
+        if sig == self._seen:
+            self._pending = None
+            return None
+        if sig != self._pending:          # new or still-moving change
+            self._pending = sig
+            self._stable  = 0
+        else:
+            self._stable += 1
+        if self._stable < self.settle_polls:
+            return None
+
+        changed       = sorted(n for n in sig if sig[n] != self._seen.get(n))
+        self._seen    = sig
+        self._pending = None
+        self._triggers += 1
+        logger.info("%s: artifacts changed: %s", self.name, ", ".join(changed))
+        self._on_change(changed)
+        return changed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval_sec": self.interval_sec,
+            "running":      self._thread is not None and self._thread.is_alive(),
+            "polls":        self._polls,
+            "triggers":     self._triggers,
+        }
@@ -4,12 +4,15 @@ MuleHunter AI  ·  Feature Engineering  ·  v3.0
 Graph-level feature extraction pipeline:
 
   · Ring / cycle detection  (money-laundering signature)
-      — Timeout-guarded so it never hangs on large graphs
+      — Exact, deterministic enumeration per SCC (ring_engine.py)
       — Restricted to account nodes only (no location nodes)
-  · Louvain / greedy community detection (collusive cluster IDs)
+  · Louvain community detection (collusive cluster IDs)
+      — Multi-level, over sparse CSR arrays (communities.py)
   · Second-hop fraud exposure (guilt-by-association propagation)
   · Temporal burst detection
   · Reciprocity scoring (circular-flow detection)
+      — Vectorised over a sparse adjacency (graph_metrics.py)
+  · PageRank by sparse power iteration, warm-started from the last run
   · Normalised feature tensors for the GNN (with saved norm params)
 
 Bug-fixes vs v2:
@@ -20,8 +23,8 @@ Bug-fixes vs v2:
       consistent with what inference_service.py will reload.
   [4] Empty-graph guard added.
   [5] torch.randperm seeded correctly inside split_idx.
-  [6] Removed nx.from_pandas_edgelist duplicate weight rename; uses
-      create_using + edge_attr directly with 'weight' alias.
+  [6] No NetworkX graph: every stage reads one sparse TransactionMatrix
+      built straight from transactions.csv.
 """
 
 from __future__ import annotations
@@ -34,12 +37,18 @@ import warnings
 from collections import defaultdict
 from pathlib import Path
 
-import networkx as nx
 import numpy as np
 import pandas as pd
 import torch
 from torch_geometric.data import Data
 
+from communities import COMMUNITY_RESOLUTION, COMMUNITY_SEED, louvain, modularity, undirected_adjacency
+from graph_metrics import (
+    TransactionMatrix, load_vector, neighbour_fraud_rate, node_metrics, pagerank, save_vector,
+)
+from ring_engine import RingEnumerator
+from ring_pool import parallel_rings
+
 warnings.filterwarnings("ignore")
 logging.basicConfig(
     level=logging.INFO,
@@ -83,10 +92,14 @@ FEATURE_COLS: list[str] = [
     "second_hop_fraud_rate",# [20]  ← [FIX 2] was silently 0 in v2
 ]
 
-# Ring detection budget and limits
-RING_TIMEOUT_SEC = 25   # wall-clock seconds before giving up
-MAX_RING_SIZE    = 6    # only look for small rings (3–6 hops)
-MAX_RINGS_KEPT   = 300  # stop after collecting this many rings
+# Ring detection limits
+MAX_RING_SIZE    = 6        # only look for small rings (3–6 hops)
+MAX_RINGS        = 500_000  # enumeration budget — deterministic, smallest rings first
+MAX_RINGS_KEPT   = 300      # ring records returned (counts cover every ring enumerated)
+RING_WORKERS     = os.cpu_count() or 1   # enumeration processes (1 = in-process)
+
+# Previous run's PageRank vector, used as the next run's starting point
+PAGERANK_STATE = "pagerank_state.npz"
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -94,104 +107,70 @@ MAX_RINGS_KEPT   = 300  # stop after collecting this many rings
 # ──────────────────────────────────────────────────────────────────────────────
 
 def detect_rings(
-    G: nx.DiGraph,
+    tx: TransactionMatrix,
     account_nodes: set[str],
     max_ring_size: int = MAX_RING_SIZE,
-    timeout_sec: int   = RING_TIMEOUT_SEC,
+    max_rings: int     = MAX_RINGS,
+    workers: int       = RING_WORKERS,
 ) -> tuple[defaultdict, defaultdict, list]:
     """
-    Find short circular money flows using a BFS-depth-limited search.
-
-    WHY NOT nx.simple_cycles
-    ─────────────────────────
-    nx.simple_cycles uses Johnson's algorithm which enumerates ALL cycles.
-    On a dense graph with 34k edges it can run for hours.  SIGALRM-based
-    timeouts do not work on Windows (signal.SIGALRM does not exist), so the
-    previous code had no protection at all on Windows — it just hung forever.
-
-    APPROACH USED HERE
-    ──────────────────
-    For each node we run a depth-limited DFS up to max_ring_size hops.
-    If we reach a node we already visited and that node is the start node,
-    we found a ring.  We stop the moment we have MAX_RINGS_KEPT rings or
-    RING_TIMEOUT_SEC seconds have elapsed.  The timeout is checked via
-    time.monotonic() inside the loop — no OS signals needed, works on
-    Windows, macOS, and Linux identically.
-
-    This trades completeness for speed: we find the most common small rings
-    rather than every cycle.  For fraud detection this is the right trade-off
-    because we only need to flag ring-member nodes, not enumerate every ring.
+    Find short circular money flows (3 … max_ring_size accounts).
+
+    Enumeration is exact and reproducible — see ring_engine.py: the account
+    subgraph is split into strongly connected components and each cycle is
+    found once, from its lowest-index node, by a length-bounded DFS over the
+    CSR arrays of ``tx``.  Rings come out smallest first, so when the
+    ``max_rings`` budget stops the search every ring up to some size is
+    counted and the cut-off is the same on every machine.  Rings are
+    distinct node sets.  With ``workers`` > 1 the search is spread over a
+    process pool (ring_pool.py) and yields exactly the serial result.
 
     Returns
     -------
     ring_count  : dict[node_id → int]    rings each node participates in
     ring_volume : dict[node_id → float]  cumulative flow through its rings
-    rings_found : list[dict]             up to MAX_RINGS_KEPT ring records
+    rings_found : list[dict]             the first MAX_RINGS_KEPT ring records
     """
-    import time
-
-    logger.info("Detecting circular money flows (ring detection, BFS bounded)...")
+    logger.info("Detecting circular money flows (exact ring enumeration)...")
 
     # Work only on the account subgraph — location nodes create spurious cycles
-    sub = G.subgraph(
-        [n for n in G.nodes() if n in account_nodes]
-    ).copy()
+    adj    = tx.adjacency
+    mask   = np.fromiter((nid in account_nodes for nid in tx.ids), dtype=bool, count=tx.num_nodes)
+    engine = RingEnumerator(adj.indptr, adj.indices, adj.data, mask, max_len=max_ring_size)
 
     ring_count:  defaultdict[str, int]   = defaultdict(int)
     ring_volume: defaultdict[str, float] = defaultdict(float)
     rings_found: list[dict]              = []
-    seen_ring_sets: set[frozenset]       = set()  # deduplicate
+    by_size:     defaultdict[int, int]   = defaultdict(int)
 
-    deadline = time.monotonic() + timeout_sec
-    nodes_list = list(sub.nodes())
-    nodes_checked = 0
-
-    for start in nodes_list:
-        nodes_checked += 1
-        if time.monotonic() > deadline:
+    ids   = tx.ids
+    total = 0
+    for path, vol in parallel_rings(engine, max_rings + 1, workers):
+        if total >= max_rings:
             logger.warning(
-                "  Ring detection timed out after %ds — %d rings found",
-                timeout_sec, len(rings_found),
+                "  Ring budget (%d) reached in size-%d rings — smaller rings are complete",
+                max_rings, len(path),
             )
             break
-        if len(rings_found) >= MAX_RINGS_KEPT:
-            break
-
-        # DFS stack: (current_node, path_so_far)
-        stack = [(start, [start])]
-
-        while stack:
-            if time.monotonic() > deadline or len(rings_found) >= MAX_RINGS_KEPT:
-                break
-
-            node, path = stack.pop()
-
-            for neighbour in sub.successors(node):
-                if len(path) > max_ring_size:
-                    break
-
-                if neighbour == start and len(path) >= 3:
-                    # Found a ring — deduplicate by node set
-                    ring_key = frozenset(path)
-                    if ring_key not in seen_ring_sets:
-                        seen_ring_sets.add(ring_key)
-                        vol = sum(
-                            sub[path[i]][path[(i + 1) % len(path)]].get("weight", 0)
-                            for i in range(len(path))
-                        )
-                        rings_found.append({
-                            "nodes":  path[:],
-                            "size":   len(path),
-                            "volume": round(float(vol), 2),
-                        })
-                        for n in path:
-                            ring_count[n]  += 1
-                            ring_volume[n] += vol
-                elif neighbour not in path:
-                    stack.append((neighbour, path + [neighbour]))
-
-    logger.info("  %d rings detected (%d/%d nodes checked before deadline/cap)",
-                len(rings_found), nodes_checked, len(nodes_list))
+        total += 1
+        by_size[len(path)] += 1
+        nodes = [ids[i] for i in path]
+        if len(rings_found) < MAX_RINGS_KEPT:
+            rings_found.append({
+                "nodes":  nodes,
+                "size":   len(nodes),
+                "volume": round(float(vol), 2),
+            })
+        for n in nodes:
+            ring_count[n]  += 1
+            ring_volume[n] += vol
+
+    stats = engine.stats()
+    logger.info(
+        "  %d rings detected %s | %d ring-capable accounts in %d SCCs (largest %d)",
+        total, dict(sorted(by_size.items())), stats["ring_capable_nodes"],
+        stats["components"], stats["largest_component"],
+    )
     return ring_count, ring_volume, rings_found
 
 
@@ -200,47 +179,39 @@ def detect_rings(
 # ──────────────────────────────────────────────────────────────────────────────
 
 def detect_communities(
-    G: nx.DiGraph,
+    tx: TransactionMatrix,
     fraud_labels: dict[str, int],
+    resolution: float = COMMUNITY_RESOLUTION,
+    seed: int         = COMMUNITY_SEED,
 ) -> tuple[dict, dict]:
     """
-    Identify fraud clusters via greedy modularity maximisation.
+    Identify fraud clusters via multi-level Louvain modularity maximisation
+    (communities.py) on the undirected transaction graph.
 
     Returns
     -------
     community_fraud_rate : dict[node_id → float]  fraction of fraudsters in cluster
     community_id_map     : dict[node_id → int]    stable integer cluster index
+                                                  (0 = largest cluster)
     """
-    logger.info("Detecting fraud communities...")
-    G_undirected = G.to_undirected()
+    logger.info("Detecting fraud communities (Louvain)...")
+    adj    = undirected_adjacency(tx)
+    labels = louvain(adj, resolution=resolution, seed=seed)
 
-    try:
-        communities = list(
-            nx.community.greedy_modularity_communities(G_undirected)
-        )
-    except Exception:
-        logger.warning("  greedy_modularity_communities failed — falling back to connected components")
-        communities = list(nx.connected_components(G_undirected))
-
-    community_fraud_rate: dict[str, float] = {}
-    community_id_map:     dict[str, int]   = {}
-
-    for idx, comm in enumerate(communities):
-        comm_list = list(comm)
-        n_fraud   = sum(fraud_labels.get(n, 0) for n in comm_list)
-        rate      = n_fraud / len(comm_list) if comm_list else 0.0
-        for node in comm_list:
-            community_fraud_rate[node] = rate
-            community_id_map[node]     = idx
-
-    high_risk = sum(
-        1 for c in communities
-        if len(c) > 0
-        and sum(fraud_labels.get(n, 0) for n in c) / len(c) > 0.3
+    fraud = np.fromiter(
+        (fraud_labels.get(nid, 0) for nid in tx.ids), dtype=np.float64, count=tx.num_nodes,
     )
+    n_comm = int(labels.max()) + 1 if len(labels) else 0
+    sizes  = np.bincount(labels, minlength=n_comm)
+    rates  = np.bincount(labels, weights=fraud, minlength=n_comm) / np.maximum(sizes, 1)
+
+    community_fraud_rate: dict[str, float] = dict(zip(tx.ids, rates[labels].tolist()))
+    community_id_map:     dict[str, int]   = dict(zip(tx.ids, labels.tolist()))
+
+    high_risk = int((rates > 0.3).sum())
     logger.info(
-        "  %d communities | %d high-risk clusters (>30%% fraud)",
-        len(communities), high_risk,
+        "  %d communities | %d high-risk clusters (>30%% fraud) | modularity %.4f",
+        n_comm, high_risk, modularity(adj, labels, resolution),
     )
     return community_fraud_rate, community_id_map
 
@@ -250,33 +221,36 @@ def detect_communities(
 # ──────────────────────────────────────────────────────────────────────────────
 
 def compute_graph_metrics(
-    G: nx.DiGraph,
+    tx: TransactionMatrix,
     node_ids: list[str],
+    warm_start: Path | None = None,
 ) -> pd.DataFrame:
-    """Compute PageRank, in/out-amount ratio, and reciprocity per node."""
-    logger.info("Computing advanced graph metrics...")
-
-    pagerank = nx.pagerank(G, alpha=0.85, max_iter=200, weight="weight")
-
-    records = []
-    for nid in node_ids:
-        out_amt = sum(d.get("weight", 0.0) for _, _, d in G.out_edges(nid, data=True))
-        in_amt  = sum(d.get("weight", 0.0) for _, _, d in G.in_edges(nid,  data=True))
-        in_out  = in_amt / (out_amt + 1e-5)
+    """
+    Compute PageRank, in/out-amount ratio, and reciprocity per node, for all
+    nodes at once over the sparse adjacency ``tx``.
 
-        out_neighbors = set(G.successors(nid))
-        in_neighbors  = set(G.predecessors(nid))
-        reciprocal    = len(out_neighbors & in_neighbors)
-        recip_score   = reciprocal / (len(out_neighbors) + 1)
+    With ``warm_start``, PageRank starts from the vector saved there by the
+    previous run (when present) and saves this run's vector for the next.
+    """
+    logger.info("Computing advanced graph metrics...")
 
-        records.append({
-            "node_id":           nid,
-            "pagerank":          pagerank.get(nid, 0.0),
-            "in_out_ratio":      float(in_out),
-            "reciprocity_score": float(recip_score),
-        })
+    start = load_vector(warm_start, tx) if warm_start is not None else None
+    pr, iterations = pagerank(tx, alpha=0.85, max_iter=200, start=start)
+    logger.info(
+        "  PageRank converged in %d iterations (%s start)",
+        iterations, "warm" if start is not None else "cold",
+    )
+    if warm_start is not None:
+        save_vector(warm_start, tx, pr)
 
-    return pd.DataFrame(records)
+    metrics = node_metrics(tx)
+    rows    = tx.rows(node_ids)
+    return pd.DataFrame({
+        "node_id":           node_ids,
+        "pagerank":          pr[rows],
+        "in_out_ratio":      metrics["in_out_ratio"][rows],
+        "reciprocity_score": metrics["reciprocity_score"][rows],
+    })
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -308,34 +282,27 @@ def build_graph_data() -> Data:
     if len(df_nodes) == 0 or len(df_tx) == 0:
         raise ValueError("nodes.csv or transactions.csv is empty — run data_generator.py first")
 
-    # 2. Build directed NetworkX graph
+    # 2. Build the sparse directed transaction graph
     logger.info("Building directed transaction graph...")
     df_tx["amount"] = pd.to_numeric(df_tx["amount"], errors="coerce").fillna(1.0)
 
-    # Build with 'weight' as the edge attribute name directly
-    df_tx_renamed = df_tx.rename(columns={"amount": "weight"})
-    G = nx.from_pandas_edgelist(
-        df_tx_renamed,
-        source="source",
-        target="target",
-        edge_attr="weight",
-        create_using=nx.DiGraph(),
-    )
-    # Ensure all account nodes exist even if they had no transactions
-    G.add_nodes_from(df_nodes["node_id"])
+    # Every account is a node, even with no transactions
+    tx = TransactionMatrix.from_frame(df_tx, df_nodes["node_id"])
 
-    logger.info("  Graph: %s nodes | %s edges", f"{G.number_of_nodes():,}", f"{G.number_of_edges():,}")
+    logger.info("  Graph: %s nodes | %s edges", f"{tx.num_nodes:,}", f"{tx.num_edges:,}")
 
     # 3. [FIX 1] Ring detection restricted to account nodes
     account_nodes = set(df_nodes["node_id"].tolist())
-    ring_count, ring_volume, rings_found = detect_rings(G, account_nodes)
+    ring_count, ring_volume, rings_found = detect_rings(tx, account_nodes)
 
     # 4. Community detection
     fraud_labels = dict(zip(df_nodes["node_id"], df_nodes["is_fraud"]))
-    community_fraud_rate, community_id_map = detect_communities(G, fraud_labels)
+    community_fraud_rate, community_id_map = detect_communities(tx, fraud_labels)
 
     # 5. Graph metrics
-    graph_metrics_df = compute_graph_metrics(G, df_nodes["node_id"].tolist())
+    graph_metrics_df = compute_graph_metrics(
+        tx, df_nodes["node_id"].tolist(), warm_start=SHARED_DATA / PAGERANK_STATE,
+    )
 
     # 6. Merge all features back
     df_nodes = df_nodes.merge(graph_metrics_df, on="node_id", how="left")
@@ -350,14 +317,10 @@ def build_graph_data() -> Data:
     # otherwise compute from the graph here.
     if "second_hop_fraud_rate" not in df_nodes.columns:
         # Compute: fraction of direct graph neighbours that are fraudulent
-        fraud_set   = set(df_nodes.loc[df_nodes["is_fraud"] == 1, "node_id"])
-        shfr_values = {}
-        for nid in df_nodes["node_id"]:
-            neighbours = list(G.successors(nid)) + list(G.predecessors(nid))
-            if not neighbours:
-                shfr_values[nid] = 0.0
-            else:
-                shfr_values[nid] = sum(1 for n in neighbours if n in fraud_set) / len(neighbours)
+        fraud = np.fromiter(
+            (fraud_labels.get(nid, 0) == 1 for nid in tx.ids), dtype=bool, count=tx.num_nodes,
+        )
+        shfr_values = dict(zip(tx.ids, neighbour_fraud_rate(tx, fraud).tolist()))
         df_nodes["second_hop_fraud_rate"] = df_nodes["node_id"].map(shfr_values).fillna(0)
 
     # 7. Ensure every FEATURE_COL exists
@@ -464,12 +427,32 @@ def build_graph_data() -> Data:
         int(train_mask.sum()), int(val_mask.sum()), int(test_mask.sum()),
     )
     logger.info(
-        "  Rings detected: %d | Ring-member nodes: %d",
+        "  Ring records kept: %d | Ring-member nodes: %d",
         len(rings_found), len(ring_count),
     )
 
     return data
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# SERVING SNAPSHOT
+# ──────────────────────────────────────────────────────────────────────────────
+
+def compile_serving_snapshot() -> None:
+    """
+    The graph just changed, so any existing serving snapshot is stale.
+    Recompile it against the current model when there is one.
+    """
+    if not (SHARED_DATA / "mule_model.pth").exists():
+        logger.info("No trained model yet — serving snapshot is compiled by train_model.py")
+        return
+    try:
+        from inference_service import compile_serving_snapshot as _compile
+        _compile()
+    except Exception as exc:
+        logger.warning("Serving snapshot not compiled (%s) — the service will do a full build", exc)
+
+
 if __name__ == "__main__":
-    build_graph_data()
\ No newline at end of file
+    build_graph_data()
+    compile_serving_snapshot()
@@ -0,0 +1,791 @@
+"""
+MuleHunter AI  ·  Graph Index  ·  v1.0
+=======================================
+Compact array-backed adjacency for the serving path.
+
+The inference service used to answer degree / neighbour questions by scanning
+the full ``edge_index`` tensor (O(E) per request).  ``CSRAdjacency`` builds a
+CSR (out-edges) and CSC (in-edges) view of the same edge list once at startup
+so every per-node lookup is an O(degree) slice.
+
+Layout
+──────
+  out_offsets[i] : out_offsets[i + 1]   → slice of out_nbrs / out_weights
+  in_offsets[i]  : in_offsets[i + 1]    → slice of in_nbrs  / in_weights
+
+Neighbours are int32 node indices, weights are float32 transaction amounts.
+Offsets are int32 unless the graph has ≥ 2³¹ edges.  Within a node's slice
+edges keep their original ``edge_index`` order (stable sort), so neighbour
+lists come back in the same order NetworkX would report them.
+
+``LiveAdjacency`` layers the edges ingested while serving over an immutable
+``CSRAdjacency`` (a small sorted delta per direction, folded back in
+periodically), with the same lookup API and the same neighbour order.
+
+``ArrayDiGraph`` wraps a ``CSRAdjacency`` with an interned account-id table
+and is the service's transaction graph — the id-keyed lookups it needs
+(membership, successors, weighted in/out items, induced subgraphs) without
+NetworkX's per-edge dictionaries.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+from typing import Callable, Optional
+
+import numpy as np
+
+
+# Exposure versions are unique across every index, so a rebuilt index never
+# reuses a key that a cache still holds for an older one.
+_VERSIONS = itertools.count()
+
+
+def _offsets_dtype(num_edges: int) -> type:
+    return np.int32 if num_edges < np.iinfo(np.int32).max else np.int64
+
+
+def _compress(
+    keys:      np.ndarray,
+    values:    np.ndarray,
+    weights:   np.ndarray,
+    num_nodes: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Group ``values``/``weights`` by ``keys`` into (offsets, nbrs, weights)."""
+    order   = np.argsort(keys, kind="stable")
+    counts  = np.bincount(keys, minlength=num_nodes)
+    offsets = np.zeros(num_nodes + 1, dtype=_offsets_dtype(len(keys)))
+    np.cumsum(counts, out=offsets[1:])
+    return (
+        offsets,
+        np.ascontiguousarray(values[order], dtype=np.int32),
+        np.ascontiguousarray(weights[order], dtype=np.float32),
+    )
+
+
+class _Traversal:
+    """
+    Multi-node queries shared by ``CSRAdjacency`` and ``LiveAdjacency``,
+    written against their ``_in_segments`` / ``_out_segments`` gathers.
+    """
+
+    __slots__ = ()
+
+    def neighbours(self, idx: int) -> np.ndarray:
+        """Predecessors followed by successors (may contain repeats)."""
+        return np.concatenate((self.predecessors(idx), self.successors(idx)))
+
+    def in_edges(
+        self,
+        rows:   np.ndarray,
+        fanout: int = 0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(src, dst) of the in-edges of ``rows``, first ``fanout`` per node if > 0."""
+        rows     = np.asarray(rows, dtype=np.int64).reshape(-1)
+        src, seg = self._in_segments(rows, fanout)
+        return src.astype(np.int64), rows[seg]
+
+    def receptive_field(
+        self,
+        seeds:  np.ndarray | int,
+        depth:  int,
+        fanout: int = 0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Receptive field of ``seeds`` for a ``depth``-layer message-passing
+        model (messages flow along edge direction, i.e. over in-edges).
+
+        Returns (nodes, expanded): every node within ``depth`` in-hops, seeds
+        first, and the subset closer than ``depth`` whose in-edges the model
+        reads.  ``fanout > 0`` keeps only the first ``fanout`` in-edges of
+        each expanded node.
+        """
+        return _bfs(self._in_segments, seeds, depth, fanout)
+
+    def downstream(self, seeds: np.ndarray | int, depth: int) -> np.ndarray:
+        """
+        Every node within ``depth`` out-hops of ``seeds`` (seeds included) —
+        the nodes whose ``depth + 1``-layer embedding can change when the
+        in-edges of ``seeds`` change.
+        """
+        return _bfs(self._out_segments, seeds, depth)[0]
+
+
+class CSRAdjacency(_Traversal):
+    """
+    Directed adjacency over integer node indices ``0 .. num_nodes-1``.
+
+    Read-only after construction, so it is safe to share between the
+    FastAPI worker threads without locking.
+    """
+
+    __slots__ = (
+        "num_nodes", "num_edges",
+        "out_offsets", "out_nbrs", "out_weights",
+        "in_offsets",  "in_nbrs",  "in_weights",
+    )
+
+    def __init__(
+        self,
+        num_nodes:   int,
+        out_offsets: np.ndarray,
+        out_nbrs:    np.ndarray,
+        out_weights: np.ndarray,
+        in_offsets:  np.ndarray,
+        in_nbrs:     np.ndarray,
+        in_weights:  np.ndarray,
+    ) -> None:
+        self.num_nodes   = int(num_nodes)
+        self.num_edges   = int(len(out_nbrs))
+        self.out_offsets = out_offsets
+        self.out_nbrs    = out_nbrs
+        self.out_weights = out_weights
+        self.in_offsets  = in_offsets
+        self.in_nbrs     = in_nbrs
+        self.in_weights  = in_weights
+
+    @classmethod
+    def from_edge_index(
+        cls,
+        edge_index:  np.ndarray,
+        num_nodes:   int,
+        edge_weight: Optional[np.ndarray] = None,
+    ) -> "CSRAdjacency":
+        """
+        Build from a ``[2, E]`` integer edge array (PyG ``edge_index`` layout).
+
+        Duplicate edges are kept, so degrees match a raw count over
+        ``edge_index`` exactly.
+        """
+        edge_index = np.asarray(edge_index)
+        src = edge_index[0].astype(np.int64, copy=False)
+        dst = edge_index[1].astype(np.int64, copy=False)
+        if edge_weight is None:
+            weights = np.ones(len(src), dtype=np.float32)
+        else:
+            weights = np.asarray(edge_weight, dtype=np.float32).reshape(-1)
+
+        out_offsets, out_nbrs, out_weights = _compress(src, dst, weights, num_nodes)
+        in_offsets,  in_nbrs,  in_weights  = _compress(dst, src, weights, num_nodes)
+        return cls(
+            num_nodes,
+            out_offsets, out_nbrs, out_weights,
+            in_offsets,  in_nbrs,  in_weights,
+        )
+
+    # ── Per-node lookups (O(1) / O(degree)) ──────────────────────────────────
+
+    def out_degree(self, idx: int) -> int:
+        return int(self.out_offsets[idx + 1] - self.out_offsets[idx])
+
+    def in_degree(self, idx: int) -> int:
+        return int(self.in_offsets[idx + 1] - self.in_offsets[idx])
+
+    def successors(self, idx: int) -> np.ndarray:
+        return self.out_nbrs[self.out_offsets[idx]:self.out_offsets[idx + 1]]
+
+    def predecessors(self, idx: int) -> np.ndarray:
+        return self.in_nbrs[self.in_offsets[idx]:self.in_offsets[idx + 1]]
+
+    def successor_weights(self, idx: int) -> np.ndarray:
+        return self.out_weights[self.out_offsets[idx]:self.out_offsets[idx + 1]]
+
+    def predecessor_weights(self, idx: int) -> np.ndarray:
+        return self.in_weights[self.in_offsets[idx]:self.in_offsets[idx + 1]]
+
+    # ── Segment gathers ──────────────────────────────────────────────────────
+
+    def _in_segments(self, rows: np.ndarray, limit: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        return _gather_segments(self.in_offsets, self.in_nbrs, rows, limit)
+
+    def _out_segments(self, rows: np.ndarray, limit: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        return _gather_segments(self.out_offsets, self.out_nbrs, rows, limit)
+
+    # ── Whole-graph views ────────────────────────────────────────────────────
+
+    def out_degrees(self) -> np.ndarray:
+        return np.diff(self.out_offsets)
+
+    def in_degrees(self) -> np.ndarray:
+        return np.diff(self.in_offsets)
+
+    def nbytes(self) -> int:
+        return sum(
+            getattr(self, name).nbytes
+            for name in self.__slots__
+            if isinstance(getattr(self, name), np.ndarray)
+        )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# LIVE ADJACENCY
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _Delta:
+    """
+    Edges appended to one direction of a CSR, sorted by key (source for
+    out-edges, target for in-edges) and by arrival within a key.
+    """
+
+    __slots__ = ("keys", "nbrs", "weights")
+
+    def __init__(self, keys: np.ndarray, nbrs: np.ndarray, weights: np.ndarray) -> None:
+        self.keys    = keys
+        self.nbrs    = nbrs
+        self.weights = weights
+
+    @classmethod
+    def empty(cls) -> "_Delta":
+        return cls(np.zeros(0, np.int64), np.zeros(0, np.int32), np.zeros(0, np.float32))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def appended(self, keys: np.ndarray, nbrs: np.ndarray, weights: np.ndarray) -> "_Delta":
+        """New delta with these edges after every existing edge of the same key."""
+        order = np.argsort(keys, kind="stable")
+        keys  = keys[order]
+        at    = np.searchsorted(self.keys, keys, side="right")
+        return _Delta(
+            np.insert(self.keys, at, keys),
+            np.insert(self.nbrs, at, nbrs[order].astype(np.int32)),
+            np.insert(self.weights, at, weights[order].astype(np.float32)),
+        )
+
+    def span(self, idx: int) -> slice:
+        return slice(
+            int(np.searchsorted(self.keys, idx, side="left")),
+            int(np.searchsorted(self.keys, idx, side="right")),
+        )
+
+    def ranges(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        starts = np.searchsorted(self.keys, rows, side="left")
+        return starts, np.searchsorted(self.keys, rows, side="right") - starts
+
+    def counts(self, num_nodes: int) -> np.ndarray:
+        return np.bincount(self.keys, minlength=num_nodes)
+
+
+def _merged_segments(
+    offsets: np.ndarray,
+    values:  np.ndarray,
+    delta:   _Delta,
+    rows:    np.ndarray,
+    limit:   int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """``_gather_segments`` over a CSR direction plus its delta: base values first per row."""
+    base, seg = _gather_segments(offsets, values, rows, limit)
+    if not len(delta):
+        return base, seg
+    starts, lens = delta.ranges(rows)
+    if limit > 0:
+        room = limit - (offsets[rows + 1].astype(np.int64) - offsets[rows])
+        lens = np.minimum(lens, np.maximum(room, 0))
+    extra, extra_seg = _gather_ranges(delta.nbrs, starts, lens)
+    if not len(extra):
+        return base, seg
+    seg   = np.concatenate((seg, extra_seg))
+    order = np.argsort(seg, kind="stable")
+    return np.concatenate((base, extra))[order], seg[order]
+
+
+def _splice(
+    offsets: np.ndarray,
+    values:  np.ndarray,
+    weights: np.ndarray,
+    delta:   _Delta,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fold ``delta`` into one CSR direction in O(E): each key's edges go after its base slice."""
+    n         = len(offsets) - 1
+    base_len  = np.diff(offsets).astype(np.int64)
+    total     = len(values) + len(delta)
+    merged    = np.zeros(n + 1, dtype=_offsets_dtype(total))
+    np.cumsum(base_len + delta.counts(n), out=merged[1:])
+    starts    = merged[:-1].astype(np.int64)
+
+    base_pos  = np.arange(len(values), dtype=np.int64) - np.repeat(offsets[:-1].astype(np.int64), base_len)
+    base_pos += np.repeat(starts, base_len)
+    rank      = np.arange(len(delta), dtype=np.int64) - np.searchsorted(delta.keys, delta.keys, side="left")
+    delta_pos = starts[delta.keys] + base_len[delta.keys] + rank
+
+    out_values  = np.empty(total, dtype=np.int32)
+    out_weights = np.empty(total, dtype=np.float32)
+    out_values[base_pos],  out_values[delta_pos]  = values,  delta.nbrs
+    out_weights[base_pos], out_weights[delta_pos] = weights, delta.weights
+    return merged, out_values, out_weights
+
+
+class LiveAdjacency(_Traversal):
+    """
+    A ``CSRAdjacency`` plus the edges appended to it since it was built —
+    the serving graph between live ingestion and the next rebuild.
+
+    The base arrays are never written.  Appended edges sit in a small delta
+    per direction and every lookup merges the two: a node's base edges
+    first, then its appended ones in arrival order, which is exactly what a
+    CSR rebuilt over the extended edge list would return.  ``with_edges``
+    returns a new instance (the delta is copied, the base shared), so a
+    reader holding the old one never sees a half-applied batch; ``merged``
+    folds the delta back into a plain CSR in O(E).
+    """
+
+    __slots__ = ("base", "num_nodes", "num_edges", "_out", "_in")
+
+    def __init__(
+        self,
+        base:  CSRAdjacency,
+        out:   Optional[_Delta] = None,
+        in_:   Optional[_Delta] = None,
+    ) -> None:
+        self.base      = base
+        self._out      = out if out is not None else _Delta.empty()
+        self._in       = in_ if in_ is not None else _Delta.empty()
+        self.num_nodes = base.num_nodes
+        self.num_edges = base.num_edges + len(self._out)
+
+    @property
+    def delta_edges(self) -> int:
+        return len(self._out)
+
+    def with_edges(
+        self,
+        src:     np.ndarray,
+        dst:     np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ) -> "LiveAdjacency":
+        """New adjacency with edges ``src → dst`` appended (duplicates kept)."""
+        src = np.asarray(src, dtype=np.int64).reshape(-1)
+        dst = np.asarray(dst, dtype=np.int64).reshape(-1)
+        w   = (
+            np.ones(len(src), dtype=np.float32) if weights is None
+            else np.asarray(weights, dtype=np.float32).reshape(-1)
+        )
+        return LiveAdjacency(self.base, self._out.appended(src, dst, w), self._in.appended(dst, src, w))
+
+    def merged(self) -> CSRAdjacency:
+        """The same graph as one plain CSR (what ``from_edge_index`` would build)."""
+        if not len(self._out):
+            return self.base
+        b = self.base
+        return CSRAdjacency(
+            self.num_nodes,
+            *_splice(b.out_offsets, b.out_nbrs, b.out_weights, self._out),
+            *_splice(b.in_offsets,  b.in_nbrs,  b.in_weights,  self._in),
+        )
+
+    # ── Per-node lookups (O(degree + log delta)) ─────────────────────────────
+
+    def out_degree(self, idx: int) -> int:
+        span = self._out.span(idx)
+        return self.base.out_degree(idx) + span.stop - span.start
+
+    def in_degree(self, idx: int) -> int:
+        span = self._in.span(idx)
+        return self.base.in_degree(idx) + span.stop - span.start
+
+    def successors(self, idx: int) -> np.ndarray:
+        return _joined(self.base.successors(idx), self._out.nbrs[self._out.span(idx)])
+
+    def predecessors(self, idx: int) -> np.ndarray:
+        return _joined(self.base.predecessors(idx), self._in.nbrs[self._in.span(idx)])
+
+    def successor_weights(self, idx: int) -> np.ndarray:
+        return _joined(self.base.successor_weights(idx), self._out.weights[self._out.span(idx)])
+
+    def predecessor_weights(self, idx: int) -> np.ndarray:
+        return _joined(self.base.predecessor_weights(idx), self._in.weights[self._in.span(idx)])
+
+    # ── Segment gathers ──────────────────────────────────────────────────────
+
+    def _in_segments(self, rows: np.ndarray, limit: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        return _merged_segments(self.base.in_offsets, self.base.in_nbrs, self._in, rows, limit)
+
+    def _out_segments(self, rows: np.ndarray, limit: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        return _merged_segments(self.base.out_offsets, self.base.out_nbrs, self._out, rows, limit)
+
+    # ── Whole-graph views ────────────────────────────────────────────────────
+
+    def out_degrees(self) -> np.ndarray:
+        return self.base.out_degrees() + self._out.counts(self.num_nodes)
+
+    def in_degrees(self) -> np.ndarray:
+        return self.base.in_degrees() + self._in.counts(self.num_nodes)
+
+    def nbytes(self) -> int:
+        return self.base.nbytes() + sum(
+            arr.nbytes for d in (self._out, self._in) for arr in (d.keys, d.nbrs, d.weights)
+        )
+
+
+def _joined(base: np.ndarray, extra: np.ndarray) -> np.ndarray:
+    return np.concatenate((base, extra)) if len(extra) else base
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# ID-KEYED GRAPH
+# ──────────────────────────────────────────────────────────────────────────────
+
+class ArrayDiGraph:
+    """
+    Directed transaction graph keyed by account-id strings — the serving
+    replacement for ``nx.DiGraph``.
+
+    Ids are interned once (``ids[i]`` ↔ ``index[id]``) and the topology is a
+    ``CSRAdjacency`` over those indices: int32 neighbours, float32 weights,
+    ~16 bytes per edge for both directions against several hundred for
+    NetworkX's dict-of-dicts.
+
+    ``from_edges`` follows ``nx.from_pandas_edgelist`` semantics — one edge
+    per (u, v), the last weight wins — and keeps NetworkX's iteration order:
+    nodes in order of first appearance, each node's successors and
+    predecessors in order of first occurrence of the edge.
+    """
+
+    __slots__ = ("ids", "index", "adj")
+
+    def __init__(self, ids: list[str], adj: CSRAdjacency) -> None:
+        if len(ids) != adj.num_nodes:
+            raise ValueError(f"{len(ids)} ids for {adj.num_nodes} nodes")
+        self.ids   = ids
+        self.index = {nid: i for i, nid in enumerate(ids)}
+        self.adj   = adj
+
+    @classmethod
+    def from_edges(
+        cls,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ) -> "ArrayDiGraph":
+        src_l = np.asarray(sources, dtype=str)
+        dst_l = np.asarray(targets, dtype=str)
+        m     = len(src_l)
+        if weights is None:
+            weights = np.ones(m, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+
+        # Intern in first-appearance order (u before v within a row)
+        labels = np.empty(2 * m, dtype=np.result_type(src_l, dst_l))
+        labels[0::2], labels[1::2] = src_l, dst_l
+        uniq, first, inv = np.unique(labels, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        rank  = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        codes = rank[inv.reshape(-1)]
+        n     = len(uniq)
+
+        # One edge per (u, v): position of its first occurrence, last weight
+        key = codes[0::2] * n + codes[1::2]
+        uk, first_pos = np.unique(key, return_index=True)
+        _, last_rev   = np.unique(key[::-1], return_index=True)
+        keep = np.argsort(first_pos, kind="stable")
+        uk   = uk[keep]
+        w    = weights[(m - 1 - last_rev)[keep]]
+
+        adj = CSRAdjacency.from_edge_index(np.stack((uk // n, uk % n)), n, w)
+        return cls(uniq[order].tolist(), adj)
+
+    # ── Size / membership ────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.index
+
+    def number_of_nodes(self) -> int:
+        return len(self.ids)
+
+    def number_of_edges(self) -> int:
+        return self.adj.num_edges
+
+    # ── Per-id lookups ───────────────────────────────────────────────────────
+
+    def successors(self, node_id: str) -> list[str]:
+        i = self.index.get(node_id)
+        return [] if i is None else [self.ids[j] for j in self.adj.successors(i).tolist()]
+
+    def predecessors(self, node_id: str) -> list[str]:
+        i = self.index.get(node_id)
+        return [] if i is None else [self.ids[j] for j in self.adj.predecessors(i).tolist()]
+
+    def out_items(self, node_id: str) -> list[tuple[str, float]]:
+        """(successor id, weight) pairs."""
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        return [
+            (self.ids[j], w) for j, w in zip(
+                self.adj.successors(i).tolist(), self.adj.successor_weights(i).tolist(),
+            )
+        ]
+
+    def in_items(self, node_id: str) -> list[tuple[str, float]]:
+        """(predecessor id, weight) pairs."""
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        return [
+            (self.ids[j], w) for j, w in zip(
+                self.adj.predecessors(i).tolist(), self.adj.predecessor_weights(i).tolist(),
+            )
+        ]
+
+    # ── Index-level helpers ──────────────────────────────────────────────────
+
+    def mask_of(self, node_ids) -> np.ndarray:
+        """Boolean mask over node indices for the given ids (unknown ids ignored)."""
+        mask = np.zeros(len(self.ids), dtype=bool)
+        idx  = [self.index[n] for n in node_ids if n in self.index]
+        mask[idx] = True
+        return mask
+
+    def weight(self, u: int, v: int) -> float:
+        """Weight of edge u → v (node indices); 0.0 if absent."""
+        hit = np.flatnonzero(self.adj.successors(u) == v)
+        return float(self.adj.successor_weights(u)[hit[0]]) if len(hit) else 0.0
+
+    def induced_successors(self, nodes: list[int]) -> list[list[int]]:
+        """
+        Adjacency of the subgraph induced by ``nodes``, in local positions:
+        ``out[k]`` lists the positions of ``nodes[k]``'s successors inside it.
+        """
+        pos = {u: k for k, u in enumerate(nodes)}
+        return [
+            [pos[v] for v in self.adj.successors(u).tolist() if v in pos]
+            for u in nodes
+        ]
+
+    def edges_within(
+        self,
+        mask:  np.ndarray,
+        limit: int = 0,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (src, dst, weight) of every edge with both ends in ``mask``, in
+        NetworkX ``edges()`` order; at most ``limit`` edges when > 0.
+        """
+        src = np.repeat(np.arange(len(self.ids), dtype=np.int64), self.adj.out_degrees())
+        dst = self.adj.out_nbrs
+        hit = np.flatnonzero(mask[src] & mask[dst])
+        if limit > 0:
+            hit = hit[:limit]
+        return src[hit], dst[hit].astype(np.int64), self.adj.out_weights[hit]
+
+    def nbytes(self) -> int:
+        return self.adj.nbytes()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# FRAUD EXPOSURE
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _gather_segments(
+    offsets: np.ndarray,
+    values:  np.ndarray,
+    rows:    np.ndarray,
+    limit:   int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate ``values[offsets[r]:offsets[r+1]]`` for every r in ``rows``
+    (at most the first ``limit`` values of each segment when ``limit > 0``).
+
+    Returns (gathered values, position in ``rows`` each value came from),
+    without a Python loop.
+    """
+    starts = offsets[rows].astype(np.int64)
+    lens   = offsets[rows + 1].astype(np.int64) - starts
+    if limit > 0:
+        lens = np.minimum(lens, limit)
+    return _gather_ranges(values, starts, lens)
+
+
+def _gather_ranges(
+    values: np.ndarray,
+    starts: np.ndarray,
+    lens:   np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """``values[starts[k]:starts[k] + lens[k]]`` for every k, concatenated, plus k per value."""
+    total = int(lens.sum())
+    seg   = np.repeat(np.arange(len(lens), dtype=np.int64), lens)
+    if total == 0:
+        return values[:0], seg
+    pos = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(lens) - lens, lens)
+    return values[pos + np.repeat(starts, lens)], seg
+
+
+def _bfs(
+    gather: Callable[[np.ndarray, int], tuple[np.ndarray, np.ndarray]],
+    seeds:  np.ndarray | int,
+    depth:  int,
+    fanout: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Level-synchronous BFS → (visited nodes, nodes whose edges were followed)."""
+    frontier = np.unique(np.asarray(seeds, dtype=np.int64).reshape(-1))
+    nodes    = frontier
+    expanded = []
+    for _ in range(depth):
+        if not len(frontier):
+            break
+        expanded.append(frontier)
+        reached, _ = gather(frontier, fanout)
+        frontier   = np.setdiff1d(reached.astype(np.int64), nodes)
+        nodes      = np.concatenate((nodes, frontier))
+    return nodes, (np.concatenate(expanded) if expanded else nodes[:0])
+
+
+class FraudExposureIndex:
+    """
+    Labelled-fraud exposure of each node, built once from a boolean fraud
+    mask aligned with node indices.
+
+      fraud_successors[i]  distinct successors of i that are fraud
+                           (the live ``suspiciousNeighbors`` count)
+      fraud_neighbours[i]  distinct in ∪ out neighbours of i that are fraud
+
+    Both are O(E) to precompute and O(1) to read.  Two-hop exposure depends
+    on the neighbours' neighbourhoods, so it is computed on demand over a
+    distinct-neighbour (undirected) CSR — still array-only, and batched.
+
+    Ingested edges go through ``with_edges``: the counts of the nodes they
+    touch are overridden and new undirected pairs go into a delta, so the
+    base arrays are never rebuilt or written.  ``version(i)`` changes
+    whenever node i's exposure may have, which is what caches key on.
+    """
+
+    __slots__ = (
+        "mask", "fraud_successors", "fraud_neighbours",
+        "und_offsets", "und_nbrs", "und_delta", "_counts", "_versions", "_built",
+    )
+
+    def __init__(self, adj: CSRAdjacency, fraud_mask: np.ndarray) -> None:
+        n    = adj.num_nodes
+        mask = np.asarray(fraud_mask, dtype=bool).reshape(-1)
+        if len(mask) != n:
+            raise ValueError(f"fraud mask has {len(mask)} entries for {n} nodes")
+        self.mask = mask
+
+        src = np.repeat(np.arange(n, dtype=np.int64), adj.out_degrees())
+        dst = adj.out_nbrs.astype(np.int64)
+
+        # Distinct directed pairs → fraud successors
+        directed = np.unique(src * n + dst)
+        self.fraud_successors = np.bincount(
+            directed // n, weights=mask[directed % n], minlength=n,
+        ).astype(np.int32)
+
+        # Distinct undirected pairs (self-loops dropped) → neighbour CSR
+        keep = src != dst
+        both = np.concatenate((src[keep] * n + dst[keep], dst[keep] * n + src[keep]))
+        und  = np.unique(both)
+        und_src = und // n
+        self.und_nbrs    = (und % n).astype(np.int32)
+        self.und_offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(und_src, minlength=n), out=self.und_offsets[1:])
+        self.fraud_neighbours = np.bincount(
+            und_src, weights=mask[self.und_nbrs], minlength=n,
+        ).astype(np.int32)
+
+        self.und_delta = _Delta.empty()
+        self._counts: dict[int, tuple[int, int]] = {}   # node → (successors, neighbours) after ingest
+        self._versions: dict[int, int] = {}
+        self._built = next(_VERSIONS)
+
+    def version(self, idx: int) -> int:
+        return self._versions.get(idx, self._built)
+
+    def with_edges(
+        self,
+        adj: CSRAdjacency | LiveAdjacency,
+        src: np.ndarray,
+        dst: np.ndarray,
+    ) -> "FraudExposureIndex":
+        """
+        A new index that also counts the edges ``src → dst``, where ``adj``
+        is the adjacency before they were appended.  Work is per edge plus
+        the endpoints' neighbourhoods; the base arrays are shared.
+        """
+        mask    = self.mask
+        counts  = dict(self._counts)
+        seen:    set[tuple[int, int]] = set()
+        touched: set[int]             = set()
+        pairs:   list[tuple[int, int]] = []
+
+        def _count(i: int) -> tuple[int, int]:
+            return counts.get(i) or (int(self.fraud_successors[i]), int(self.fraud_neighbours[i]))
+
+        for u, v in zip(np.asarray(src).tolist(), np.asarray(dst).tolist()):
+            if (u, v) in seen or (adj.successors(u) == v).any():
+                continue                                   # not a new distinct pair
+            seen.add((u, v))
+            succ, nbr = _count(u)
+            counts[u] = (succ + int(mask[v]), nbr)
+            touched.add(u)
+            if u == v or (v, u) in seen or (adj.predecessors(u) == v).any():
+                continue                                   # already undirected neighbours
+            counts[u] = (counts[u][0], counts[u][1] + int(mask[v]))
+            succ, nbr = _count(v)
+            counts[v] = (succ, nbr + int(mask[u]))
+            touched.add(v)
+            pairs.extend(((u, v), (v, u)))
+
+        out = copy.copy(self)
+        out._counts = counts
+        if pairs:
+            ends = np.array(pairs, dtype=np.int64)
+            out.und_delta = self.und_delta.appended(ends[:, 0], ends[:, 1], np.zeros(len(ends)))
+        if touched:
+            # Two-hop sets change for the endpoints and their neighbours
+            rows = np.fromiter(touched, dtype=np.int64, count=len(touched))
+            near, _ = out._und_segments(rows)
+            stamp = next(_VERSIONS)
+            out._versions = dict(self._versions)
+            out._versions.update(dict.fromkeys(np.union1d(rows, near).tolist(), stamp))
+        return out
+
+    def _und_segments(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return _merged_segments(self.und_offsets, self.und_nbrs, self.und_delta, rows)
+
+    def two_hop(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        For each node in ``rows``: (# distinct nodes exactly two hops away,
+        # of those that are fraud).  Direction is ignored, the node itself
+        and its direct neighbours are excluded.
+        """
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        b    = len(rows)
+        n    = len(self.mask)
+        if b == 0:
+            return np.zeros(0, np.int64), np.zeros(0, np.int64)
+
+        hop1, seg1 = self._und_segments(rows)
+        hop2, via  = self._und_segments(hop1.astype(np.int64))
+        seg2 = seg1[via]
+
+        keys2   = np.unique(seg2 * n + hop2)
+        exclude = np.concatenate((seg1 * n + hop1, np.arange(b, dtype=np.int64) * n + rows))
+        keys2   = keys2[~np.isin(keys2, exclude)]
+
+        seg   = keys2 // n
+        total = np.bincount(seg, minlength=b)
+        fraud = np.bincount(seg, weights=self.mask[keys2 % n], minlength=b).astype(np.int64)
+        return total, fraud
+
+    def exposure(self, rows: np.ndarray) -> dict[str, np.ndarray]:
+        """Vectorised exposure for a batch of node indices."""
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        two_total, two_fraud = self.two_hop(rows)
+        successors = self.fraud_successors[rows]
+        neighbours = self.fraud_neighbours[rows]
+        if self._counts:
+            successors, neighbours = successors.copy(), neighbours.copy()
+            for k, i in enumerate(rows.tolist()):
+                if i in self._counts:
+                    successors[k], neighbours[k] = self._counts[i]
+        return {
+            "fraud_successors": successors,
+            "fraud_neighbours": neighbours,
+            "two_hop_total":    two_total,
+            "two_hop_fraud":    two_fraud,
+        }
@@ -0,0 +1,249 @@
+"""
+MuleHunter AI  ·  Graph Metrics  ·  v1.0
+=========================================
+Vectorised per-node graph metrics for the offline feature pipeline.
+
+``compute_graph_metrics`` used to walk every node of the NetworkX graph in
+Python — summing ``out_edges`` / ``in_edges`` amounts and intersecting
+successor and predecessor sets.  ``TransactionMatrix`` holds the same graph
+as one weighted ``scipy.sparse`` adjacency built straight from the
+transactions frame, and every metric is a handful of array operations over
+all nodes at once:
+
+  · out / in amount     row / column sums of A
+  · out / in degree     stored entries per row / column of A
+  · reciprocal links    stored entries per row of  pattern(A) ∘ pattern(A)ᵀ
+  · neighbour fraud     pattern(A) f + pattern(A)ᵀ f  over the fraud mask f
+
+It follows ``nx.from_pandas_edgelist(..., create_using=nx.DiGraph())``
+semantics exactly: one edge per (u, v) with the last row's amount, nodes
+in order of first appearance (source before target within a row) followed
+by any extra ``node_ids``.  Amounts are float64 and summed in NetworkX's
+edge order (first occurrence of each edge), so the derived columns are
+bit-for-bit what the per-node loop produced.
+
+``pagerank`` is ``nx.pagerank`` (uniform teleport, dangling mass spread
+uniformly, the same L1 stopping rule) as a power iteration over the CSR
+transition matrix.  It can start from a previous run's vector
+(``load_vector`` / ``save_vector``): on a graph that changed a little
+overnight it converges in a handful of iterations instead of dozens.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+PAGERANK_ALPHA    = 0.85
+PAGERANK_MAX_ITER = 200
+PAGERANK_TOL      = 1e-6
+
+
+class TransactionMatrix:
+    """
+    Weighted directed transaction graph over integer node indices.
+
+    ``src`` / ``dst`` / ``weight`` list the distinct edges in order of first
+    occurrence; ``ids[i]`` ↔ ``index[id]`` map indices to account ids.
+    """
+
+    __slots__ = ("ids", "index", "src", "dst", "weight", "_adj", "_pattern")
+
+    def __init__(self, ids: list[str], src: np.ndarray, dst: np.ndarray, weight: np.ndarray) -> None:
+        self.ids    = ids
+        self.index  = {nid: i for i, nid in enumerate(ids)}
+        self.src    = src
+        self.dst    = dst
+        self.weight = weight
+        self._adj:     Optional[sp.csr_matrix] = None
+        self._pattern: Optional[sp.csr_matrix] = None
+
+    @classmethod
+    def from_frame(
+        cls,
+        df_tx:    pd.DataFrame,
+        node_ids: Iterable[str] = (),
+        source:   str = "source",
+        target:   str = "target",
+        weight:   str = "amount",
+    ) -> "TransactionMatrix":
+        src_l = df_tx[source].to_numpy(dtype=object)
+        dst_l = df_tx[target].to_numpy(dtype=object)
+        w_l   = df_tx[weight].to_numpy(dtype=np.float64)
+        m     = len(src_l)
+
+        # Intern in first-appearance order (u before v within a row)
+        labels = np.empty(2 * m, dtype=object)
+        labels[0::2], labels[1::2] = src_l, dst_l
+        codes, uniq = pd.factorize(labels)
+        ids   = uniq.tolist()
+        known = set(ids)
+        for nid in node_ids:
+            if nid not in known:
+                known.add(nid)
+                ids.append(nid)
+        n = len(ids)
+
+        # One edge per (u, v): position of its first occurrence, last weight
+        key = codes[0::2].astype(np.int64) * n + codes[1::2]
+        uk, first_pos = np.unique(key, return_index=True)
+        _, last_rev   = np.unique(key[::-1], return_index=True)
+        keep = np.argsort(first_pos, kind="stable")
+        uk   = uk[keep]
+        return cls(ids, uk // n, uk % n, w_l[(m - 1 - last_rev)[keep]])
+
+    # ── Matrices ─────────────────────────────────────────────────────────────
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src)
+
+    @property
+    def adjacency(self) -> sp.csr_matrix:
+        """A[u, v] = amount of the u → v edge."""
+        if self._adj is None:
+            n = self.num_nodes
+            self._adj = sp.csr_matrix((self.weight, (self.src, self.dst)), shape=(n, n))
+        return self._adj
+
+    @property
+    def pattern(self) -> sp.csr_matrix:
+        """Structure of A (1 per edge, zero-amount edges included)."""
+        if self._pattern is None:
+            n = self.num_nodes
+            self._pattern = sp.csr_matrix(
+                (np.ones(self.num_edges, dtype=np.int8), (self.src, self.dst)), shape=(n, n),
+            )
+        return self._pattern
+
+    # ── Per-node metrics (arrays indexed like ``ids``) ───────────────────────
+
+    def out_degree(self) -> np.ndarray:
+        return self.pattern.getnnz(axis=1)
+
+    def in_degree(self) -> np.ndarray:
+        return self.pattern.getnnz(axis=0)
+
+    def out_amount(self) -> np.ndarray:
+        # Row sums of A, accumulated in edge order like NetworkX's per-node sum
+        return np.bincount(self.src, weights=self.weight, minlength=self.num_nodes)
+
+    def in_amount(self) -> np.ndarray:
+        return np.bincount(self.dst, weights=self.weight, minlength=self.num_nodes)
+
+    def reciprocal_count(self) -> np.ndarray:
+        """|successors ∩ predecessors| per node (a self-loop counts once)."""
+        pat = self.pattern
+        return pat.multiply(pat.T.tocsr()).getnnz(axis=1)
+
+    def rows(self, node_ids: Iterable[str]) -> np.ndarray:
+        index = self.index
+        return np.fromiter((index[nid] for nid in node_ids), dtype=np.int64)
+
+
+def node_metrics(tx: TransactionMatrix) -> dict[str, np.ndarray]:
+    """
+    ``in_out_ratio`` and ``reciprocity_score`` for every node, plus the
+    degree and amount totals they are derived from.
+    """
+    out_amt = tx.out_amount()
+    in_amt  = tx.in_amount()
+    out_deg = tx.out_degree()
+    return {
+        "out_amount":        out_amt,
+        "in_amount":         in_amt,
+        "out_degree":        out_deg,
+        "in_degree":         tx.in_degree(),
+        "in_out_ratio":      in_amt / (out_amt + 1e-5),
+        "reciprocity_score": tx.reciprocal_count() / (out_deg + 1),
+    }
+
+
+def neighbour_fraud_rate(tx: TransactionMatrix, fraud: np.ndarray) -> np.ndarray:
+    """
+    Fraction of each node's successors plus predecessors flagged in the
+    boolean ``fraud`` mask (a two-way link counts once per direction, as
+    ``successors + predecessors`` did); 0.0 for isolated nodes.
+    """
+    flags = np.asarray(fraud, dtype=np.float64)
+    pat   = tx.pattern.astype(np.float64)
+    links = tx.out_degree() + tx.in_degree()
+    hits  = pat @ flags + pat.T @ flags
+    return np.divide(hits, links, out=np.zeros(tx.num_nodes), where=links > 0)
+
+
+def pagerank(
+    tx:       TransactionMatrix,
+    alpha:    float = PAGERANK_ALPHA,
+    max_iter: int   = PAGERANK_MAX_ITER,
+    tol:      float = PAGERANK_TOL,
+    start:    Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, int]:
+    """
+    (PageRank by node index, iterations).  Edge amounts are the weights.
+
+    ``start`` is an initial vector aligned with ``tx.ids`` — NaN for nodes it
+    does not cover, which start at 1/N — renormalised to sum 1.  Stops once
+    the L1 change between iterations is below ``N * tol``, as NetworkX does,
+    so results agree with ``nx.pagerank`` to within that tolerance.
+    Raises RuntimeError after ``max_iter`` iterations without converging.
+    """
+    n = tx.num_nodes
+    if n == 0:
+        return np.zeros(0), 0
+
+    A      = tx.adjacency
+    out_w  = np.asarray(A.sum(axis=1)).ravel()
+    linked = out_w != 0
+    inv    = np.zeros(n)
+    inv[linked] = 1.0 / out_w[linked]
+    trans_t  = (sp.diags(inv) @ A).T.tocsr()     # x @ P  ==  Pᵀ @ x
+    dangling = np.flatnonzero(~linked)
+
+    if start is None:
+        x = np.full(n, 1.0 / n)
+    else:
+        x = np.where(np.isnan(start), 1.0 / n, np.asarray(start, dtype=np.float64))
+        total = x.sum()
+        x = x / total if total > 0 else np.full(n, 1.0 / n)
+
+    teleport = (1.0 - alpha) / n
+    for it in range(1, max_iter + 1):
+        x_last = x
+        x = alpha * (trans_t @ x_last + x_last[dangling].sum() / n) + teleport
+        if np.abs(x - x_last).sum() < n * tol:
+            return x, it
+    raise RuntimeError(f"PageRank did not converge in {max_iter} iterations")
+
+
+def save_vector(path: Path, tx: TransactionMatrix, values: np.ndarray) -> None:
+    """Store a per-node vector keyed by account id (e.g. PageRank for the next warm start)."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, ids=np.asarray(tx.ids, dtype=str), values=np.asarray(values, dtype=np.float64))
+    tmp.replace(path)
+
+
+def load_vector(path: Path, tx: TransactionMatrix) -> Optional[np.ndarray]:
+    """
+    A ``save_vector`` file realigned to ``tx.ids`` (NaN for accounts it does
+    not cover), or None when there is no usable file.
+    """
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as saved:
+            values = pd.Series(saved["values"], index=pd.Index(saved["ids"].astype(object)))
+    except (OSError, ValueError, KeyError):
+        return None
+    if not values.index.is_unique:
+        return None
+    return values.reindex(pd.Index(tx.ids, dtype=object)).to_numpy(dtype=np.float64)
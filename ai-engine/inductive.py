@@ -0,0 +1,272 @@
+"""
+MuleHunter AI  ·  Inductive Scorer  ·  v1.0
+============================================
+GNN inference for accounts that are not in the trained graph.
+
+The logit cache only covers nodes present in ``processed_graph.pt``.  For an
+unseen account whose transactions touch known accounts, ``InductiveScorer``
+places the account in the serving graph, extracts its receptive field (the
+k-hop *in*-neighbourhood — SAGE and GAT aggregate over in-edges) and runs
+the serving runtime on that small subgraph only.  ``model`` is anything with
+the ``(x, edge_index) → (log-probs, embedding)`` contract of
+``model_export.ServingGNN`` — the eager view or the TorchScript export.
+
+  · the unseen account gets the median feature row, with the graph features
+    that can be derived from its own links (in/out amount ratio,
+    reciprocity, neighbour community fraud rate) filled in and normalised
+    with ``norm_params.json``
+  · each known predecessor's (k-1)-hop receptive field is cached, so
+    accounts that touch the same hubs reuse the extraction work
+  · a batch of unseen accounts is scored in one forward pass over the
+    disjoint union of their subgraphs
+
+With ``fanout=0`` (no per-node in-edge cap) the account's row is exactly what
+a full-graph forward with the account added would produce.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+from typing import List, Optional
+
+import numpy as np
+import torch
+
+from graph_index import CSRAdjacency, LiveAdjacency
+from node_store import NodeAttributeStore
+from serving_cache import ShardedLRUCache
+
+# Graph features recomputed from an unseen account's links (same definitions
+# as compute_graph_metrics / detect_communities in feature_engineering.py).
+LINK_FEATURES: tuple[str, ...] = ("in_out_ratio", "reciprocity_score", "community_fraud_rate")
+
+# Receptive-field cache keys carry the scorer's epoch — or, for a node whose
+# field live ingestion changed, the stamp of that change — so a scorer over a
+# newer adjacency never reads a field cached by an older one.
+_EPOCHS = itertools.count()
+
+
+def _run(
+    model:      torch.nn.Module,
+    x:          torch.Tensor,
+    edge_index: torch.Tensor,
+    rows:       torch.Tensor,
+) -> np.ndarray:
+    """Forward pass → ``(len(rows), 3)`` array of (risk, confidence, emb_norm)."""
+    with torch.no_grad():
+        logits, embeddings = model(x, edge_index)
+        probs = logits[rows].exp()
+        norms = torch.norm(embeddings[rows], p=2, dim=1)
+    return torch.stack(
+        (probs[:, 1], (probs[:, 1] - probs[:, 0]).abs(), norms), dim=1,
+    ).cpu().numpy().astype(np.float64)
+
+
+def subgraph_forward(
+    model: torch.nn.Module,
+    x:     torch.Tensor,
+    adj:   CSRAdjacency | LiveAdjacency,
+    rows:  np.ndarray,
+    hops:  int = 3,
+) -> np.ndarray:
+    """
+    Exact (risk, confidence, emb_norm) for known nodes ``rows`` from a
+    forward pass over their ``hops``-hop receptive field only.
+    """
+    rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+    if not len(rows):
+        return np.zeros((0, 3))
+    nodes, expanded = adj.receptive_field(rows, hops)
+    nodes    = np.sort(nodes)
+    src, dst = adj.in_edges(expanded)
+    edge_index = torch.from_numpy(np.stack((
+        np.searchsorted(nodes, src), np.searchsorted(nodes, dst),
+    )))
+    return _run(
+        model, x[torch.from_numpy(nodes)], edge_index,
+        torch.from_numpy(np.searchsorted(nodes, rows)),
+    )
+
+
+class UnseenLinks:
+    """Known counterparties of one unseen account: node indices + amounts."""
+
+    __slots__ = ("out_nbrs", "out_amounts", "in_nbrs", "in_amounts")
+
+    def __init__(
+        self,
+        out_nbrs:    np.ndarray,
+        out_amounts: np.ndarray,
+        in_nbrs:     np.ndarray,
+        in_amounts:  np.ndarray,
+    ) -> None:
+        self.out_nbrs    = np.asarray(out_nbrs,    dtype=np.int64).reshape(-1)
+        self.out_amounts = np.asarray(out_amounts, dtype=np.float64).reshape(-1)
+        self.in_nbrs     = np.asarray(in_nbrs,     dtype=np.int64).reshape(-1)
+        self.in_amounts  = np.asarray(in_amounts,  dtype=np.float64).reshape(-1)
+
+    def __len__(self) -> int:
+        return len(self.out_nbrs) + len(self.in_nbrs)
+
+
+class InductiveScorer:
+    """
+    Read-only apart from the receptive-field cache (which is thread-safe),
+    so one instance is shared by all worker threads.  Live ingestion swaps
+    in a copy over the extended adjacency (``with_adjacency``).
+    """
+
+    def __init__(
+        self,
+        model:       torch.nn.Module,
+        x:           torch.Tensor,
+        adj:         CSRAdjacency | LiveAdjacency,
+        store:       Optional[NodeAttributeStore],
+        norm_params: Optional[dict],
+        cache:       ShardedLRUCache,
+        hops:        int = 3,
+        fanout:      int = 0,
+    ) -> None:
+        if hops < 1:
+            raise ValueError("hops must be >= 1")
+        self.model  = model
+        self.x      = x
+        self.adj    = adj
+        self.hops   = int(hops)
+        self.fanout = int(fanout)
+        self._cache = cache
+        self._cache.clear()
+        self._epoch = next(_EPOCHS)
+        self._stamps: dict[int, int] = {}
+
+        self.base_row = torch.median(x, dim=0).values.cpu().numpy().astype(np.float32)
+
+        # col → (position in x, col_min, col_range) for the derivable features
+        self._norm: dict[str, tuple[int, float, float]] = {}
+        if norm_params:
+            cols = list(norm_params.get("feature_cols", []))
+            for col in LINK_FEATURES:
+                if col in cols:
+                    j = cols.index(col)
+                    self._norm[col] = (
+                        j, float(norm_params["col_min"][j]), float(norm_params["col_range"][j]),
+                    )
+        self._community_rate = (
+            store.column("community_fraud_rate")
+            if store is not None and "community_fraud_rate" in store else None
+        )
+
+    def with_adjacency(
+        self,
+        adj:     CSRAdjacency | LiveAdjacency,
+        changed: Optional[np.ndarray] = None,
+    ) -> "InductiveScorer":
+        """
+        The same scorer (model, ``base_row``, normalisation, cache) over
+        ``adj``.  ``changed`` are the nodes whose in-edges differ from the
+        current adjacency; only cached fields that read them are dropped.
+        ``changed=None`` starts a fresh epoch instead (used when the ingest
+        delta is folded back, which also resets the per-node stamps).
+        """
+        out = copy.copy(self)
+        out.adj = adj
+        if changed is None:
+            out._epoch, out._stamps = next(_EPOCHS), {}
+        elif self.hops > 1 and len(changed):
+            # _field(i) follows in-edges of nodes within hops - 2 in-hops of i
+            stale = adj.downstream(np.asarray(changed, dtype=np.int64), self.hops - 2)
+            out._stamps = dict(self._stamps)
+            out._stamps.update(dict.fromkeys(stale.tolist(), next(_EPOCHS)))
+        return out
+
+    # ── Features ─────────────────────────────────────────────────────────────
+
+    def features(self, links: UnseenLinks) -> np.ndarray:
+        """Normalised feature row for an unseen account."""
+        row = self.base_row.copy()
+        if not self._norm:
+            return row
+
+        outs = np.unique(links.out_nbrs)
+        ins  = np.unique(links.in_nbrs)
+        raw  = {
+            "in_out_ratio":      links.in_amounts.sum() / (links.out_amounts.sum() + 1e-5),
+            "reciprocity_score": len(np.intersect1d(outs, ins, assume_unique=True)) / (len(outs) + 1),
+        }
+        if self._community_rate is not None:
+            nbrs = np.union1d(outs, ins)
+            raw["community_fraud_rate"] = self._community_rate[nbrs].mean() if len(nbrs) else 0.0
+
+        for col, val in raw.items():
+            if col in self._norm:
+                j, lo, rng = self._norm[col]
+                row[j] = np.clip((float(val) - lo) / rng, 0.0, 1.0)
+        return row
+
+    # ── Subgraph extraction ──────────────────────────────────────────────────
+
+    def _field(self, idx: int) -> tuple[np.ndarray, np.ndarray]:
+        return self._cache.get_or_compute(
+            (self._stamps.get(idx, self._epoch), idx),
+            lambda: self.adj.receptive_field(idx, self.hops - 1, self.fanout),
+        )
+
+    def subgraph(self, links: UnseenLinks) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (known node indices, local ``[2, E]`` edge index) for one unseen
+        account.  Local index 0 is the account; known node ``known[i]`` is
+        local ``i + 1``.
+        """
+        preds = links.in_nbrs[:self.fanout] if self.fanout else links.in_nbrs
+
+        parts, expanded = [preds], []
+        if self.hops > 1:
+            for p in np.unique(preds).tolist():
+                nodes, exp = self._field(p)
+                parts.append(nodes)
+                expanded.append(exp)
+        known    = np.unique(np.concatenate(parts))
+        expanded = np.unique(np.concatenate(expanded)) if expanded else known[:0]
+
+        # In-edges of every expanded known node, the account's own in-edges,
+        # and its out-edges into expanded nodes (those feed back within k hops).
+        src, dst = self.adj.in_edges(expanded, self.fanout)
+        back     = links.out_nbrs[np.isin(links.out_nbrs, expanded)]
+        edge_src = np.concatenate((
+            np.searchsorted(known, src) + 1,
+            np.searchsorted(known, preds) + 1,
+            np.zeros(len(back), dtype=np.int64),
+        ))
+        edge_dst = np.concatenate((
+            np.searchsorted(known, dst) + 1,
+            np.zeros(len(preds), dtype=np.int64),
+            np.searchsorted(known, back) + 1,
+        ))
+        return known, np.stack((edge_src, edge_dst)).astype(np.int64)
+
+    # ── Scoring ──────────────────────────────────────────────────────────────
+
+    def score(self, batch: List[UnseenLinks]) -> List[tuple[float, float, float]]:
+        """
+        (risk, confidence, embedding_norm) per account, from one forward pass
+        over the disjoint union of the batch's subgraphs.
+        """
+        if not batch:
+            return []
+
+        rows, feats, edges, centres = [], [], [], []
+        offset = 0
+        for links in batch:
+            known, edge_index = self.subgraph(links)
+            centres.append(offset)
+            rows.append(np.concatenate(([0], known)))     # row 0 is overwritten below
+            feats.append(self.features(links))
+            edges.append(edge_index + offset)
+            offset += 1 + len(known)
+
+        centre_idx = torch.tensor(centres, dtype=torch.long)
+        x = self.x[torch.from_numpy(np.concatenate(rows))]
+        x[centre_idx] = torch.from_numpy(np.stack(feats)).to(x.dtype)
+        edge_index = torch.from_numpy(np.concatenate(edges, axis=1))
+        return [tuple(r) for r in _run(self.model, x, edge_index, centre_idx).tolist()]
@@ -6,13 +6,18 @@ FastAPI real-time GNN scoring service.
 Endpoints
 ─────────
   POST /v1/gnn/score          Spring Boot contract (full schema)
+  GET  /v1/gnn/similar        Nearest accounts in GNN embedding space (IVF index)
   POST /analyze-transaction   Single transaction risk scoring + explainability
-  POST /analyze-batch         Bulk transaction analysis (≤ 100 tx)
+  POST /analyze-batch         Bulk transaction analysis (any size, NDJSON streaming)
+  POST /analyze-batch/ndjson  Streamed NDJSON in → streamed NDJSON out
+  POST /v1/graph/ingest       Append live transactions, refresh affected logits
+  POST /admin/reload          Rebuild the serving snapshot and swap it in live
   GET  /detect-rings          Money-laundering ring report
   GET  /cluster-report        Fraud cluster summary
   GET  /network-snapshot      Graph snapshot for dashboard
   GET  /health                System health + model metadata
   GET  /metrics               Full evaluation report
+  GET  /metrics/runtime       Per-stage latency histograms + counters (Prometheus text)
 
 Changes in v3.2 (bug fixes):
   [A] GnnScoreRequest now accepts BOTH "sourceAccountId" AND the legacy "accountId"
@@ -32,27 +37,51 @@ Changes in v3.2 (bug fixes):
 
 from __future__ import annotations
 
+import copy
 import datetime
+import heapq
+import itertools
 import json
 import logging
 import os
+import threading
 import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, List, Optional
 
-import networkx as nx
 import numpy as np
 import pandas as pd
 import torch
 import torch.nn.functional as F
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, model_validator
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError, model_validator
 from torch_geometric.data import Data
 from torch_geometric.nn import BatchNorm, GATConv, SAGEConv
 
+from artifact_watcher import ArtifactWatcher, Digests, content_signature
+from embedding_index import EmbeddingIndex
+from graph_index import ArrayDiGraph, CSRAdjacency, FraudExposureIndex, LiveAdjacency
+from inductive import InductiveScorer, UnseenLinks, subgraph_forward
+from micro_batcher import MicroBatcher
+from network_view import NetworkView
+from ring_worker import RingSearch
+from model_export import ServingGNN, load_exported
+from node_store import CommunityTable, LogitTable, NodeAttributeStore
+from runtime_metrics import NULL_TIMER, RuntimeMetrics, format_family
+from score_encoder import ENCODER, ObjectEncoder, Raw, compare, raw, utc_timestamp
+from serving_cache import ShardedLRUCache, cache_stats
+from serving_snapshot import (
+    ServingSnapshot, SnapshotError, decode_strings, encode_strings, open_snapshot, write_snapshot,
+)
+from single_flight import SingleFlight
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(message)s",
@@ -74,10 +103,31 @@ NODES_PATH = SHARED_DATA / "nodes.csv"
 NORM_PATH  = SHARED_DATA / "norm_params.json"
 META_PATH  = SHARED_DATA / "model_meta.json"
 EVAL_PATH  = SHARED_DATA / "eval_report.json"
+TX_PATH    = SHARED_DATA / "transactions.csv"
+SNAPSHOT_PATH = SHARED_DATA / "serving_snapshot.bin"
+EXPORT_PATH   = SHARED_DATA / "mule_model.torchscript.pt"
 
-RING_TIMEOUT_SEC       = 20
-MAX_RINGS_CACHED       = 200
+# Everything a full build reads.  The compiled snapshot records their content
+# hashes and is only used while they still match.
+SOURCE_ARTIFACTS  = [MODEL_PATH, GRAPH_PATH, NODES_PATH, TX_PATH, NORM_PATH, META_PATH, EXPORT_PATH]
+# A change to any of these triggers a hot reload.
+SERVING_ARTIFACTS = SOURCE_ARTIFACTS + [SNAPSHOT_PATH]
+
+MAX_RINGS_CACHED       = 200      # split across ring sizes 3–6 (ring_worker.find_rings)
 UNKNOWN_NODE_CACHE_MAX = 10_000
+UNKNOWN_NODE_CACHE_TTL_SEC = 300   # neighbour scores can move; don't serve stale forever
+EXPOSURE_CACHE_MAX     = 50_000
+CLUSTER_REPORT_TOP_N   = 10
+CLUSTER_TOP_MEMBERS    = 5
+INDUCTIVE_HOPS         = 3        # receptive field of SAGE → GAT → SAGE
+INDUCTIVE_FANOUT       = 64       # in-edges kept per node in unseen-account subgraphs
+SUBGRAPH_CACHE_MAX     = 20_000
+INGEST_MERGE_EDGES     = 50_000   # ingested edges / refreshed logit rows held aside before folding in
+SIMILAR_MAX_K          = 100
+NETWORK_PAGE_MAX       = 5_000
+NETWORK_EDGE_LIMIT     = 500      # edges per /network-snapshot page
+NETWORK_CACHE_MAX      = 256      # serialized /network-snapshot pages per snapshot
+SCORE_STATIC_CACHE_MAX = 50_000   # per-account static /v1/gnn/score sub-objects
 
 LOW_AMOUNT_HARD_CAP  = 500      # below ₹500
 LOW_AMOUNT_SCORE_CAP = 0.60     # allow up to 0.60 even for small amounts
@@ -91,6 +141,50 @@ VERY_HIGH_AMOUNT_FLOOR      = 0.60       # minimum score for ₹10 lakh+
 CRORE_THRESHOLD             = 10_000_000 # ₹1 crore+
 CRORE_FLOOR                 = 0.72       # minimum score for crore-level transactions
 
+# /v1/gnn/score micro-batching: requests arriving within the window (or until
+# the batch is full) are scored together.  SCORE_BATCH_WINDOW_MS=0 disables.
+SCORE_BATCH_WINDOW_MS = float(os.getenv("SCORE_BATCH_WINDOW_MS", "2"))
+SCORE_BATCH_MAX       = int(os.getenv("SCORE_BATCH_MAX", "64"))
+SCORE_BATCH_WORKERS   = int(os.getenv("SCORE_BATCH_WORKERS", "4"))
+
+# Feed every scored src → tgt transaction into the live graph (background
+# thread, one batch per micro-batch).  Off by default: scoring stays read-only.
+INGEST_SCORED_TX      = os.getenv("INGEST_SCORED_TX", "0") == "1"
+
+# /analyze-batch scores this many transactions per vectorised pass and, when
+# streaming, flushes one NDJSON chunk per pass.
+ANALYZE_BATCH_CHUNK   = int(os.getenv("ANALYZE_BATCH_CHUNK", "4096"))
+
+# Hot reload: SERVING_ARTIFACTS are polled every RELOAD_POLL_SEC (0 disables
+# the watcher; POST /admin/reload still works).  When RELOAD_TOKEN is set the
+# admin endpoint requires it in the X-Admin-Token header.
+RELOAD_POLL_SEC       = float(os.getenv("RELOAD_POLL_SEC", "10"))
+RELOAD_TOKEN          = os.getenv("RELOAD_TOKEN", "")
+
+# Ring discovery after a full build: "process" (separate worker process,
+# scoring starts at once and ring fields fill in), "thread", or "sync"
+# (block the build until the search finishes).
+RING_SEARCH_MODE      = os.getenv("RING_SEARCH_MODE", "process")
+
+# Map serving_snapshot.bin (when current) instead of rebuilding from the CSVs.
+USE_SERVING_SNAPSHOT  = os.getenv("SERVING_SNAPSHOT", "1") == "1"
+
+# Run forwards on the TorchScript export from train_model.py / model_export.py
+# when it passed parity and matches mule_model.pth; else the eager model.
+USE_EXPORTED_MODEL    = os.getenv("EXPORTED_MODEL", "1") == "1"
+
+# /v1/gnn/score fast path: precompiled JSON encoder plus cached per-account
+# static sub-objects instead of pydantic validation.  Enabled per snapshot
+# only after a startup check shows both paths produce the same document.
+FAST_SCORE_JSON       = os.getenv("FAST_SCORE_JSON", "0") == "1"
+
+# /v1/gnn/similar: inverted lists probed per query (recall vs latency).
+SIMILAR_NPROBE        = int(os.getenv("SIMILAR_NPROBE", "8"))
+
+# Per-stage latency histograms on /metrics/runtime (0 turns stage timing off;
+# request counts and end-to-end latency are always kept).
+RUNTIME_METRICS       = os.getenv("RUNTIME_METRICS", "1") == "1"
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # MODEL
@@ -264,6 +358,7 @@ class RingReport(BaseModel):
     rings_detected:  int
     rings:           List[Dict[str, Any]]
     high_risk_nodes: List[str]
+    search:          Optional[Dict[str, Any]] = None
 
 
 class ClusterReport(BaseModel):
@@ -326,245 +421,855 @@ RISK_FACTOR_RULES: list[tuple] = [
 # GLOBAL STATE
 # ──────────────────────────────────────────────────────────────────────────────
 
-model:       Optional[MuleHunterGNN] = None
-base_graph:  Optional[Data]          = None
-node_df:     Optional[pd.DataFrame]  = None
-nx_graph:    Optional[nx.DiGraph]    = None
-norm_params: Optional[dict]          = None
-model_meta:  Optional[dict]          = None
-id_map:      Dict[str, int]          = {}
-rev_map:     Dict[int, str]          = {}
+class ServingState:
+    """
+    One complete, self-consistent set of serving artifacts: model, graph,
+    node attributes, precomputes and the caches derived from them.
+
+    A snapshot is built off to the side by ``_build_state`` and published by
+    a single assignment to ``_state``.  Request handlers read ``_state`` once
+    and pass the snapshot down, so a request that started before a reload
+    finishes on the snapshot it started with.  Live ingestion never writes
+    a published snapshot's graph fields either: under ``_ingest_lock`` it
+    publishes a copy over the extended graph (``with_graph``), again with
+    one assignment, so adjacency, logits, fraud exposure and the inductive
+    scorer are always read as a matching set.
+    """
+
+    def __init__(self, snapshot_id: int) -> None:
+        self.snapshot_id = snapshot_id
+        self.model:           Optional[MuleHunterGNN]      = None
+        # (x, edge_index) → (log-probs, embedding): the exported TorchScript
+        # module, or ServingGNN over ``model``.  Every forward goes through it.
+        self.runtime:         Optional[torch.nn.Module]    = None
+        self.runtime_meta:    Dict[str, Any]               = {"runtime": "eager"}
+        self.base_graph:      Optional[Data]               = None
+        self.node_df:         Optional[pd.DataFrame]       = None
+        self.node_store:      Optional[NodeAttributeStore] = None
+        self.community_table: Optional[CommunityTable]     = None
+        self.tx_graph:        Optional[ArrayDiGraph]       = None
+        # Build-time CSR plus the edges ingested since (see ingest_transactions)
+        self.adjacency:       Optional[LiveAdjacency]      = None
+        self.fraud_exposure:  Optional[FraudExposureIndex] = None
+        self.norm_params:     Optional[dict]               = None
+        self.model_meta:      Optional[dict]               = None
+        self.id_map:          Dict[str, int]               = {}
+        self.rev_map:         Dict[int, str]               = {}
+
+        # (rings by ring id, node_id → ring ids) replaced as one tuple, so a
+        # reader that unpacks it once never mixes two generations.  The slot
+        # is shared with the copies ingestion publishes, so a running ring
+        # search fills it in for all of them.
+        self._rings: List[tuple[List[Dict[str, Any]], Dict[str, List[int]]]] = [([], {})]
+        self.ring_search:     Optional[RingSearch]                = None
+        # (N, 3) rows [risk, conf, emb_norm] by node index for every account in
+        # id_map — the only source of known-account scores.  Never mutated.
+        self.logit_table:     Optional[LogitTable]                = None
+        # int8 IVF index over node embeddings as of the build (not refreshed by ingest)
+        self.embedding_index: Optional[EmbeddingIndex]            = None
+        self.new_node_baseline: Optional[tuple[float, float, float]] = None
+        self.inductive:       Optional[InductiveScorer]           = None
+        self.cluster_report:  Optional[ClusterReport]             = None
+        self.network_view:    Optional[NetworkView]               = None
+
+        # Ingested edges that touch an unseen account, copy-on-write per
+        # account: live_out[a][b] == live_in[b][a] == amount.  Known → known
+        # edges go into the adjacency instead.
+        self.live_out: Dict[str, Dict[str, float]] = {}
+        self.live_in:  Dict[str, Dict[str, float]] = {}
+
+        # Per-snapshot memos: entries computed against one snapshot are never
+        # served from another.
+        self.unknown_cache  = ShardedLRUCache(
+            "unknown_node", UNKNOWN_NODE_CACHE_MAX, ttl_sec=UNKNOWN_NODE_CACHE_TTL_SEC,
+        )
+        self.exposure_cache = ShardedLRUCache("fraud_exposure", EXPOSURE_CACHE_MAX)
+        self.subgraph_cache = ShardedLRUCache("khop_subgraph", SUBGRAPH_CACHE_MAX)
+        self.network_cache  = ShardedLRUCache("network_snapshot", NETWORK_CACHE_MAX)
+        self.static_cache   = ShardedLRUCache("score_static", SCORE_STATIC_CACHE_MAX)
+        # Coalesces concurrent cold work on the same account (unseen-account
+        # inference, /v1/gnn/score account state); holds nothing afterwards.
+        self.score_flight   = SingleFlight("score")
+        self.fast_scoring:   bool           = False
+        self.score_encoding: Dict[str, Any] = {"mode": "pydantic"}
+
+        self.artifacts: Digests       = {}
+        self.source:    str           = "artifacts"     # or "snapshot"
+        self.built_at:  Optional[str] = None
+        self.build_sec: float         = 0.0
+
+    @property
+    def version(self) -> str:
+        return self.model_meta.get("version", "unknown") if self.model_meta else "unknown"
+
+    @property
+    def threshold(self) -> float:
+        return float(self.model_meta.get("optimal_threshold", 0.5)) if self.model_meta else 0.5
+
+    @property
+    def rings(self) -> tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+        return self._rings[0]
+
+    @rings.setter
+    def rings(self, value: tuple[List[Dict[str, Any]], Dict[str, List[int]]]) -> None:
+        self._rings[0] = value
+
+    @property
+    def rings_cache(self) -> List[Dict[str, Any]]:
+        return self.rings[0]
+
+    @property
+    def ring_index(self) -> Dict[str, List[int]]:
+        return self.rings[1]
+
+    def readiness(self) -> Dict[str, Any]:
+        rings = (
+            self.ring_search.status() if self.ring_search is not None
+            else {"state": "complete", "percent": 100.0, "found": len(self.rings_cache),
+                  "by_size": dict(Counter(r["size"] for r in self.rings_cache)), "source": self.source}
+        )
+        return {
+            "model":  self.model is not None,
+            "logits": self.logit_table is not None,
+            "rings":  rings,
+        }
 
-_rings_cache:   List[Dict[str, Any]]                = []
-_logit_cache:   Dict[str, tuple[float,float,float]] = {}
-_unknown_cache: Dict[str, tuple[float,float,float]] = {}
+    def with_graph(
+        self,
+        adjacency:      Optional[LiveAdjacency],
+        logit_table:    Optional[LogitTable],
+        fraud_exposure: Optional[FraudExposureIndex],
+        inductive:      Optional[InductiveScorer],
+    ) -> "ServingState":
+        """
+        This snapshot over an extended graph, for ingestion to publish.
+        Everything else is shared (the exposure and receptive-field caches
+        key on per-node versions), except the unseen-account memo — those
+        scores read neighbour topology — and the in-flight coalescer.
+        """
+        st = copy.copy(self)
+        st.adjacency      = adjacency
+        st.logit_table    = logit_table
+        st.fraud_exposure = fraud_exposure
+        st.inductive      = inductive
+        st.unknown_cache  = ShardedLRUCache(
+            "unknown_node", UNKNOWN_NODE_CACHE_MAX, ttl_sec=UNKNOWN_NODE_CACHE_TTL_SEC,
+        )
+        st.score_flight   = SingleFlight("score")
+        return st
 
-_new_node_baseline: Optional[tuple[float, float, float]] = None
+    def caches(self) -> List[ShardedLRUCache]:
+        return [
+            self.unknown_cache, self.exposure_cache, self.subgraph_cache,
+            self.network_cache, self.static_cache,
+        ]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "snapshot_id":   self.snapshot_id,
+            "model_version": self.version,
+            "source":        self.source,
+            "built_at":      self.built_at,
+            "build_sec":     self.build_sec,
+            "nodes":         self.base_graph.num_nodes if self.base_graph is not None else 0,
+            "edges":         self.adjacency.num_edges if self.adjacency is not None else 0,
+            "runtime":       self.runtime_meta.get("runtime"),
+        }
+
+
+_state:    Optional[ServingState] = None
+_previous: Optional[Dict[str, Any]] = None      # describe() of the snapshot _state replaced
+_snapshot_ids = itertools.count(1)
 
-_initialized = False
 _init_lock   = Lock()
+_reload_lock = Lock()           # one build at a time
+_reload_status: Dict[str, Any] = {
+    "in_progress": False, "trigger": None, "started_at": None,
+    "reloads": 0, "failures": 0, "last_error": None,
+}
+
+_ingest_lock   = Lock()
+_ingest_stats: Dict[str, int] = {
+    "batches": 0, "edges": 0, "graph_edges": 0, "unseen_edges": 0, "nodes_refreshed": 0,
+}
+
+# Hot-path telemetry for /metrics/runtime.  Lives outside ServingState so
+# histograms and counters survive reloads.
+_metrics   = RuntimeMetrics("mulehunter", enabled=RUNTIME_METRICS)
+_ENDPOINTS = ("gnn_score", "analyze", "analyze_batch", "analyze_batch_ndjson")
+_requests  = {
+    ep: _metrics.counter("requests_total", "Requests received, by endpoint.", endpoint=ep)
+    for ep in _ENDPOINTS
+}
+_request_latency = {
+    ep: _metrics.histogram("request_latency_seconds", "End-to-end handler latency.", endpoint=ep)
+    for ep in _ENDPOINTS
+}
+_logit_lookups = {
+    result: _metrics.counter(
+        "logit_cache_lookups_total",
+        "Account lookups against the logit table (miss = inductive / baseline path).",
+        result=result,
+    )
+    for result in ("hit", "miss")
+}
+_batch_transactions = _metrics.counter(
+    "batch_transactions_total", "Transactions scored by the /analyze-batch endpoints.",
+)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # STARTUP HELPERS
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _precache_rings(g: nx.DiGraph, account_nodes: set) -> List[Dict[str, Any]]:
-    rings: List[Dict[str, Any]]    = []
-    seen_ring_sets: set[frozenset] = set()
-    sub      = g.subgraph([n for n in g.nodes() if n in account_nodes]).copy()
-    deadline = time.monotonic() + RING_TIMEOUT_SEC
+def _annotate_ring(g: ArrayDiGraph, path: List[int], volume: float) -> Dict[str, Any]:
+    """
+    Ring dict with its shape, hub and per-member role, so the request path
+    never runs a graph algorithm.
+    """
+    nodes = [g.ids[i] for i in path]
+    succ  = g.induced_successors(path)
+    ring: Dict[str, Any] = {
+        "nodes":  nodes,
+        "size":   len(path),
+        "volume": round(float(volume), 2),
+        "risk":   round(float(min(1.0, volume / 50_000)), 4),
+    }
+    ring["shape"]              = _classify_ring_shape(nodes, succ)
+    ring["hub"], ring["roles"] = _classify_roles(nodes, succ)
+    return ring
+
 
-    for start in list(sub.nodes()):
-        if time.monotonic() > deadline or len(rings) >= MAX_RINGS_CACHED:
-            break
-        stack = [(start, [start])]
-        while stack:
-            if time.monotonic() > deadline or len(rings) >= MAX_RINGS_CACHED:
-                break
-            node, path = stack.pop()
-            for nb in sub.successors(node):
-                if len(path) > 6:
-                    break
-                if nb == start and len(path) >= 3:
-                    key = frozenset(path)
-                    if key not in seen_ring_sets:
-                        seen_ring_sets.add(key)
-                        vol = sum(
-                            sub[path[i]][path[(i + 1) % len(path)]].get("weight", 0)
-                            for i in range(len(path))
-                        )
-                        rings.append({
-                            "nodes":  path[:],
-                            "size":   len(path),
-                            "volume": round(float(vol), 2),
-                            "risk":   round(float(min(1.0, vol / 50_000)), 4),
-                        })
-                elif nb not in path:
-                    stack.append((nb, path + [nb]))
-
-    rings.sort(key=lambda r: r["volume"], reverse=True)
-    logger.info("Ring pre-cache: %d rings found", len(rings))
-    return rings
-
-
-def _build_logit_cache(mdl: MuleHunterGNN, graph: Data) -> None:
-    logger.info("Pre-computing logit cache for all known nodes...")
-    mdl.eval()
+def _index_rings(rings: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+    """
+    Rings in discovery order plus the inverted index node_id → ring ids.  A
+    ring's id is its discovery position (``ring["ring_id"]``), so it never
+    changes while the search streams more rings in.
+    """
+    rings = list(rings)
+    ring_index: Dict[str, List[int]] = {}
+    for ring_id, ring in enumerate(rings):
+        for nd in ring["nodes"]:
+            ring_index.setdefault(nd, []).append(ring_id)
+    return rings, ring_index
+
+
+def _start_ring_search(st: ServingState, mode: str = RING_SEARCH_MODE) -> None:
+    """
+    Ring search over the account subgraph: a deterministic sample of
+    MAX_RINGS_CACHED rings across every size and the whole graph.  Each
+    streamed batch is annotated here and ``st.rings`` is republished, so
+    ring fields fill in while the snapshot is already serving;
+    ``mode="sync"`` returns only when the search is done.
+    """
+    g          = st.tx_graph
+    is_account = g.mask_of(st.id_map)
+    annotated: List[Dict[str, Any]] = []
+
+    def _on_update(found: List[tuple[List[int], float]]) -> None:
+        for ring_id, (path, vol) in enumerate(found[len(annotated):], start=len(annotated)):
+            annotated.append({"ring_id": ring_id, **_annotate_ring(g, path, vol)})
+        st.rings = _index_rings(annotated)
+
+    logger.info("Ring search (%s, %d rings across sizes)...", mode, MAX_RINGS_CACHED)
+    st.ring_search = RingSearch(
+        g.adj.out_offsets, g.adj.out_nbrs, g.adj.out_weights, is_account, _on_update,
+        max_rings=MAX_RINGS_CACHED, mode=mode,
+    ).start()
+    if mode == "sync":
+        logger.info(
+            "Ring pre-cache: %d rings found | %d member accounts indexed",
+            len(st.rings_cache), len(st.ring_index),
+        )
+
+
+def _build_adjacency(graph: Data) -> CSRAdjacency:
+    edge_weight = getattr(graph, "edge_weight", None)
+    adj = CSRAdjacency.from_edge_index(
+        graph.edge_index.cpu().numpy(),
+        graph.num_nodes,
+        edge_weight.cpu().numpy() if edge_weight is not None else None,
+    )
+    logger.info(
+        "  CSR adjacency: %s edges | %.1f MB",
+        f"{adj.num_edges:,}", adj.nbytes() / 1e6,
+    )
+    return adj
+
+
+def _build_fraud_exposure(
+    adj:   CSRAdjacency,
+    store: NodeAttributeStore,
+) -> Optional[FraudExposureIndex]:
+    if store.num_nodes != adj.num_nodes:
+        logger.warning(
+            "  nodes.csv (%d) and graph (%d) disagree — fraud exposure disabled",
+            store.num_nodes, adj.num_nodes,
+        )
+        return None
+    exposure = FraudExposureIndex(adj, store.column("is_fraud") == 1)
+    logger.info("  Fraud mask: %s labelled fraud nodes", f"{int(exposure.mask.sum()):,}")
+    return exposure
+
+
+def _build_cluster_report(
+    store:   NodeAttributeStore,
+    table:   CommunityTable,
+    rev_map: Dict[int, str],
+) -> Optional[ClusterReport]:
+    """Pre-render /cluster-report once; the endpoint just returns it."""
+    if "community_fraud_rate" not in store:
+        return None
+    rate     = store.column("community_fraud_rate")
+    is_fraud = store.column("is_fraud") if "is_fraud" in store else np.zeros(len(rate), np.int8)
+    cids     = store.column("community_id")
+
+    # Same buckets as the former pd.cut: High=(0.3, 0.6], Critical=(0.6, 1.01]
+    high_risk = int(((rate > 0.3) & (rate <= 1.01)).sum())
+
+    top_clusters: List[Dict[str, Any]] = []
+    for idx in np.argsort(-rate, kind="stable")[:CLUSTER_REPORT_TOP_N].tolist():
+        cid = int(cids[idx])
+        top_clusters.append({
+            "node_id":              rev_map.get(idx, str(idx)),
+            "community_fraud_rate": float(rate[idx]),
+            "is_fraud":             int(is_fraud[idx]),
+            "community_id":         cid,
+            "cluster_size":         table.size_of(cid),
+            "cluster_fraud_count":  int(table.fraud_count[table.row(cid)]),
+            "cluster_top_members":  [
+                rev_map.get(m, str(m))
+                for m in table.top_members(cid, CLUSTER_TOP_MEMBERS).tolist()
+            ],
+        })
+
+    return ClusterReport(
+        total_clusters     =len(table),
+        high_risk_clusters =high_risk,
+        top_clusters       =top_clusters,
+    )
+
+
+def _attach_runtime(st: ServingState) -> None:
+    """
+    Point ``st.runtime`` at the TorchScript export when one is usable for
+    ``st.model``'s weights, else at the eager ``ServingGNN`` view.
+    """
+    st.runtime      = ServingGNN(st.model)
+    st.runtime_meta = {"runtime": "eager"}
+    if not USE_EXPORTED_MODEL or not EXPORT_PATH.exists():
+        return
+    try:
+        loaded = load_exported(EXPORT_PATH, content_signature([MODEL_PATH])[MODEL_PATH.name])
+    except Exception as exc:
+        logger.warning("  %s unreadable (%s) — eager model", EXPORT_PATH.name, exc)
+        return
+    if loaded is None:
+        logger.info("  %s is stale or failed parity — eager model", EXPORT_PATH.name)
+        return
+    st.runtime, meta = loaded
+    st.runtime_meta  = {
+        "runtime":       meta["runtime"],
+        "created_at":    meta.get("created_at"),
+        "max_prob_diff": meta["parity"]["max_prob_diff"],
+        "agreement":     meta["parity"]["decision_agreement"],
+    }
+    logger.info(
+        "  Runtime: %s (parity max Δp=%.2e)", meta["runtime"], meta["parity"]["max_prob_diff"],
+    )
+
+
+def _build_network_view(st: ServingState) -> None:
+    """Risk ordering + page-keyed induced edges for /network-snapshot (fixed per snapshot)."""
+    if st.node_store is None or st.tx_graph is None:
+        return
+    st.network_view = NetworkView(
+        [st.rev_map[i] for i in range(len(st.rev_map))], st.node_store, st.tx_graph,
+        token=str(st.snapshot_id), total_nodes=st.base_graph.num_nodes,
+    )
+
+
+def _build_logit_cache(st: ServingState) -> None:
+    logger.info("Pre-computing logits for all known nodes...")
     with torch.no_grad():
-        logits, embeddings = mdl(graph.x, graph.edge_index, return_embedding=True)
+        logits, embeddings = st.runtime(st.base_graph.x, st.base_graph.edge_index)
         probs = logits.exp()
         norms = torch.norm(embeddings, p=2, dim=1)
 
-    for nid, idx in id_map.items():
-        _logit_cache[nid] = (
-            float(probs[idx, 1]),
-            float(abs(probs[idx, 1] - probs[idx, 0])),
-            float(norms[idx]),
+    st.logit_table = LogitTable(torch.stack(
+        (probs[:, 1], (probs[:, 1] - probs[:, 0]).abs(), norms), dim=1,
+    ).cpu().numpy().astype(np.float64))
+    st.embedding_index = EmbeddingIndex.build(embeddings.cpu().numpy(), nprobe=SIMILAR_NPROBE)
+    logger.info("  Logit table built for %s nodes", f"{len(st.logit_table):,}")
+    logger.info(
+        "  Embedding index: %d lists | %.1f MB", st.embedding_index.nlist,
+        st.embedding_index.nbytes() / 1e6,
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# SERVING SNAPSHOT
+# ──────────────────────────────────────────────────────────────────────────────
+
+def compile_serving_snapshot(path: Path = SNAPSHOT_PATH) -> Dict[str, Any]:
+    """
+    Full build from the source artifacts, written to ``path`` as a
+    memory-mappable snapshot that ``_build_state`` maps instead of
+    rebuilding.  Called at the end of feature_engineering.py and
+    train_model.py.
+    """
+    t0 = time.perf_counter()
+    st = _build_state(use_snapshot=False, ring_mode="sync")
+    if st is None:
+        raise FileNotFoundError("model or graph missing — run train_model.py first")
+
+    ids    = [st.rev_map[i] for i in range(len(st.rev_map))]
+    graph  = st.base_graph
+    adj    = st.adjacency.merged()
+    arrays: Dict[str, np.ndarray] = {
+        "ids":              encode_strings(ids),
+        "x":                graph.x.cpu().numpy(),
+        "edge_index":       graph.edge_index.cpu().numpy(),
+        "csr/out_offsets":  adj.out_offsets,
+        "csr/out_nbrs":     adj.out_nbrs,
+        "csr/out_weights":  adj.out_weights,
+        "csr/in_offsets":   adj.in_offsets,
+        "csr/in_nbrs":      adj.in_nbrs,
+        "csr/in_weights":   adj.in_weights,
+        "logits":           st.logit_table.array(),
+    }
+    arrays.update({f"emb/{name}": arr for name, arr in st.embedding_index.arrays().items()})
+    if getattr(graph, "edge_weight", None) is not None:
+        arrays["edge_weight"] = graph.edge_weight.cpu().numpy()
+    if st.node_store is not None:
+        for col in st.node_store.column_names:
+            arrays[f"col/{col}"] = st.node_store.column(col)
+    for key, tensor in st.model.state_dict().items():
+        arrays[f"model/{key}"] = tensor.cpu().numpy()
+
+    if st.tx_graph is not None:
+        tx_adj = st.tx_graph.adj
+        arrays.update({
+            "txg/ids":             encode_strings(st.tx_graph.ids),
+            "txg/csr/out_offsets": tx_adj.out_offsets,
+            "txg/csr/out_nbrs":    tx_adj.out_nbrs,
+            "txg/csr/out_weights": tx_adj.out_weights,
+            "txg/csr/in_offsets":  tx_adj.in_offsets,
+            "txg/csr/in_nbrs":     tx_adj.in_nbrs,
+            "txg/csr/in_weights":  tx_adj.in_weights,
+        })
+
+    meta = {
+        "num_nodes":         len(ids),
+        "num_graph_ids":     len(st.tx_graph) if st.tx_graph is not None else 0,
+        "in_channels":       int(graph.x.shape[1]),
+        "hidden_channels":   int(st.model.conv1.out_channels),
+        "feature_cols":      st.node_store.feature_cols if st.node_store is not None else [],
+        "has_tx_graph":      st.tx_graph is not None,
+        "norm_params":       st.norm_params,
+        "model_meta":        st.model_meta,
+        "rings":             st.rings_cache,
+        "new_node_baseline": st.new_node_baseline,
+    }
+    size = write_snapshot(path, arrays, meta, st.artifacts)
+    elapsed = time.perf_counter() - t0
+    logger.info(
+        "Serving snapshot → %s | %d arrays | %.1f MB | compiled in %.1fs",
+        path, len(arrays), size / 1e6, elapsed,
+    )
+    return {"path": str(path), "arrays": len(arrays), "bytes": size, "compile_sec": round(elapsed, 3)}
+
+
+def _state_from_snapshot(snap: ServingSnapshot) -> ServingState:
+    """Wrap a mapped snapshot's arrays in a ServingState (no copies, no forward pass)."""
+    meta = snap.meta
+    n    = int(meta["num_nodes"])
+    st   = ServingState(next(_snapshot_ids))
+    st.source = "snapshot"
+
+    ids        = decode_strings(snap.array("ids"), n)
+    st.id_map  = {nid: i for i, nid in enumerate(ids)}
+    st.rev_map = dict(enumerate(ids))
+
+    graph = Data(
+        x          =torch.from_numpy(snap.array("x")),
+        edge_index =torch.from_numpy(snap.array("edge_index")),
+        num_nodes  =n,
+    )
+    if "edge_weight" in snap:
+        graph.edge_weight = torch.from_numpy(snap.array("edge_weight"))
+    st.base_graph = graph
+    st.adjacency  = LiveAdjacency(CSRAdjacency(
+        n,
+        snap.array("csr/out_offsets"), snap.array("csr/out_nbrs"), snap.array("csr/out_weights"),
+        snap.array("csr/in_offsets"),  snap.array("csr/in_nbrs"),  snap.array("csr/in_weights"),
+    ))
+    logger.info(
+        "  Snapshot: %s nodes | %s edges | %.1f MB mapped",
+        f"{n:,}", f"{st.adjacency.num_edges:,}", snap.nbytes() / 1e6,
+    )
+
+    columns = {name[4:]: snap.array(name) for name in snap.names("col/")}
+    if columns:
+        st.node_store      = NodeAttributeStore(columns, meta["feature_cols"])
+        st.node_df         = pd.DataFrame({"node_id": ids, **columns})
+        st.community_table = CommunityTable.from_store(st.node_store)
+        st.cluster_report  = _build_cluster_report(st.node_store, st.community_table, st.rev_map)
+        if "is_fraud" in st.node_store:
+            st.fraud_exposure = _build_fraud_exposure(st.adjacency.base, st.node_store)
+
+    st.norm_params = meta.get("norm_params")
+    st.model_meta  = meta.get("model_meta")
+
+    if meta.get("has_tx_graph"):
+        graph_ids   = decode_strings(snap.array("txg/ids"), int(meta["num_graph_ids"]))
+        st.tx_graph = ArrayDiGraph(graph_ids, CSRAdjacency(
+            len(graph_ids),
+            snap.array("txg/csr/out_offsets"), snap.array("txg/csr/out_nbrs"), snap.array("txg/csr/out_weights"),
+            snap.array("txg/csr/in_offsets"),  snap.array("txg/csr/in_nbrs"),  snap.array("txg/csr/in_weights"),
+        ))
+    _build_network_view(st)
+    st.rings = _index_rings(meta.get("rings", []))
+
+    st.model = MuleHunterGNN(in_channels=int(meta["in_channels"]), hidden=int(meta["hidden_channels"]))
+    st.model.load_state_dict({
+        name[6:]: torch.from_numpy(snap.array(name)) for name in snap.names("model/")
+    })
+    st.model.eval()
+    _attach_runtime(st)
+
+    st.logit_table = LogitTable(snap.array("logits"))
+    st.embedding_index = EmbeddingIndex.from_arrays(
+        {name[4:]: snap.array(name) for name in snap.names("emb/")}, nprobe=SIMILAR_NPROBE,
+    )
+    baseline = meta.get("new_node_baseline")
+    st.new_node_baseline = tuple(baseline) if baseline else None
+    st.inductive = InductiveScorer(
+        st.runtime, graph.x, st.adjacency, st.node_store, st.norm_params,
+        st.subgraph_cache, hops=INDUCTIVE_HOPS, fanout=INDUCTIVE_FANOUT,
+    )
+    return st
+
+
+def _build_state(
+    use_snapshot: bool = USE_SERVING_SNAPSHOT,
+    ring_mode:    str  = RING_SEARCH_MODE,
+) -> Optional[ServingState]:
+    """
+    Load every serving artifact from SHARED_DATA into a new, unpublished
+    ServingState — from the compiled snapshot when it is current, else from
+    the source artifacts.  Returns None when the model or graph is missing.
+    A full build starts the ring search last; unless ``ring_mode`` is
+    "sync" the state is returned while it is still running.
+    """
+    if not MODEL_PATH.exists() or not GRAPH_PATH.exists():
+        logger.error("Required assets missing — run train_model.py first")
+        return None
+
+    t0      = time.perf_counter()
+    sources = content_signature(SOURCE_ARTIFACTS)
+    if use_snapshot:
+        try:
+            snap = open_snapshot(SNAPSHOT_PATH, sources)
+            if snap is None and SNAPSHOT_PATH.exists():
+                logger.info("  %s is stale — full build", SNAPSHOT_PATH.name)
+        except (OSError, SnapshotError) as exc:
+            logger.warning("  %s unreadable (%s) — full build", SNAPSHOT_PATH.name, exc)
+            snap = None
+        if snap is not None:
+            st = _state_from_snapshot(snap)
+            st.artifacts = sources
+            _enable_fast_scoring(st)
+            st.build_sec = round(time.perf_counter() - t0, 3)
+            st.built_at  = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+            return st
+
+    st = ServingState(next(_snapshot_ids))
+    st.artifacts = sources
+
+    st.base_graph   = torch.load(GRAPH_PATH, map_location="cpu", weights_only=False)
+    actual_features = st.base_graph.x.shape[1]
+    logger.info("  Graph: %s nodes | %d features", f"{st.base_graph.num_nodes:,}", actual_features)
+    st.adjacency    = LiveAdjacency(_build_adjacency(st.base_graph))
+
+    if NODES_PATH.exists():
+        node_df = pd.read_csv(NODES_PATH)
+        node_df["node_id"] = node_df["node_id"].astype(str)
+        if "community_id" not in node_df.columns:
+            node_df["community_id"] = 0
+        st.node_df    = node_df
+        st.id_map     = {nid: i for i, nid in enumerate(node_df["node_id"])}
+        st.rev_map    = {i: nid for nid, i in st.id_map.items()}
+        st.node_store = NodeAttributeStore.from_frame(node_df, FEATURE_COLS)
+        logger.info(
+            "  Metadata: %s nodes loaded | attribute store %.1f MB",
+            f"{len(node_df):,}", st.node_store.nbytes() / 1e6,
         )
-    logger.info("  Logit cache built for %s nodes", f"{len(_logit_cache):,}")
+        st.community_table = CommunityTable.from_store(st.node_store)
+        st.cluster_report  = _build_cluster_report(st.node_store, st.community_table, st.rev_map)
+        logger.info("  Community table: %s communities", f"{len(st.community_table):,}")
+
+    if st.adjacency is not None and st.node_store is not None and "is_fraud" in st.node_store:
+        st.fraud_exposure = _build_fraud_exposure(st.adjacency.base, st.node_store)
+
+    if NORM_PATH.exists():
+        with open(NORM_PATH) as f:
+            st.norm_params = json.load(f)
+        logger.info("  Norm params loaded (%d features)", len(st.norm_params.get("feature_cols", [])))
+    else:
+        logger.warning("  norm_params.json not found")
+
+    if TX_PATH.exists():
+        df_tx = pd.read_csv(TX_PATH)
+        df_tx["amount"] = pd.to_numeric(df_tx["amount"], errors="coerce").fillna(1.0)
+        st.tx_graph = ArrayDiGraph.from_edges(df_tx["source"], df_tx["target"], df_tx["amount"])
+        logger.info(
+            "  Transaction graph: %s nodes, %s edges (%.1f MB)",
+            f"{len(st.tx_graph):,}", f"{st.tx_graph.number_of_edges():,}",
+            st.tx_graph.nbytes() / 1e6,
+        )
+        _build_network_view(st)
+
+    hidden_ch = 128
+    if META_PATH.exists():
+        with open(META_PATH) as f:
+            st.model_meta = json.load(f)
+        hidden_ch = st.model_meta.get("hidden_channels", 128)
+
+    st.model = MuleHunterGNN(in_channels=actual_features, hidden=hidden_ch)
+    st.model.load_state_dict(torch.load(MODEL_PATH, map_location="cpu", weights_only=True))
+    st.model.eval()
+    _attach_runtime(st)
+
+    _build_logit_cache(st)
+    _compute_new_node_baseline(st)
+    st.inductive = InductiveScorer(
+        st.runtime, st.base_graph.x, st.adjacency, st.node_store, st.norm_params,
+        st.subgraph_cache, hops=INDUCTIVE_HOPS, fanout=INDUCTIVE_FANOUT,
+    )
+    logger.info(
+        "  Inductive scorer ready (%d hops, fan-out %d)", INDUCTIVE_HOPS, INDUCTIVE_FANOUT,
+    )
+    if st.tx_graph is not None:
+        _start_ring_search(st, ring_mode)
+    _enable_fast_scoring(st)
+
+    st.build_sec = round(time.perf_counter() - t0, 3)
+    st.built_at  = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    return st
 
 
 def load_assets() -> None:
-    global model, base_graph, node_df, nx_graph, norm_params, model_meta
-    global id_map, rev_map, _rings_cache, _initialized
+    """Blocking first load; later loads go through reload_assets."""
+    global _state
 
-    if _initialized:
+    if _state is not None:
         return
     with _init_lock:
-        if _initialized:
+        if _state is not None:
             return
-
         logger.info("Initialising MuleHunter AI v3.2...")
-
-        if not MODEL_PATH.exists() or not GRAPH_PATH.exists():
-            logger.error("Required assets missing — run train_model.py first")
+        st = _build_state()
+        if st is None:
             return
+        _state = st
+        logger.info(
+            "MuleHunter AI READY | version=%s | snapshot #%d built in %.1fs",
+            st.version, st.snapshot_id, st.build_sec,
+        )
 
-        base_graph      = torch.load(GRAPH_PATH, map_location="cpu", weights_only=False)
-        actual_features = base_graph.x.shape[1]
-        logger.info("  Graph: %s nodes | %d features", f"{base_graph.num_nodes:,}", actual_features)
-
-        if NODES_PATH.exists():
-            node_df = pd.read_csv(NODES_PATH)
-            node_df["node_id"] = node_df["node_id"].astype(str)
-            if "community_id" not in node_df.columns:
-                node_df["community_id"] = 0
-            id_map  = {nid: i for i, nid in enumerate(node_df["node_id"])}
-            rev_map = {i: nid for nid, i in id_map.items()}
-            logger.info("  Metadata: %s nodes loaded", f"{len(node_df):,}")
-
-        if NORM_PATH.exists():
-            with open(NORM_PATH) as f:
-                norm_params = json.load(f)
-            logger.info("  Norm params loaded (%d features)", len(norm_params.get("feature_cols", [])))
-        else:
-            logger.warning("  norm_params.json not found")
-
-        tx_path = SHARED_DATA / "transactions.csv"
-        if tx_path.exists():
-            df_tx = pd.read_csv(tx_path)
-            df_tx["amount"] = pd.to_numeric(df_tx["amount"], errors="coerce").fillna(1.0)
-            df_tx = df_tx.rename(columns={"amount": "weight"})
-            nx_graph = nx.from_pandas_edgelist(
-                df_tx, source="source", target="target",
-                edge_attr="weight", create_using=nx.DiGraph(),
-            )
-            logger.info("  NetworkX graph: %s edges", f"{nx_graph.number_of_edges():,}")
-
-            account_node_set = set(id_map.keys()) if id_map else set()
-            logger.info("Pre-caching rings (bounded %ds)...", RING_TIMEOUT_SEC)
-            _rings_cache = _precache_rings(nx_graph, account_node_set)
 
-        hidden_ch = 128
-        if META_PATH.exists():
-            with open(META_PATH) as f:
-                model_meta = json.load(f)
-            hidden_ch = model_meta.get("hidden_channels", 128)
+def reload_assets(trigger: str = "manual") -> Dict[str, Any]:
+    """
+    Build a complete new ServingState while the current one keeps serving,
+    then publish it with one assignment.  Requests already holding the old
+    snapshot finish on it; it is freed when the last of them returns.
+
+    Only one build runs at a time — a reload requested while another is in
+    progress returns immediately with ``status: IN_PROGRESS``.  A failed
+    build leaves the current snapshot in place.  Edges ingested through
+    /v1/graph/ingest live in the snapshot they were ingested into, so the
+    new snapshot starts from the artifacts on disk.
+    """
+    global _state, _previous
 
-        model = MuleHunterGNN(in_channels=actual_features, hidden=hidden_ch)
-        model.load_state_dict(torch.load(MODEL_PATH, map_location="cpu", weights_only=True))
-        model.eval()
+    if not _reload_lock.acquire(blocking=False):
+        return {"status": "IN_PROGRESS", **_reload_status}
+    try:
+        _reload_status.update(
+            in_progress=True, trigger=trigger,
+            started_at=datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+        logger.info("Hot reload started (trigger=%s)", trigger)
+        try:
+            st = _build_state()
+            if st is None:
+                raise RuntimeError("required assets missing")
+        except Exception as exc:
+            logger.exception("Hot reload failed — keeping current snapshot")
+            _reload_status["failures"]  += 1
+            _reload_status["last_error"] = str(exc)
+            return {"status": "FAILED", "error": str(exc)}
+
+        with _ingest_lock:      # never swap under a half-applied ingest
+            old, _state = _state, st
+        _previous = old.describe() if old is not None else None
+        if old is not None and old.ring_search is not None:
+            old.ring_search.cancel()
+        _reload_status["reloads"]   += 1
+        _reload_status["last_error"] = None
+        logger.info(
+            "Hot reload done: snapshot #%d (%s) → #%d (%s) | built in %.1fs",
+            old.snapshot_id if old else 0, old.version if old else "-",
+            st.snapshot_id, st.version, st.build_sec,
+        )
+        return {"status": "RELOADED", "current": st.describe(), "previous": _previous}
+    finally:
+        _reload_status["in_progress"] = False
+        _reload_lock.release()
 
-        if base_graph is not None:
-            _build_logit_cache(model, base_graph)
-            _compute_new_node_baseline(model, base_graph)
 
-        _initialized = True
-        ver = model_meta.get("version", "unknown") if model_meta else "unknown"
-        logger.info("MuleHunter AI READY | version=%s", ver)
+def _serving() -> ServingState:
+    """The current snapshot (loading it on first use); 503 without a model."""
+    if _state is None:
+        load_assets()
+    st = _state
+    if st is None or st.model is None:
+        raise HTTPException(503, "Model not loaded")
+    return st
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # INFERENCE CORE
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _compute_new_node_baseline(mdl: MuleHunterGNN, graph: Data) -> None:
-    global _new_node_baseline
-
-    mdl.eval()
-    median_feat = torch.median(graph.x, dim=0).values.unsqueeze(0).float()
+def _compute_new_node_baseline(st: ServingState) -> None:
+    median_feat = torch.median(st.base_graph.x, dim=0).values.unsqueeze(0).float()
 
     with torch.no_grad():
-        identity = mdl.skip(median_feat)
         self_loop = torch.tensor([[0], [0]], dtype=torch.long)
-        x1 = median_feat
-
-        x1 = F.relu(mdl.bn1(mdl.conv1(x1, self_loop)))
-        x1 = F.relu(mdl.bn2(mdl.conv2(x1, self_loop)))
-        x1 = F.relu(mdl.bn3(mdl.conv3(x1, self_loop)))
-
-        embedding = x1 + identity
-        logits    = F.log_softmax(mdl.classifier(embedding), dim=1)
+        logits, embedding = st.runtime(median_feat, self_loop)
         probs     = logits.exp()
 
         baseline_risk = float(probs[0, 1])
         baseline_conf = float(abs(probs[0, 1] - probs[0, 0]))
         baseline_emb  = float(torch.norm(embedding, p=2).item())
 
-    _new_node_baseline = (baseline_risk, baseline_conf, baseline_emb)
+    st.new_node_baseline = (baseline_risk, baseline_conf, baseline_emb)
     logger.info(
         "New-node baseline computed: risk=%.4f  conf=%.4f  emb_norm=%.4f",
         baseline_risk, baseline_conf, baseline_emb,
     )
 
 
-def _infer_known_node(account_id: str) -> tuple[float, float, float]:
-    return _logit_cache[account_id]
-
-
-def _infer_new_node(account_id: str) -> tuple[float, float, float]:
-    if account_id in _unknown_cache:
-        return _unknown_cache[account_id]
+def _infer_known_node(st: ServingState, account_id: str) -> tuple[float, float, float]:
+    return st.logit_table.row(st.id_map[account_id])
+
+
+def _unseen_links(st: ServingState, account_id: str) -> Optional[UnseenLinks]:
+    """Known counterparties of an account that is not in the trained graph."""
+    out_edges: Dict[str, float] = {}
+    in_edges:  Dict[str, float] = {}
+    if st.tx_graph is not None and account_id in st.tx_graph:
+        out_edges.update(st.tx_graph.out_items(account_id))
+        in_edges.update(st.tx_graph.in_items(account_id))
+    out_edges.update(st.live_out.get(account_id, {}))
+    in_edges.update(st.live_in.get(account_id, {}))
+
+    id_map    = st.id_map
+    out_known = [(id_map[v], w) for v, w in out_edges.items() if v in id_map]
+    in_known  = [(id_map[u], w) for u, w in in_edges.items() if u in id_map]
+    if not out_known and not in_known:
+        return None
+    return UnseenLinks(
+        [i for i, _ in out_known], [w for _, w in out_known],
+        [i for i, _ in in_known],  [w for _, w in in_known],
+    )
 
-    if _new_node_baseline is not None:
-        base_risk, base_conf, base_emb = _new_node_baseline
-    else:
-        base_risk, base_conf, base_emb = 0.25, 0.10, 1.0
-
-    mlp_risk = base_risk
-    conf     = base_conf
-    embnm    = base_emb
-
-    if nx_graph is not None and nx_graph.has_node(account_id):
-        nb_scores = [
-            _logit_cache[nb][0]
-            for nb in (list(nx_graph.predecessors(account_id)) +
-                       list(nx_graph.successors(account_id)))
-            if nb in _logit_cache
-        ]
-        if nb_scores:
-            nb_mean  = float(np.mean(nb_scores))
-            nb_max   = float(np.max(nb_scores))
-            mlp_risk = float(np.clip(
-                0.70 * mlp_risk + 0.20 * nb_mean + 0.10 * nb_max,
-                0.0, 1.0,
-            ))
 
-    mlp_risk = min(mlp_risk, NEW_ACCOUNT_SCORE_CAP)
+def _infer_new_nodes(st: ServingState, account_ids: List[str]) -> List[tuple[float, float, float]]:
+    """
+    Score a group of unseen accounts (one entry per id, in order).
 
-    result = (mlp_risk, conf, embnm)
-    if len(_unknown_cache) >= UNKNOWN_NODE_CACHE_MAX:
-        _unknown_cache.pop(next(iter(_unknown_cache)))
-    _unknown_cache[account_id] = result
-    return result
+    Accounts with known counterparties run through the inductive scorer —
+    all of them in one forward pass over their k-hop subgraphs.  Accounts
+    with no links get the median-feature baseline.  Results are memoized
+    in the snapshot's ``unknown_cache``; concurrent cold misses for the same
+    account share one computation through ``score_flight``.
+    """
+    results: List[Optional[tuple[float, float, float]]] = [
+        st.unknown_cache.get(a) for a in account_ids
+    ]
+    todo = list(dict.fromkeys(a for a, r in zip(account_ids, results) if r is None))
+    if not todo:
+        return results
+
+    scored = dict(zip(todo, st.score_flight.do_many(
+        [("unseen", a) for a in todo],
+        lambda keys: _score_unseen(st, [a for _, a in keys]),
+    )))
+    return [r if r is not None else scored[a] for a, r in zip(account_ids, results)]
+
+
+def _score_unseen(st: ServingState, account_ids: List[str]) -> List[tuple[float, float, float]]:
+    """The uncached part of ``_infer_new_nodes`` — distinct ids, filling the cache."""
+    results: List[Optional[tuple[float, float, float]]] = [None] * len(account_ids)
+    inductive = st.inductive
+    linked    = []
+    if inductive is not None:
+        for i, a in enumerate(account_ids):
+            links = _unseen_links(st, a)
+            if links is not None:
+                linked.append((i, links))
+    if linked:
+        scored = inductive.score([links for _, links in linked])
+        for (i, _), (risk, conf, emb) in zip(linked, scored):
+            results[i] = (min(risk, NEW_ACCOUNT_SCORE_CAP), conf, emb)
+
+    base_risk, base_conf, base_emb = st.new_node_baseline or (0.25, 0.10, 1.0)
+    baseline = (min(base_risk, NEW_ACCOUNT_SCORE_CAP), base_conf, base_emb)
+    for i, a in enumerate(account_ids):
+        if results[i] is None:
+            results[i] = baseline
+        st.unknown_cache.put(a, results[i])
+    return results
+
+
+def _infer_new_node(st: ServingState, account_id: str) -> tuple[float, float, float]:
+    return _infer_new_nodes(st, [account_id])[0]
+
+
+def _node_exposure(fraud_exposure: FraudExposureIndex, idx: int) -> tuple[int, int, int, float]:
+    """(fraud successors, 1-hop fraud, 2-hop fraud, 2-hop fraud density)."""
+    exp       = fraud_exposure.exposure(np.array([idx]))
+    two_fraud = int(exp["two_hop_fraud"][0])
+    two_total = int(exp["two_hop_total"][0])
+    return (
+        int(exp["fraud_successors"][0]),
+        int(exp["fraud_neighbours"][0]),
+        two_fraud,
+        round(two_fraud / two_total, 4) if two_total else 0.0,
+    )
 
 
-def _score_account(account_id: str) -> tuple[float, float, float]:
-    if account_id in _logit_cache:
-        return _infer_known_node(account_id)
-    return _infer_new_node(account_id)
+def _score_account(st: ServingState, account_id: str) -> tuple[float, float, float]:
+    if account_id in st.id_map:
+        _logit_lookups["hit"].inc()
+        return _infer_known_node(st, account_id)
+    _logit_lookups["miss"].inc()
+    return _infer_new_node(st, account_id)
 
 
 def _blend_src_tgt(
+    st:     ServingState,
     src_id: str,
     tgt_id: Optional[str],
 ) -> tuple[float, float, float, bool]:
-    src_risk, src_conf, src_emb = _score_account(src_id)
-    is_known_src = src_id in _logit_cache
+    src_risk, src_conf, src_emb = _score_account(st, src_id)
+    is_known_src = src_id in st.id_map
 
     if tgt_id and tgt_id != src_id:
-        tgt_risk, _, _ = _score_account(tgt_id)
+        tgt_risk, _, _ = _score_account(st, tgt_id)
         blended = float(np.clip(
             0.80 * src_risk + 0.20 * tgt_risk,
             max(src_risk, tgt_risk * 0.50),
@@ -579,6 +1284,176 @@ def _blend_src_tgt(
     return src_risk, src_conf, src_emb, is_known_src
 
 
+def _score_accounts(
+    st:          ServingState,
+    account_ids: List[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorised ``_score_account``: (risk, confidence, emb_norm, is_known)
+    arrays aligned with ``account_ids``.  Known accounts are a single fancy
+    index into the logit table; unknown ones are scored as one group.
+    """
+    n      = len(account_ids)
+    id_map = st.id_map
+    idx    = np.fromiter((id_map.get(a, -1) for a in account_ids), dtype=np.int64, count=n)
+    known = idx >= 0
+    hits  = int(np.count_nonzero(known))
+    _logit_lookups["hit"].inc(hits)
+    _logit_lookups["miss"].inc(n - hits)
+    risk  = np.zeros(n)
+    conf  = np.zeros(n)
+    emb   = np.zeros(n)
+    if known.any():
+        table = st.logit_table.rows(idx[known])
+        risk[known], conf[known], emb[known] = table[:, 0], table[:, 1], table[:, 2]
+
+    unknown = np.flatnonzero(~known)
+    if len(unknown):
+        scored = _infer_new_nodes(st, [account_ids[i] for i in unknown])
+        risk[unknown], conf[unknown], emb[unknown] = (np.array(c) for c in zip(*scored))
+    return risk, conf, emb, known
+
+
+def _blend_src_tgt_batch(
+    st:      ServingState,
+    src_ids: List[str],
+    tgt_ids: List[Optional[str]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorised ``_blend_src_tgt``.  Every distinct account is scored once.
+
+    Returns (blended, src_conf, src_emb, src_known, tgt_risk) where
+    tgt_risk is NaN for rows without a target.
+    """
+    accounts = list(dict.fromkeys(src_ids + [t for t in tgt_ids if t]))
+    pos      = {a: i for i, a in enumerate(accounts)}
+    risk, conf, emb, known = _score_accounts(st, accounts)
+
+    n       = len(src_ids)
+    s       = np.fromiter((pos[a] for a in src_ids), dtype=np.int64, count=n)
+    has_tgt = np.fromiter((bool(t) for t in tgt_ids), dtype=bool, count=n)
+    t       = np.fromiter((pos[t] if t else 0 for t in tgt_ids), dtype=np.int64, count=n)
+    blend   = has_tgt & (s != t)
+
+    src_risk = risk[s]
+    tgt_risk = np.where(has_tgt, risk[t], np.nan)
+    tgt_or_0 = np.where(blend, tgt_risk, 0.0)
+    blended  = np.where(
+        blend,
+        np.clip(0.80 * src_risk + 0.20 * tgt_or_0, np.maximum(src_risk, tgt_or_0 * 0.50), 1.0),
+        src_risk,
+    )
+    return blended, conf[s], emb[s], known[s], tgt_risk
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# LIVE INGESTION
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _add_live_edge(st: ServingState, src: str, dst: str, amount: float) -> None:
+    # Readers only ever see a complete inner dict (last amount wins, as in
+    # the transaction graph built at startup).
+    out = dict(st.live_out.get(src, {}))
+    out[dst] = amount
+    st.live_out[src] = out
+    inn = dict(st.live_in.get(dst, {}))
+    inn[src] = amount
+    st.live_in[dst] = inn
+
+
+def ingest_transactions(edges: List[tuple[str, str, float]]) -> dict:
+    """
+    Append (source, target, amount) transactions to the current snapshot's
+    serving graph and refresh the logits they can change.
+
+    Edges between two known accounts go into the adjacency's delta; the
+    build-time CSR is not rebuilt (the delta is folded back once it holds
+    INGEST_MERGE_EDGES edges).  A new edge u → v changes the embedding of
+    v and of everything within INDUCTIVE_HOPS - 1 out-hops of v (SAGE →
+    GAT → SAGE has a 3-hop receptive field), so exactly that set is
+    re-scored, by a forward pass over its own receptive field, and only
+    those rows of the logit table are replaced.  Fraud-exposure counts
+    change for the edges' endpoints only, and the inductive scorer keeps
+    its state apart from the cached fields that read the new edges.  Edges
+    that touch an unseen account are kept as live links for the inductive
+    scorer.  The results are published together as a new snapshot copy
+    (``ServingState.with_graph``); requests already running finish on the
+    one they started with.  Ring and community precomputes are not
+    refreshed.
+    """
+    global _state
+
+    t0 = time.perf_counter()
+    src_idx: List[int]   = []
+    dst_idx: List[int]   = []
+    amounts: List[float] = []
+    unseen   = 0
+    affected = np.zeros(0, dtype=np.int64)
+
+    with _ingest_lock:
+        st = _serving()
+        id_map = st.id_map
+        for src, dst, amount in edges:
+            if src in id_map and dst in id_map:
+                src_idx.append(id_map[src])
+                dst_idx.append(id_map[dst])
+                amounts.append(float(amount))
+            else:
+                _add_live_edge(st, src, dst, float(amount))
+                unseen += 1
+
+        adj, table, exposure, inductive = st.adjacency, st.logit_table, st.fraud_exposure, st.inductive
+        if src_idx and adj is not None:
+            src_arr = np.array(src_idx, dtype=np.int64)
+            dst_arr = np.array(dst_idx, dtype=np.int64)
+            weights = amounts if getattr(st.base_graph, "edge_weight", None) is not None else None
+            before  = adj
+            adj     = before.with_edges(src_arr, dst_arr, weights)
+
+            affected = adj.downstream(dst_arr, INDUCTIVE_HOPS - 1)
+            fresh    = subgraph_forward(st.runtime, st.base_graph.x, adj, affected, INDUCTIVE_HOPS)
+            table    = table.with_rows(affected, fresh)
+            if exposure is not None:
+                exposure = exposure.with_edges(before, src_arr, dst_arr)
+            if inductive is not None:
+                inductive = inductive.with_adjacency(adj, np.unique(dst_arr))
+
+            if adj.delta_edges >= INGEST_MERGE_EDGES:
+                merged = adj.merged()
+                adj    = LiveAdjacency(merged)
+                if exposure is not None:
+                    exposure = FraudExposureIndex(merged, exposure.mask)
+                if inductive is not None:
+                    inductive = inductive.with_adjacency(adj)
+                logger.info("Ingest delta folded into the CSR (%s edges)", f"{merged.num_edges:,}")
+            if table.refreshed >= INGEST_MERGE_EDGES:
+                table = table.compacted()
+
+        if src_idx or unseen:
+            st = st.with_graph(adj, table, exposure, inductive)
+            _state = st
+
+        _ingest_stats["batches"]         += 1
+        _ingest_stats["edges"]           += len(edges)
+        _ingest_stats["graph_edges"]     += len(src_idx)
+        _ingest_stats["unseen_edges"]    += unseen
+        _ingest_stats["nodes_refreshed"] += len(affected)
+
+    latency = (time.perf_counter() - t0) * 1_000
+    logger.info(
+        "Ingested %d tx (%d graph, %d unseen) | %d logits refreshed | %.1f ms",
+        len(edges), len(src_idx), unseen, len(affected), latency,
+    )
+    return {
+        "received":        len(edges),
+        "graph_edges":     len(src_idx),
+        "unseen_edges":    unseen,
+        "nodes_refreshed": int(len(affected)),
+        "total_edges":     st.adjacency.num_edges if st.adjacency is not None else 0,
+        "latency_ms":      round(latency, 2),
+    }
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # AMOUNT ADJUSTMENT
 # ──────────────────────────────────────────────────────────────────────────────
@@ -626,15 +1501,67 @@ def _transaction_adjusted_risk(base_risk: float, amount: float) -> float:
     return float(np.clip(blended, 0.0, 1.0))
 
 
+# Same bands as _transaction_adjusted_risk, for searchsorted(side="right")
+_AMOUNT_BAND_EDGES   = np.array([100, 500, 2_000, 10_000, 1_00_000, 10_00_000], dtype=np.float64)
+_AMOUNT_BAND_WEIGHTS = np.array([0.40, 0.55, 0.75, 0.90, 1.00, 1.10, 1.20])
+_AMOUNT_FLOOR_EDGES  = np.array(
+    [HIGH_AMOUNT_FLOOR_THRESHOLD, VERY_HIGH_AMOUNT_THRESHOLD, CRORE_THRESHOLD], dtype=np.float64,
+)
+_AMOUNT_FLOORS       = np.array(
+    [0.0, HIGH_AMOUNT_FLOOR_SCORE, VERY_HIGH_AMOUNT_FLOOR, CRORE_FLOOR],
+)
+
+
+def _transaction_adjusted_risk_batch(base_risk: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+    """Array form of ``_transaction_adjusted_risk`` (identical results)."""
+    base = np.asarray(base_risk, dtype=np.float64)
+    amt  = np.maximum(0.0, np.asarray(amounts, dtype=np.float64))
+
+    weight  = _AMOUNT_BAND_WEIGHTS[np.searchsorted(_AMOUNT_BAND_EDGES, amt, side="right")]
+    weight  = np.where(amt <= 0, 0.30, weight)
+    blended = np.maximum(base * 0.35, base * weight)
+    blended = np.maximum(blended, _AMOUNT_FLOORS[np.searchsorted(_AMOUNT_FLOOR_EDGES, amt, side="right")])
+    return np.clip(blended, 0.0, 1.0)
+
+
+def _context_blend_batch(raw: np.ndarray, requests: List[GnnScoreRequest]) -> np.ndarray:
+    """Blend Spring Boot context features into the raw GNN score, per row."""
+    def _col(get) -> np.ndarray:
+        return np.fromiter((get(r) for r in requests), dtype=np.float64, count=len(requests))
+
+    two_hop  = _col(lambda r: r.graphFeatures.twoHopFraudDensity)
+    susp     = _col(lambda r: r.graphFeatures.suspiciousNeighborCount)
+    connect  = _col(lambda r: r.graphFeatures.connectivityScore)
+    velocity = _col(lambda r: r.behaviorFeatures.velocity)
+    burst    = _col(lambda r: r.behaviorFeatures.burst)
+    device   = _col(lambda r: r.identityFeatures.deviceReuse)
+    ip       = _col(lambda r: r.identityFeatures.ipReuse)
+
+    has_context = (
+        (susp > 0) | (two_hop > 0) | (connect > 0)
+        | (velocity > 0) | (burst > 0) | (device > 0) | (ip > 0)
+    )
+    blended = np.clip(
+        0.68 * raw
+        + 0.16 * np.clip(two_hop, 0.0, 1.0)
+        + 0.08 * np.minimum(1.0, susp / 10.0)
+        + 0.04 * np.clip(velocity, 0.0, 1.0)
+        + 0.02 * np.clip(burst, 0.0, 1.0)
+        + 0.01 * np.minimum(1.0, device / 10.0)
+        + 0.01 * np.minimum(1.0, ip / 10.0),
+        0.0, 1.0,
+    )
+    return np.where(has_context, blended, raw)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # EXPLAINABILITY HELPERS
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _get_node_features(account_id: str) -> dict:
-    if node_df is None or account_id not in id_map:
+def _get_node_features(st: ServingState, account_id: str) -> dict:
+    if st.node_store is None or account_id not in st.id_map:
         return {}
-    r = node_df.iloc[id_map[account_id]]
-    return {col: float(r[col]) for col in FEATURE_COLS if col in r.index}
+    return st.node_store.features(st.id_map[account_id])
 
 
 def _build_risk_factors(features: dict, risk: float) -> List[str]:
@@ -657,40 +1584,88 @@ def _risk_level_int(score: float, threshold: float) -> int:
     return 2 if score >= min(0.95, threshold + 0.15) else 1 if score >= threshold else 0
 
 
+def _risk_level_int_batch(scores: np.ndarray, threshold: float) -> np.ndarray:
+    return np.where(
+        scores >= min(0.95, threshold + 0.15), 2, np.where(scores >= threshold, 1, 0),
+    )
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # RING TOPOLOGY HELPERS
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _classify_ring_shape(ring_nodes: list, g: nx.DiGraph) -> str:
+def _classify_ring_shape(ring_nodes: list, succ: List[List[int]]) -> str:
+    """``succ`` is the ring's induced adjacency (positions within ``ring_nodes``)."""
     if len(ring_nodes) < 3:
         return "CYCLE"
-    sub     = g.subgraph(ring_nodes)
-    n       = len(ring_nodes)
-    max_deg = max((sub.out_degree(nd) for nd in ring_nodes), default=0)
-    density = sub.number_of_edges() / max(n * (n - 1), 1)
+    n        = len(ring_nodes)
+    out_degs = [len(nbrs) for nbrs in succ]
+    max_deg  = max(out_degs, default=0)
+    density  = sum(out_degs) / max(n * (n - 1), 1)
     if max_deg >= n * 0.6:
         return "STAR"
     if density >= 0.6:
         return "DENSE_CLUSTER"
-    if sum(1 for nd in ring_nodes if sub.out_degree(nd) <= 1) >= n * 0.4:
+    if sum(1 for d in out_degs if d <= 1) >= n * 0.4:
         return "CHAIN"
     return "CYCLE"
 
 
-def _classify_role(account_id: str, ring_nodes: list, g: nx.DiGraph) -> tuple[str, str]:
-    if not g.has_node(account_id) or len(ring_nodes) < 2:
-        return "MULE", (ring_nodes[0] if ring_nodes else account_id)
-    sub      = g.subgraph(ring_nodes)
-    out_degs = {nd: sub.out_degree(nd) for nd in ring_nodes}
-    hub      = max(out_degs, key=out_degs.get)
-    try:
-        bc     = nx.betweenness_centrality(sub)
-        avg_bc = sum(bc.values()) / max(len(bc), 1)
-        if bc.get(account_id, 0) > avg_bc * 2.0 and account_id != hub:
-            return "BRIDGE", hub
-    except Exception:
-        pass
-    return ("HUB", hub) if account_id == hub else ("MULE", hub)
+def _betweenness(succ: List[List[int]]) -> List[float]:
+    """
+    Normalised directed betweenness centrality of a small graph given as
+    adjacency lists — Brandes' algorithm with the same traversal and
+    accumulation order as ``nx.betweenness_centrality``, so scores match it
+    exactly.
+    """
+    n  = len(succ)
+    bc = [0.0] * n
+    for s in range(n):
+        stack: List[int] = []
+        preds: List[List[int]] = [[] for _ in range(n)]
+        sigma = [0.0] * n
+        dist  = [-1] * n
+        sigma[s], dist[s] = 1.0, 0
+        queue = deque([s])
+        while queue:
+            v = queue.popleft()
+            stack.append(v)
+            for w in succ[v]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    queue.append(w)
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+                    preds[w].append(v)
+        delta = [0.0] * n
+        while stack:
+            w     = stack.pop()
+            coeff = (1 + delta[w]) / sigma[w]
+            for v in preds[w]:
+                delta[v] += sigma[v] * coeff
+            if w != s:
+                bc[w] += delta[w]
+    if n > 2:
+        scale = 1 / ((n - 1) * (n - 2))
+        bc    = [b * scale for b in bc]
+    return bc
+
+
+def _classify_roles(ring_nodes: list, succ: List[List[int]]) -> tuple[str, Dict[str, str]]:
+    """Return (hub account, member → HUB / BRIDGE / MULE) for one ring."""
+    roles = {nd: "MULE" for nd in ring_nodes}
+    if len(ring_nodes) < 2:
+        return (ring_nodes[0] if ring_nodes else ""), roles
+    out_degs = [len(nbrs) for nbrs in succ]
+    hub_pos  = out_degs.index(max(out_degs))
+    hub      = ring_nodes[hub_pos]
+    bc       = _betweenness(succ)
+    avg_bc   = sum(bc) / max(len(bc), 1)
+    for k, nd in enumerate(ring_nodes):
+        if k != hub_pos and bc[k] > avg_bc * 2.0:
+            roles[nd] = "BRIDGE"
+    roles[hub] = "HUB"
+    return hub, roles
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -700,7 +1675,17 @@ def _classify_role(account_id: str, ring_nodes: list, g: nx.DiGraph) -> tuple[st
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     load_assets()
+    if _artifact_watcher is not None:
+        _artifact_watcher.start()
     yield
+    if _artifact_watcher is not None:
+        _artifact_watcher.stop()
+    if _score_batcher is not None:
+        _score_batcher.shutdown()
+    if _ingest_executor is not None:
+        _ingest_executor.shutdown(wait=False)
+    if _state is not None and _state.ring_search is not None:
+        _state.ring_search.cancel()
 
 
 app = FastAPI(
@@ -721,18 +1706,34 @@ app.add_middleware(
 
 @app.get("/health")
 def health() -> dict:
-    if _initialized and model is not None:
+    st = _state
+    if st is not None and st.model is not None:
+        meta = st.model_meta or {}
         return {
             "status":               "HEALTHY",
             "model_loaded":         True,
-            "nodes_count":          base_graph.num_nodes if base_graph else 0,
+            "nodes_count":          st.base_graph.num_nodes if st.base_graph else 0,
             "gnn_endpoint":         "/v1/gnn/score",
-            "version":              model_meta.get("version", "unknown") if model_meta else "unknown",
-            "test_f1":              model_meta.get("test_f1",  0.0) if model_meta else 0.0,
-            "test_auc":             model_meta.get("test_auc", 0.0) if model_meta else 0.0,
-            "optimal_threshold":    model_meta.get("optimal_threshold", 0.5) if model_meta else 0.5,
-            "rings_cached":         len(_rings_cache),
-            "logit_cache_size":     len(_logit_cache),
+            "version":              st.version,
+            "test_f1":              meta.get("test_f1",  0.0),
+            "test_auc":             meta.get("test_auc", 0.0),
+            "optimal_threshold":    meta.get("optimal_threshold", 0.5),
+            "rings_cached":         len(st.rings_cache),
+            "readiness":            st.readiness(),
+            "score_encoding":       st.score_encoding,
+            "single_flight":        st.score_flight.stats(),
+            "logit_cache_size":     len(st.logit_table) if st.logit_table is not None else 0,
+            "model_runtime":        st.runtime_meta,
+            "snapshot": {
+                "current":  st.describe(),
+                "previous": _previous,
+                "reload":   dict(_reload_status),
+                "watcher":  _artifact_watcher.stats() if _artifact_watcher else None,
+            },
+            "caches":               cache_stats(st.caches()),
+            "embedding_index":      st.embedding_index.stats() if st.embedding_index else None,
+            "score_batching":       _score_batcher.stats() if _score_batcher else None,
+            "ingest":               dict(_ingest_stats),
             "low_amount_cap_inr":   LOW_AMOUNT_HARD_CAP,
             "low_amount_score_cap": LOW_AMOUNT_SCORE_CAP,
         }
@@ -747,267 +1748,436 @@ def metrics() -> dict:
         return json.load(f)
 
 
+@app.get("/metrics/runtime", response_class=PlainTextResponse)
+def metrics_runtime() -> PlainTextResponse:
+    """
+    Prometheus text exposition of the hot-path telemetry: per-stage and
+    end-to-end latency histograms, request / lookup counters, and the
+    serving caches' counters (which restart with each snapshot).
+    """
+    extra: List[str] = []
+    st = _state
+    if st is not None:
+        stats = cache_stats(st.caches())
+        for key, kind in (("hits", "counter"), ("misses", "counter"),
+                          ("evictions", "counter"), ("size", "gauge")):
+            name = f"mulehunter_cache_{key}" + ("_total" if kind == "counter" else "")
+            extra.append(format_family(
+                name, kind, f"Serving cache {key}, by cache.",
+                (({"cache": cache}, c[key]) for cache, c in stats.items()),
+            ))
+    if _score_batcher is not None:
+        batching = _score_batcher.stats()
+        extra.append(format_family(
+            "mulehunter_score_batches_total", "counter", "Micro-batches scored by /v1/gnn/score.",
+            [({}, batching["batches"])],
+        ))
+        extra.append(format_family(
+            "mulehunter_score_batch_items_total", "counter", "Requests scored in micro-batches.",
+            [({}, batching["items"])],
+        ))
+    return PlainTextResponse(
+        _metrics.render(extra), media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.post("/analyze-transaction", response_model=RiskResponse)
 def analyze(tx: TransactionRequest) -> RiskResponse:
-    if not _initialized:
-        load_assets()
-    if model is None:
-        raise HTTPException(503, "Model not loaded")
+    t0_ns = time.perf_counter_ns()
+    _requests["analyze"].inc()
+    try:
+        return _analyze(_serving(), tx)
+    finally:
+        _request_latency["analyze"].record(time.perf_counter_ns() - t0_ns)
+
 
+def _analyze(st: ServingState, tx: TransactionRequest) -> RiskResponse:
+    tm  = _metrics.timer("analyze")
     t0  = time.perf_counter()
     src = str(tx.source_id)
     tgt = str(tx.target_id)
 
-    raw_risk, conf, _, is_known_src = _blend_src_tgt(src, tgt)
+    raw_risk, conf, _, is_known_src = _blend_src_tgt(st, src, tgt)
     risk      = _transaction_adjusted_risk(raw_risk, tx.amount)
-    features  = _get_node_features(src)
-    threshold = float(model_meta.get("optimal_threshold", 0.5)) if model_meta else 0.5
+    tm.lap("blend")
+    features  = _get_node_features(st, src)
+    threshold = st.threshold
     latency   = (time.perf_counter() - t0) * 1_000
 
     level   = _risk_level_int(risk, threshold)
     verdict = ["SAFE", "SUSPICIOUS", "CRITICAL - MULE ACCOUNT"][level]
+    tm.lap("node_metadata")
 
     linked: List[str] = []
-    if nx_graph and src in nx_graph:
-        linked = [str(n) for n in list(nx_graph.successors(src))[:10]]
-
     out_deg = in_deg = 0
-    if src in id_map:
-        idx     = id_map[src]
-        out_deg = int((base_graph.edge_index[0] == idx).sum())
-        in_deg  = int((base_graph.edge_index[1] == idx).sum())
-
-    return RiskResponse(
+    adjacency = st.adjacency
+    if adjacency is not None and src in st.id_map:
+        idx      = st.id_map[src]
+        out_deg  = adjacency.out_degree(idx)
+        in_deg   = adjacency.in_degree(idx)
+        # Distinct counterparties in first-transaction order, as DiGraph.successors
+        succ     = adjacency.successors(idx)
+        _, first = np.unique(succ, return_index=True)
+        linked   = [st.rev_map[int(j)] for j in succ[np.sort(first)[:10]]]
+    elif st.tx_graph and src in st.tx_graph:
+        linked = st.tx_graph.successors(src)[:10]
+    tm.lap("network_metrics")
+
+    risk_factors = _build_risk_factors(features, risk)
+    tm.lap("risk_factors")
+
+    response = RiskResponse(
         node_id            =src,
         risk_score         =round(risk, 4),
         verdict            =verdict,
         risk_level         =level,
-        risk_factors       =_build_risk_factors(features, risk),
+        risk_factors       =risk_factors,
         out_degree         =out_deg,
         in_degree          =in_deg,
         community_risk     =round(features.get("community_fraud_rate", 0.0), 4),
         ring_detected      =features.get("ring_membership", 0.0) > 0,
         network_centrality =round(features.get("pagerank", 0.0), 6),
         linked_accounts    =linked,
-        population_size    =base_graph.num_nodes if base_graph else 0,
+        population_size    =st.base_graph.num_nodes if st.base_graph else 0,
         latency_ms         =round(latency, 2),
-        model_version      =model_meta.get("version", "unknown") if model_meta else "unknown",
+        model_version      =st.version,
     )
+    tm.lap("serialization")
+    return response
 
 
-@app.post("/analyze-batch")
-def analyze_batch(req: BatchRequest) -> dict:
-    if not _initialized:
-        load_assets()
-    if model is None:
-        raise HTTPException(503, "Model not loaded")
+# ──────────────────────────────────────────────────────────────────────────────
+# BATCH ENGINE
+# ──────────────────────────────────────────────────────────────────────────────
 
-    threshold = float(model_meta.get("optimal_threshold", 0.5)) if model_meta else 0.5
-    results   = []
+_BATCH_VERDICTS = ("SAFE", "SUSPICIOUS", "CRITICAL")
 
-    for tx in req.transactions[:100]:
-        try:
-            t0  = time.perf_counter()
-            src = str(tx.source_id)
-            tgt = str(tx.target_id)
-            raw_risk, _, _, _ = _blend_src_tgt(src, tgt)
-            risk    = _transaction_adjusted_risk(raw_risk, tx.amount)
-            lat     = (time.perf_counter() - t0) * 1_000
-            level   = _risk_level_int(risk, threshold)
-            verdict = ["SAFE", "SUSPICIOUS", "CRITICAL"][level]
-            results.append({
-                "source_id":  src,
-                "target_id":  tgt,
-                "risk_score": round(risk, 4),
-                "verdict":    verdict,
-                "latency_ms": round(lat, 2),
-            })
-        except Exception as exc:
-            results.append({"source_id": str(tx.source_id), "error": str(exc)})
 
+def _analyze_one(st: ServingState, tx: TransactionRequest) -> dict:
+    """Scalar fallback for a single transaction (used when a chunk fails)."""
+    t0  = time.perf_counter()
+    src = str(tx.source_id)
+    tgt = str(tx.target_id)
+    try:
+        raw_risk, _, _, _ = _blend_src_tgt(st, src, tgt)
+        risk = _transaction_adjusted_risk(raw_risk, tx.amount)
+    except Exception as exc:
+        return {"source_id": src, "error": str(exc)}
+    return {
+        "source_id":  src,
+        "target_id":  tgt,
+        "risk_score": round(risk, 4),
+        "verdict":    _BATCH_VERDICTS[_risk_level_int(risk, st.threshold)],
+        "latency_ms": round((time.perf_counter() - t0) * 1_000, 2),
+    }
+
+
+def _analyze_chunk(st: ServingState, txs: List[TransactionRequest]) -> List[dict]:
+    """
+    Score one chunk of transactions in a single vectorised pass.
+
+    Ids are resolved to logit-array rows once for the whole chunk, then the
+    src/tgt blend, the amount curve and the risk level are array operations.
+    ``latency_ms`` is the chunk time amortised over its transactions.  If the
+    pass fails, the chunk is re-scored item by item so one bad transaction
+    only errors itself.
+    """
+    if not txs:
+        return []
+    _batch_transactions.inc(len(txs))
+    tm  = _metrics.timer("analyze_batch")
+    t0  = time.perf_counter()
+    src = [str(tx.source_id) for tx in txs]
+    tgt = [str(tx.target_id) for tx in txs]
+    try:
+        raw, _, _, _, _ = _blend_src_tgt_batch(st, src, tgt)
+        risk   = _transaction_adjusted_risk_batch(
+            raw, np.fromiter((tx.amount for tx in txs), dtype=np.float64, count=len(txs)),
+        )
+        levels = _risk_level_int_batch(risk, st.threshold)
+    except Exception:
+        logger.exception("Vectorised batch pass failed — re-scoring %d tx individually", len(txs))
+        return [_analyze_one(st, tx) for tx in txs]
+    tm.lap("blend")
+
+    lat = round((time.perf_counter() - t0) * 1_000 / len(txs), 2)
+    results = [
+        {
+            "source_id":  s_id,
+            "target_id":  t_id,
+            "risk_score": round(r, 4),
+            "verdict":    _BATCH_VERDICTS[lv],
+            "latency_ms": lat,
+        }
+        for s_id, t_id, r, lv in zip(src, tgt, risk.tolist(), levels.tolist())
+    ]
+    tm.lap("serialization")
+    return results
+
+
+def _is_flagged(result: dict) -> bool:
+    return result.get("verdict") in ("CRITICAL", "SUSPICIOUS")
+
+
+def _ndjson(obj: dict) -> bytes:
+    return (json.dumps(obj) + "\n").encode()
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body iterator reads the request body as it goes.
+
+    The stock class listens for ``http.disconnect`` on ``receive`` while
+    streaming, which races ``request.stream()`` for the body messages.  Here
+    the body iterator is the only reader; a client disconnect surfaces as
+    ``ClientDisconnect`` from ``request.stream()`` and ends the stream.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+
+
+@app.post("/analyze-batch")
+def analyze_batch(req: BatchRequest, stream: bool = False):
+    """
+    Bulk transaction scoring, no size cap.
+
+    Transactions are scored in chunks of ANALYZE_BATCH_CHUNK.  By default the
+    response is the usual ``{count, flagged, results}`` object; with
+    ``?stream=true`` results are streamed as NDJSON, one chunk at a time,
+    followed by a final ``{"count": …, "flagged": …}`` summary line.  The
+    whole batch is scored on the snapshot current when the request arrived.
+    """
+    t0_ns = time.perf_counter_ns()
+    _requests["analyze_batch"].inc()
+    st    = _serving()
+    txs   = req.transactions
+    chunk = max(1, ANALYZE_BATCH_CHUNK)
+
+    if stream:
+        def _lines():
+            count = flagged = 0
+            for i in range(0, len(txs), chunk):
+                results  = _analyze_chunk(st, txs[i:i + chunk])
+                count   += len(results)
+                flagged += sum(map(_is_flagged, results))
+                yield b"".join(_ndjson(r) for r in results)
+            yield _ndjson({"count": count, "flagged": flagged})
+            _request_latency["analyze_batch"].record(time.perf_counter_ns() - t0_ns)
+
+        return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+    results: List[dict] = []
+    for i in range(0, len(txs), chunk):
+        results.extend(_analyze_chunk(st, txs[i:i + chunk]))
+    _request_latency["analyze_batch"].record(time.perf_counter_ns() - t0_ns)
     return {
         "count":   len(results),
-        "flagged": sum(1 for r in results if r.get("verdict") in ("CRITICAL", "SUSPICIOUS")),
+        "flagged": sum(map(_is_flagged, results)),
         "results": results,
     }
 
 
+@app.post("/analyze-batch/ndjson")
+async def analyze_batch_ndjson(request: Request) -> _DuplexStreamingResponse:
+    """
+    Streaming backfill endpoint: the body is NDJSON, one TransactionRequest
+    per line, and the response is NDJSON in the same order.
+
+    The body is consumed incrementally and scored ANALYZE_BATCH_CHUNK lines at
+    a time, so memory stays flat regardless of input size.  A line that fails
+    validation yields ``{"line": n, "error": …}`` in its place; the stream
+    ends with a ``{"count": …, "flagged": …, "errors": …}`` summary line.
+    """
+    t0_ns = time.perf_counter_ns()
+    _requests["analyze_batch_ndjson"].inc()
+    if _state is None:
+        await run_in_threadpool(load_assets)
+    st    = _serving()
+    chunk = max(1, ANALYZE_BATCH_CHUNK)
+
+    async def _lines():
+        count = flagged = errors = line_no = 0
+        pending: List[Any] = []          # TransactionRequest or error dict, in order
+        buf = b""
+
+        async def _flush():
+            nonlocal count, flagged
+            txs      = [p for p in pending if isinstance(p, TransactionRequest)]
+            scored   = iter(await run_in_threadpool(_analyze_chunk, st, txs))
+            out      = [next(scored) if isinstance(p, TransactionRequest) else p for p in pending]
+            count   += len(txs)
+            flagged += sum(map(_is_flagged, out))
+            pending.clear()
+            return b"".join(_ndjson(r) for r in out)
+
+        def _parse(raw: bytes) -> None:
+            nonlocal errors, line_no
+            line_no += 1
+            if not raw.strip():
+                return
+            try:
+                pending.append(TransactionRequest.model_validate_json(raw))
+            except ValidationError as exc:
+                errors += 1
+                pending.append({"line": line_no, "error": str(exc)})
+
+        async for part in request.stream():
+            buf += part
+            *lines, buf = buf.split(b"\n")
+            for raw in lines:
+                _parse(raw)
+                if len(pending) >= chunk:
+                    yield await _flush()
+        if buf:
+            _parse(buf)
+        if pending:
+            yield await _flush()
+        yield _ndjson({"count": count, "flagged": flagged, "errors": errors})
+        _request_latency["analyze_batch_ndjson"].record(time.perf_counter_ns() - t0_ns)
+
+    return _DuplexStreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
+@app.post("/v1/graph/ingest")
+def graph_ingest(req: BatchRequest) -> dict:
+    """
+    Append transactions to the live serving graph.  Logits are refreshed
+    for the nodes inside the new edges' receptive field only, so scores stay
+    current without a full-graph forward.
+    """
+    _serving()
+    return ingest_transactions([
+        (str(tx.source_id).strip(), str(tx.target_id).strip(), float(tx.amount))
+        for tx in req.transactions
+    ])
+
+
 @app.get("/detect-rings")
 def detect_rings_endpoint(max_size: int = 6, limit: int = 20) -> RingReport:
-    if not nx_graph:
+    st = _state
+    if st is None or not st.tx_graph:
         raise HTTPException(503, "Graph not loaded")
-    filtered        = [r for r in _rings_cache if r["size"] <= max_size][:limit]
+    filtered        = heapq.nlargest(
+        limit, (r for r in st.rings_cache if r["size"] <= max_size), key=lambda r: r["volume"],
+    )
     high_risk_nodes = list({n for r in filtered[:5] for n in r["nodes"]})
     return RingReport(
         rings_detected =len(filtered),
         rings          =filtered,
         high_risk_nodes=high_risk_nodes,
+        search         =st.readiness()["rings"],
     )
 
 
 @app.get("/cluster-report")
 def cluster_report() -> ClusterReport:
-    if node_df is None:
+    st = _state
+    if st is None or st.node_store is None or st.community_table is None:
         raise HTTPException(503, "Node data not loaded")
-    if "community_fraud_rate" not in node_df.columns:
+    if st.cluster_report is None:
         raise HTTPException(400, "Run feature_engineering.py to compute communities")
-
-    buckets = pd.cut(
-        node_df["community_fraud_rate"],
-        bins=[0, 0.1, 0.3, 0.6, 1.01],
-        labels=["Low", "Medium", "High", "Critical"],
-    )
-    dist      = buckets.value_counts().to_dict()
-    top_nodes = node_df.nlargest(10, "community_fraud_rate")[
-        ["node_id", "community_fraud_rate", "is_fraud"]
-    ].to_dict("records")
-
-    return ClusterReport(
-        total_clusters     =int(node_df["community_id"].nunique()),
-        high_risk_clusters =int(dist.get("High", 0) + dist.get("Critical", 0)),
-        top_clusters       =top_nodes,
-    )
+    return st.cluster_report
 
 
 @app.get("/network-snapshot")
-def network_snapshot(limit: int = 200) -> dict:
-    if node_df is None or nx_graph is None:
+def network_snapshot(
+    limit:     int             = 200,
+    cursor:    Optional[str]   = None,
+    community: Optional[int]   = None,
+    ring_only: bool            = False,
+    min_risk:  Optional[float] = None,
+) -> Response:
+    """
+    Riskiest accounts and the transactions between them, one page at a
+    time: pass ``page.next_cursor`` back as ``cursor`` for the next page.
+    Pages are served from the snapshot's NetworkView and cached as
+    serialized JSON until the next reload.
+    """
+    st = _state
+    if st is None or st.network_view is None:
         raise HTTPException(503, "Data not loaded")
-
-    risk_col  = "community_fraud_rate" if "community_fraud_rate" in node_df.columns else "pagerank"
-    top_df    = node_df.nlargest(limit, risk_col)
-    nodes_out = [
-        {
-            "id":       str(row["node_id"]),
-            "is_fraud": int(row.get("is_fraud", 0)),
-            "risk":     round(float(row.get(risk_col, 0)), 4),
-            "ring":     int(row.get("ring_membership", 0)) > 0,
-            "pagerank": round(float(row.get("pagerank", 0)), 6),
-        }
-        for _, row in top_df.iterrows()
-    ]
-    node_ids  = {n["id"] for n in nodes_out}
-    edges_out = [
-        {"source": u, "target": v, "weight": round(d.get("weight", 1.0), 2)}
-        for u, v, d in nx_graph.edges(data=True)
-        if u in node_ids and v in node_ids
-    ][:500]
-
-    return {
-        "nodes": nodes_out,
-        "edges": edges_out,
-        "stats": {
-            "total_nodes": base_graph.num_nodes if base_graph else 0,
-            "total_edges": nx_graph.number_of_edges(),
-            "fraud_nodes": int(node_df["is_fraud"].sum()),
-            "fraud_rate":  round(float(node_df["is_fraud"].mean()), 4),
-        },
-    }
+    view  = st.network_view
+    limit = max(1, min(int(limit), NETWORK_PAGE_MAX))
+    try:
+        offset = view.parse_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(400, str(exc))
+
+    filters = {"community": community, "ring_only": ring_only, "min_risk": min_risk}
+    body = st.network_cache.get_or_compute(
+        (offset, limit, community, ring_only, min_risk),
+        lambda: json.dumps({
+            **view.page(offset, limit, NETWORK_EDGE_LIMIT, **filters),
+            "filters": filters,
+        }).encode(),
+    )
+    return Response(body, media_type="application/json")
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # /v1/gnn/score — FULL CONTRACT ENDPOINT
 # ──────────────────────────────────────────────────────────────────────────────
 
-@app.post("/v1/gnn/score", response_model=GnnScoreResponse)
-def gnn_score(request: GnnScoreRequest) -> GnnScoreResponse:
+class _ScoreStatic:
     """
-    Full GNN scoring endpoint.
-
-    [FIX v3.2] Accepts both 'sourceAccountId' (canonical) and 'accountId' (legacy
-    alias from Spring Boot AiRiskService). The model_validator on GnnScoreRequest
-    resolves the alias transparently, so this function always receives a valid
-    sourceAccountId.
+    The amount- and context-independent part of one account's /v1/gnn/score
+    response: node metadata, fraud cluster, ring membership and the
+    feature-rule risk factors.  ``rings`` is the ring generation it was
+    built against; fast-path cache entries from an older one are rebuilt.
     """
-    if not _initialized:
-        load_assets()
-    if model is None:
-        raise HTTPException(503, "Model not loaded")
-
-    # ── Resolve source and destination ──────────────────────────────────────
-    src_id = str(request.sourceAccountId).strip()
-    tgt_id = str(request.targetAccountId).strip() if request.targetAccountId else None
-
-    if not src_id:
-        raise HTTPException(422, "sourceAccountId must be a non-empty string")
-
-    logger.info("GNN score request: src=%s tgt=%s amount=%.2f",
-                src_id, tgt_id, request.transactionAmount)
-
-    # ── 1. Raw GNN score ────────────────────────────────────────────────────
-    raw_score, confidence, embedding_norm, is_known_src = _blend_src_tgt(src_id, tgt_id)
 
-    # ── 2. Blend Spring Boot context features ────────────────────────────────
-    g        = request.graphFeatures
-    id_feat  = request.identityFeatures
-    beh_feat = request.behaviorFeatures
-    has_context = (
-        g.suspiciousNeighborCount > 0 or g.twoHopFraudDensity > 0
-        or g.connectivityScore    > 0
-        or beh_feat.velocity > 0 or beh_feat.burst > 0
-        or id_feat.deviceReuse > 0 or id_feat.ipReuse > 0
+    __slots__ = (
+        "src_idx", "cluster_id", "fraud_cluster", "centrality", "loops",
+        "rule_factors", "ring", "ring_factor", "rings", "encoded",
     )
 
-    if has_context:
-        gnn_score_val = float(np.clip(
-            0.68 * raw_score
-            + 0.16 * max(0.0, min(1.0, g.twoHopFraudDensity))
-            + 0.08 * min(1.0, g.suspiciousNeighborCount / 10.0)
-            + 0.04 * max(0.0, min(1.0, beh_feat.velocity))
-            + 0.02 * max(0.0, min(1.0, beh_feat.burst))
-            + 0.01 * min(1.0, id_feat.deviceReuse / 10.0)
-            + 0.01 * min(1.0, id_feat.ipReuse / 10.0),
-            0.0, 1.0,
-        ))
-    else:
-        gnn_score_val = raw_score
+    def __init__(self) -> None:
+        self.src_idx: Optional[int] = None
+        self.cluster_id   = 0
+        self.fraud_cluster: Dict[str, Any] = {}
+        self.centrality   = 0.0
+        self.loops        = False
+        self.rule_factors: List[str]      = []
+        self.ring:         Dict[str, Any] = {}
+        self.ring_factor:  Optional[str]  = None
+        self.rings:        Any            = None
+        # (fraudCluster, muleRingDetection) pre-encoded, fast path only
+        self.encoded:      Optional[tuple[Raw, Raw]] = None
 
-    # ── 2b. Amount adjustment ────────────────────────────────────────────────
-    gnn_score_val  = _transaction_adjusted_risk(gnn_score_val, request.transactionAmount)
-    gnn_score_val  = round(gnn_score_val,  6)
-    confidence     = round(confidence,     6)
-    embedding_norm = round(embedding_norm, 6)
 
-    # ── 3. Risk level ─────────────────────────────────────────────────────────
-    threshold  = float(model_meta.get("optimal_threshold", 0.5)) if model_meta else 0.5
-    risk_level = _risk_level_str(gnn_score_val, threshold)
+def _score_static(st: ServingState, src_id: str, is_known_src: bool, tm) -> _ScoreStatic:
+    """Steps 4, 5 and 7 of /v1/gnn/score plus the feature-rule risk factors."""
+    ss = _ScoreStatic()
 
     # ── 4. Node metadata ──────────────────────────────────────────────────────
-    node_row = None
-    if node_df is not None and is_known_src:
-        rows = node_df[node_df["node_id"] == src_id]
-        if not rows.empty:
-            node_row = rows.iloc[0]
+    node_store      = st.node_store
+    community_table = st.community_table
+    if node_store is not None and is_known_src:
+        ss.src_idx = st.id_map.get(src_id)
+    src_idx = ss.src_idx
+    if src_idx is not None:
+        ss.centrality   = round(node_store.value("pagerank", src_idx), 6)
+        ss.loops        = node_store.value("reciprocity_score", src_idx) > 0.1
+        ss.rule_factors = _build_risk_factors(node_store.features(src_idx), 0.0)
+    tm.lap("node_metadata")
 
     # ── 5. Fraud cluster ──────────────────────────────────────────────────────
-    cluster_id = cluster_size = 0
+    cluster_size       = 0
     cluster_risk_score = 0.0
-    if node_row is not None and node_df is not None:
-        cluster_id = int(node_row.get("community_id", 0))
-        if "community_id" in node_df.columns:
-            cluster_size = int((node_df["community_id"] == cluster_id).sum())
-        if "community_fraud_rate" in node_df.columns:
-            mask = node_df["community_id"] == cluster_id
-            cluster_risk_score = round(float(node_df.loc[mask, "community_fraud_rate"].mean()), 4)
-
-    # ── 6. Network metrics ────────────────────────────────────────────────────
-    suspicious_neighbors = g.suspiciousNeighborCount
-    shared_devices       = id_feat.deviceReuse
-    shared_ips           = id_feat.ipReuse
-    centrality_score     = 0.0
-    transaction_loops    = False
-
-    if node_row is not None:
-        centrality_score  = round(float(node_row.get("pagerank", 0.0)), 6)
-        transaction_loops = float(node_row.get("reciprocity_score", 0.0)) > 0.1
-
-    if nx_graph and src_id in nx_graph and node_df is not None and "is_fraud" in node_df.columns:
-        fraud_set    = set(node_df.loc[node_df["is_fraud"] == 1, "node_id"].astype(str))
-        live_count   = sum(1 for n in nx_graph.successors(src_id) if n in fraud_set)
-        suspicious_neighbors = max(suspicious_neighbors, live_count)
+    if src_idx is not None and community_table is not None:
+        ss.cluster_id      = int(node_store.value("community_id", src_idx, 0))
+        cluster_size       = community_table.size_of(ss.cluster_id)
+        cluster_risk_score = round(community_table.risk_score(ss.cluster_id), 4)
+    ss.fraud_cluster = {
+        "clusterId":        ss.cluster_id,
+        "clusterSize":      cluster_size,
+        "clusterRiskScore": cluster_risk_score,
+    }
+    tm.lap("cluster")
 
     # ── 7. Mule ring detection ────────────────────────────────────────────────
-    is_ring_member = node_row is not None and float(node_row.get("ring_membership", 0)) > 0
+    is_ring_member = src_idx is not None and node_store.value("ring_membership", src_idx) > 0
     ring_id        = 0
     ring_shape     = "CYCLE"
     ring_size      = 1
@@ -1015,95 +2185,498 @@ def gnn_score(request: GnnScoreRequest) -> GnnScoreResponse:
     hub_account    = src_id
     ring_accounts: List[str] = []
 
-    for i, ring in enumerate(_rings_cache):
-        if src_id in ring.get("nodes", []):
-            is_ring_member = True
-            ring_id        = i
-            ring_accounts  = ring["nodes"]
-            ring_size      = ring["size"]
-            if nx_graph:
-                ring_shape        = _classify_ring_shape(ring_accounts, nx_graph)
-                role, hub_account = _classify_role(src_id, ring_accounts, nx_graph)
-            break
+    ss.rings          = st.rings             # one read: the search may republish
+    rings, ring_index = ss.rings
+    ring_ids = ring_index.get(src_id)
+    if ring_ids:
+        ring_id        = max(ring_ids, key=lambda i: rings[i]["volume"])    # first id on ties
+        ring           = rings[ring_id]
+        is_ring_member = True
+        ring_accounts  = ring["nodes"]
+        ring_size      = ring["size"]
+        ring_shape     = ring["shape"]
+        hub_account    = ring["hub"]
+        role           = ring["roles"].get(src_id, "MULE")
+    ss.ring = {
+        "isMuleRingMember": is_ring_member,
+        "ringId":           ring_id,
+        "ringShape":        ring_shape,
+        "ringSize":         ring_size,
+        "role":             role,
+        "hubAccount":       hub_account,
+        "ringAccounts":     ring_accounts,
+    }
+    if is_ring_member:
+        ss.ring_factor = f"member_of_{ring_shape.lower()}_mule_ring"
+    tm.lap("ring_lookup")
+    return ss
+
+
+def _cached_score_static(st: ServingState, src_id: str, is_known_src: bool, tm) -> _ScoreStatic:
+    """``_score_static`` from the per-snapshot cache, with its sub-objects pre-encoded."""
+    key = (src_id, is_known_src)
+    ss  = st.static_cache.get(key)
+    if ss is not None and ss.rings is st.rings:
+        for stage in ("node_metadata", "cluster", "ring_lookup"):
+            tm.lap(stage)
+        return ss
+    ss = _score_static(st, src_id, is_known_src, tm)
+    ss.encoded = (raw(ss.fraud_cluster), raw(ss.ring))
+    st.static_cache.put(key, ss)
+    return ss
+
+
+def _src_exposure(st: ServingState, src_id: str) -> tuple[Optional[int], int, int, float]:
+    """
+    Step 6 inputs for the source account: (live fraud-successor count, or
+    None when the account is not in the graph, 1-hop fraud, 2-hop fraud,
+    2-hop fraud density).
+    """
+    fraud_exposure = st.fraud_exposure
+    id_map         = st.id_map
+    if fraud_exposure is not None:
+        if src_id in id_map:
+            idx = id_map[src_id]
+            return st.exposure_cache.get_or_compute(
+                (src_id, fraud_exposure.version(idx)), lambda: _node_exposure(fraud_exposure, idx),
+            )
+        if st.tx_graph and src_id in st.tx_graph:
+            mask = fraud_exposure.mask
+            live_count = sum(
+                1 for n in st.tx_graph.successors(src_id)
+                if n in id_map and mask[id_map[n]]
+            )
+            return live_count, 0, 0, 0.0
+    return None, 0, 0, 0.0
+
+
+AccountState = tuple[_ScoreStatic, tuple[Optional[int], int, int, float]]
+
+
+def _account_state(st: ServingState, src_id: str, is_known_src: bool, fast: bool, tm) -> AccountState:
+    """
+    Steps 4–7 of /v1/gnn/score: everything that depends on the source
+    account but not on the transaction.  Concurrent requests for the same
+    account wait on one computation (``score_flight``) and then apply their
+    own amount and context adjustments.
+    """
+    def _compute() -> AccountState:
+        ss       = (_cached_score_static if fast else _score_static)(st, src_id, is_known_src, tm)
+        exposure = _src_exposure(st, src_id)
+        tm.lap("network_metrics")
+        return ss, exposure
+
+    state, leader = st.score_flight.do(("state", src_id, is_known_src, fast), _compute)
+    if not leader:
+        tm.lap("coalesced")
+    return state
+
+
+def _score_fields(
+    st:             ServingState,
+    request:        GnnScoreRequest,
+    src_id:         str,
+    tgt_id:         Optional[str],
+    gnn_score_val:  float,
+    confidence:     float,
+    embedding_norm: float,
+    is_known_src:   bool,
+    tgt_risk_raw:   float,
+    threshold:      float,
+    version:        str,
+    tm,
+    fast:           bool                   = False,
+    state:          Optional[AccountState] = None,
+) -> Dict[str, Any]:
+    """
+    Steps 3–8 of /v1/gnn/score for one request, given its blended score:
+    the response fields in GnnScoreResponse order.  With ``fast`` the static
+    part comes from the cache and fraudCluster / muleRingDetection are
+    ``Raw`` pre-encoded JSON.  ``state`` is the source account's
+    ``_account_state`` when the caller already has it.
+    """
+    # ── 3. Risk level ─────────────────────────────────────────────────────────
+    risk_level = _risk_level_str(gnn_score_val, threshold)
+
+    if state is None:
+        state = _account_state(st, src_id, is_known_src, fast, tm)
+    ss, (live_count, fraud_1hop, fraud_2hop, two_hop_density) = state
+
+    # ── 6. Network metrics ────────────────────────────────────────────────────
+    suspicious_neighbors = request.graphFeatures.suspiciousNeighborCount
+    shared_devices       = request.identityFeatures.deviceReuse
+    shared_ips           = request.identityFeatures.ipReuse
+    if live_count is not None:
+        suspicious_neighbors = max(suspicious_neighbors, live_count)
 
     # ── 8. Risk factors ───────────────────────────────────────────────────────
-    node_features: dict = (
-        {col: float(node_row[col]) for col in FEATURE_COLS if col in node_row.index}
-        if node_row is not None else {}
-    )
-    risk_factors = _build_risk_factors(node_features, gnn_score_val)
-    if is_ring_member:
-        risk_factors.append(f"member_of_{ring_shape.lower()}_mule_ring")
+    risk_factors = list(ss.rule_factors)
+    if not risk_factors and gnn_score_val > 0.5:
+        risk_factors.append("Anomalous transaction graph pattern detected")
+    if ss.ring_factor:
+        risk_factors.append(ss.ring_factor)
     if suspicious_neighbors > 3:
         risk_factors.append("connected_to_high_risk_accounts")
     if shared_devices > 1:
         risk_factors.append("shared_device_with_multiple_accounts")
-    if transaction_loops:
+    if ss.loops:
         risk_factors.append("rapid_pass_through_transactions")
     if tgt_id:
-        tgt_risk_raw, _, _ = _score_account(tgt_id)
         if tgt_risk_raw > threshold:
             risk_factors.append(f"destination_account_{tgt_id}_is_high_risk")
     # Deduplicate preserving order
     seen_rf: set = set()
     risk_factors = [f for f in risk_factors if not (f in seen_rf or seen_rf.add(f))]  # type: ignore
-
-    version = model_meta.get("version", "GNN-v3") if model_meta else "GNN-v3"
+    tm.lap("risk_factors")
 
     logger.info(
         "GNN score result: src=%s gnnScore=%.4f confidence=%.4f riskLevel=%s",
         src_id, gnn_score_val, confidence, risk_level,
     )
+    tm.skip()
 
-    return GnnScoreResponse(
-        model   ="GNN",
-        version =version,
+    fraud_cluster, ring = ss.encoded if fast else (ss.fraud_cluster, ss.ring)
+    return {
+        "model":   "GNN",
+        "version": version,
 
-        entity={
+        "entity": {
             "type":            "ACCOUNT",
             "sourceAccountId": src_id,
             "targetAccountId": tgt_id,
         },
 
-        scores={
+        "scores": {
             "gnnScore":   gnn_score_val,
             "confidence": confidence,
             "riskLevel":  risk_level,
         },
 
-        fraudCluster={
-            "clusterId":        cluster_id,
-            "clusterSize":      cluster_size,
-            "clusterRiskScore": cluster_risk_score,
-        },
+        "fraudCluster": fraud_cluster,
 
-        networkMetrics={
+        "networkMetrics": {
             "suspiciousNeighbors": suspicious_neighbors,
             "sharedDevices":       shared_devices,
             "sharedIPs":           shared_ips,
-            "centralityScore":     centrality_score,
-            "transactionLoops":    transaction_loops,
+            "centralityScore":     ss.centrality,
+            "transactionLoops":    ss.loops,
+            "fraudNeighbors1Hop":  fraud_1hop,
+            "fraudNeighbors2Hop":  fraud_2hop,
+            "twoHopFraudDensity":  two_hop_density,
         },
 
-        muleRingDetection={
-            "isMuleRingMember": is_ring_member,
-            "ringId":           ring_id,
-            "ringShape":        ring_shape,
-            "ringSize":         ring_size,
-            "role":             role,
-            "hubAccount":       hub_account,
-            "ringAccounts":     ring_accounts,
-        },
+        "muleRingDetection": ring,
 
-        riskFactors =risk_factors,
-        embedding   ={"embeddingNorm": embedding_norm},
-        timestamp   =datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "riskFactors": risk_factors,
+        "embedding":   {"embeddingNorm": embedding_norm},
+        "timestamp":   (
+            utc_timestamp() if fast
+            else datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        ),
 
         # Flat mirrors — always populated so Spring Boot mapAiResponse can read them
-        gnnScore        =gnn_score_val,
-        confidence      =confidence,
-        fraudClusterId  =cluster_id,
-        embeddingNorm   =embedding_norm,
-        sourceAccountId =src_id,
-        targetAccountId =tgt_id,
-    )
\ No newline at end of file
+        "gnnScore":        gnn_score_val,
+        "confidence":      confidence,
+        "fraudClusterId":  ss.cluster_id,
+        "embeddingNorm":   embedding_norm,
+        "sourceAccountId": src_id,
+        "targetAccountId": tgt_id,
+    }
+
+
+def _build_score_response(
+    st:             ServingState,
+    request:        GnnScoreRequest,
+    src_id:         str,
+    tgt_id:         Optional[str],
+    gnn_score_val:  float,
+    confidence:     float,
+    embedding_norm: float,
+    is_known_src:   bool,
+    tgt_risk_raw:   float,
+    threshold:      float,
+    version:        str,
+    fast:           bool                                = False,
+    states:         Optional[Dict[tuple, AccountState]] = None,
+) -> Any:
+    """
+    One /v1/gnn/score response: a validated GnnScoreResponse, or with
+    ``fast`` the same document already encoded as a JSON Response.
+    ``states`` memoizes account state across one batch, so repeated source
+    accounts within it are also computed once.
+    """
+    tm    = _metrics.timer("gnn_score")
+    key   = (src_id, is_known_src)
+    state = states.get(key) if states is not None else None
+    if state is None:
+        state = _account_state(st, src_id, is_known_src, fast, tm)
+        if states is not None:
+            states[key] = state
+    else:
+        tm.lap("coalesced")
+    fields = _score_fields(
+        st, request, src_id, tgt_id, gnn_score_val, confidence, embedding_norm,
+        is_known_src, tgt_risk_raw, threshold, version, tm, fast=fast, state=state,
+    )
+    if fast:
+        response: Any = Response(_score_encoder.encode(fields), media_type="application/json")
+    else:
+        response = GnnScoreResponse(**fields)
+    tm.lap("serialization")
+    return response
+
+
+_score_encoder = ObjectEncoder(GnnScoreResponse.model_fields)
+
+
+def _enable_fast_scoring(st: ServingState) -> None:
+    """
+    With FAST_SCORE_JSON, score a sample of accounts through both paths and
+    turn the fast path on for this snapshot only if every document matches
+    what FastAPI would send for the GnnScoreResponse (timestamp excepted).
+    """
+    if not FAST_SCORE_JSON:
+        return
+    ids   = [st.rev_map[i] for i in range(min(len(st.rev_map), 8))]
+    ids  += [nd for ring in st.rings_cache[:2] for nd in ring["nodes"][:2]]
+    ids  += ["__fast_path_probe__"]
+    tgt   = ids[0] if st.rev_map else None
+    checked, failures = 0, []
+    try:
+        for src in ids:
+            request = GnnScoreRequest(sourceAccountId=src, targetAccountId=tgt, transactionAmount=5000.0)
+            args = (
+                st, request, src, tgt, 0.731248, 0.462497, 1.234567,
+                src in st.id_map, 0.91, st.threshold, st.version, NULL_TIMER,
+            )
+            model    = GnnScoreResponse(**_score_fields(*args))
+            expected = json.dumps(              # what FastAPI's JSONResponse sends
+                model.model_dump(mode="json"), ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+            ).encode("utf-8")
+            actual = _score_encoder.encode(_score_fields(*args, fast=True))
+            result = compare(expected, actual, ignore=("timestamp",))
+            checked += 1
+            if not result["passed"]:
+                failures.append({"accountId": src, **result})
+    except Exception as exc:
+        failures.append({"error": repr(exc)})
+    st.fast_scoring   = not failures
+    st.score_encoding = {
+        "mode":     "fast" if st.fast_scoring else "pydantic",
+        "encoder":  ENCODER,
+        "checked":  checked,
+        "failures": failures[:3],
+    }
+    log = logger.info if st.fast_scoring else logger.warning
+    log("  Fast score encoding %s (%s, %d documents checked)",
+        "enabled" if st.fast_scoring else "DISABLED — output mismatch", ENCODER, checked)
+
+
+def _score_requests(requests: List[GnnScoreRequest]) -> List[Any]:
+    """
+    Score a batch of /v1/gnn/score requests.
+
+    Account lookups, the src/tgt blend, the context blend and the amount
+    adjustment run once over the whole batch as array operations; only the
+    per-node metadata lookups (all O(1)) run per request.  Returns one
+    GnnScoreResponse (a pre-encoded Response on the fast path) — or the
+    exception to raise — per request, in order.
+    The whole batch is scored on one snapshot.
+    """
+    try:
+        st = _serving()
+    except HTTPException as exc:
+        return [exc] * len(requests)
+    threshold = st.threshold
+    version   = st.model_meta.get("version", "GNN-v3") if st.model_meta else "GNN-v3"
+
+    results: List[Any] = [None] * len(requests)
+    rows:    List[tuple[int, str, Optional[str]]] = []
+
+    # ── Resolve source and destination ──────────────────────────────────────
+    for i, request in enumerate(requests):
+        src_id = str(request.sourceAccountId).strip()
+        tgt_id = str(request.targetAccountId).strip() if request.targetAccountId else None
+        if not src_id:
+            results[i] = HTTPException(422, "sourceAccountId must be a non-empty string")
+            continue
+        logger.info("GNN score request: src=%s tgt=%s amount=%.2f",
+                    src_id, tgt_id, request.transactionAmount)
+        rows.append((i, src_id, tgt_id))
+
+    if not rows:
+        return results
+
+    batch = [requests[i] for i, _, _ in rows]
+    tm    = _metrics.timer("gnn_score")
+
+    # ── 1. Raw GNN score ────────────────────────────────────────────────────
+    raw, conf, emb, known, tgt_risk = _blend_src_tgt_batch(
+        st, [src for _, src, _ in rows], [tgt for _, _, tgt in rows],
+    )
+    tm.lap("blend")
+
+    # ── 2. Blend Spring Boot context features + amount adjustment ───────────
+    scores = _context_blend_batch(raw, batch)
+    scores = _transaction_adjusted_risk_batch(
+        scores, np.array([r.transactionAmount for r in batch], dtype=np.float64),
+    )
+    tm.lap("context_blend")
+
+    states: Dict[tuple, AccountState] = {}
+    for j, (i, src_id, tgt_id) in enumerate(rows):
+        try:
+            results[i] = _build_score_response(
+                st, batch[j], src_id, tgt_id,
+                gnn_score_val  =round(float(scores[j]), 6),
+                confidence     =round(float(conf[j]), 6),
+                embedding_norm =round(float(emb[j]), 6),
+                is_known_src   =bool(known[j]),
+                tgt_risk_raw   =float(tgt_risk[j]),
+                threshold      =threshold,
+                version        =version,
+                fast           =st.fast_scoring,
+                states         =states,
+            )
+        except Exception as exc:
+            logger.exception("GNN score failed: src=%s", src_id)
+            results[i] = exc
+
+    # ── Live ingestion (scored against the graph *before* this batch) ───────
+    if _ingest_executor is not None:
+        edges = [
+            (src_id, tgt_id, float(batch[j].transactionAmount))
+            for j, (_, src_id, tgt_id) in enumerate(rows)
+            if tgt_id and tgt_id != src_id and batch[j].transactionAmount > 0
+        ]
+        if edges:
+            _ingest_executor.submit(ingest_transactions, edges)
+    return results
+
+
+_ingest_executor: Optional[ThreadPoolExecutor] = (
+    ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest")
+    if INGEST_SCORED_TX else None
+)
+
+
+_score_batcher: Optional[MicroBatcher] = (
+    MicroBatcher(
+        "gnn-score", _score_requests,
+        max_batch=SCORE_BATCH_MAX, window_ms=SCORE_BATCH_WINDOW_MS,
+        max_workers=SCORE_BATCH_WORKERS,
+    )
+    if SCORE_BATCH_WINDOW_MS > 0 else None
+)
+
+
+@app.post("/v1/gnn/score", response_model=GnnScoreResponse)
+async def gnn_score(request: GnnScoreRequest) -> GnnScoreResponse:
+    """
+    Full GNN scoring endpoint.
+
+    [FIX v3.2] Accepts both 'sourceAccountId' (canonical) and 'accountId' (legacy
+    alias from Spring Boot AiRiskService). The model_validator on GnnScoreRequest
+    resolves the alias transparently, so this function always receives a valid
+    sourceAccountId.
+
+    Requests are micro-batched: everything arriving within
+    SCORE_BATCH_WINDOW_MS (or until SCORE_BATCH_MAX are waiting) is scored in
+    one _score_requests call, and each caller still gets its own response.
+    """
+    t0_ns = time.perf_counter_ns()
+    _requests["gnn_score"].inc()
+    try:
+        if _state is None:
+            await run_in_threadpool(load_assets)
+        _serving()
+
+        if _score_batcher is not None:
+            return await _score_batcher.submit(request)
+
+        result = (await run_in_threadpool(_score_requests, [request]))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    finally:
+        _request_latency["gnn_score"].record(time.perf_counter_ns() - t0_ns)
+
+
+@app.get("/v1/gnn/similar")
+def gnn_similar(accountId: str, k: int = 10, nprobe: Optional[int] = None) -> dict:
+    """
+    Accounts whose GNN embeddings are closest (cosine) to ``accountId``'s,
+    from the IVF index — e.g. accounts behaving like a known mule.  Only
+    accounts in the trained graph have an embedding.
+    """
+    st = _serving()
+    if st.embedding_index is None:
+        raise HTTPException(503, "Embedding index not loaded")
+    idx = st.id_map.get(accountId)
+    if idx is None:
+        raise HTTPException(404, f"Account {accountId} is not in the trained graph")
+    k = max(1, min(int(k), SIMILAR_MAX_K))
+
+    t0 = time.perf_counter()
+    nodes, sims, scanned = st.embedding_index.neighbours(idx, k, nprobe)
+    risk     = st.logit_table.rows(nodes)[:, 0] if len(nodes) else np.zeros(0)
+    is_fraud = (
+        st.node_store.column("is_fraud")[nodes]
+        if st.node_store is not None and "is_fraud" in st.node_store else None
+    )
+    return {
+        "accountId": accountId,
+        "k":         k,
+        "neighbors": [
+            {
+                "accountId":  st.rev_map[n],
+                "similarity": round(s, 4),
+                "riskScore":  round(r, 4),
+                "isFraud":    int(is_fraud[i]) if is_fraud is not None else None,
+            }
+            for i, (n, s, r) in enumerate(zip(nodes.tolist(), sims.tolist(), risk.tolist()))
+        ],
+        "scanned":    scanned,
+        "latency_ms": round((time.perf_counter() - t0) * 1_000, 3),
+    }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# HOT RELOAD
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _reload_in_background(trigger: str) -> None:
+    threading.Thread(
+        target=reload_assets, args=(trigger,), name="snapshot-reload", daemon=True,
+    ).start()
+
+
+_artifact_watcher: Optional[ArtifactWatcher] = (
+    ArtifactWatcher(
+        "artifact-watcher", SERVING_ARTIFACTS,
+        on_change=lambda changed: reload_assets("watcher: " + ", ".join(changed)),
+        interval_sec=RELOAD_POLL_SEC,
+    )
+    if RELOAD_POLL_SEC > 0 else None
+)
+
+
+@app.post("/admin/reload")
+def admin_reload(request: Request, wait: bool = False) -> dict:
+    """
+    Rebuild the serving snapshot from SHARED_DATA and swap it in without
+    dropping traffic.  By default the build runs in the background and the
+    call returns at once (poll /health → snapshot); ``?wait=true`` blocks
+    until the new snapshot is live and returns both versions.
+    """
+    if RELOAD_TOKEN and request.headers.get("X-Admin-Token") != RELOAD_TOKEN:
+        raise HTTPException(403, "Invalid admin token")
+    if _reload_status["in_progress"]:
+        return {"status": "IN_PROGRESS", **_reload_status}
+    if wait:
+        result = reload_assets("admin")
+        if result["status"] == "FAILED":
+            raise HTTPException(500, f"Reload failed: {result['error']}")
+        return result
+    _reload_in_background("admin")
+    return {"status": "STARTED", "current": _state.describe() if _state else None}
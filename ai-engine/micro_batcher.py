@@ -0,0 +1,114 @@
+"""
+MuleHunter AI  ·  Micro-Batcher  ·  v1.0
+=========================================
+Async request coalescing for the scoring endpoints.
+
+Callers ``await batcher.submit(item)`` from the event loop.  Items that
+arrive within ``window_ms`` of the first pending item — or until
+``max_batch`` items are waiting — are handed to ``process(items)`` in one
+call on a worker thread.  ``process`` returns one result per item, in
+order; a result that is an exception instance is raised to that caller
+only, so one bad request never fails its batch-mates.
+
+All bookkeeping (pending list, timer) happens on the event-loop thread, so
+no locks are needed; only ``process`` runs off-loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger("MuleHunter-Inference")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+
+    def __init__(
+        self,
+        name:        str,
+        process:     Callable[[List[T]], List[Any]],
+        max_batch:   int   = 64,
+        window_ms:   float = 2.0,
+        max_workers: int   = 4,
+    ) -> None:
+        self.name       = name
+        self.max_batch  = max(1, int(max_batch))
+        self.window_sec = max(0.0, float(window_ms)) / 1_000
+        self._process   = process
+        self._executor  = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-batch",
+        )
+        self._pending: List[tuple[T, asyncio.Future]] = []
+        self._timer:   Optional[asyncio.TimerHandle]  = None
+
+        self._batches   = 0
+        self._items     = 0
+        self._max_seen  = 0
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        fut  = loop.create_future()
+        self._pending.append((item, fut))
+        if len(self._pending) >= self.max_batch:
+            self._flush(loop)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_sec, self._flush, loop)
+        return await fut
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        self._batches  += 1
+        self._items    += len(batch)
+        self._max_seen  = max(self._max_seen, len(batch))
+
+        items = [item for item, _ in batch]
+        done  = loop.run_in_executor(self._executor, self._process, items)
+        done.add_done_callback(lambda f: self._resolve(batch, f))
+
+    def _resolve(self, batch: List[tuple[T, asyncio.Future]], done: asyncio.Future) -> None:
+        exc = done.exception() if not done.cancelled() else asyncio.CancelledError()
+        if exc is None:
+            results = done.result()
+            if len(results) != len(batch):
+                exc = RuntimeError(
+                    f"{self.name}: batch returned {len(results)} results for {len(batch)} items"
+                )
+        if exc is not None:
+            logger.error("%s: batch of %d failed: %s", self.name, len(batch), exc)
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+
+        for (_, fut), res in zip(batch, results):
+            if fut.done():      # caller went away (client disconnect)
+                continue
+            if isinstance(res, BaseException):
+                fut.set_exception(res)
+            else:
+                fut.set_result(res)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "window_ms":      round(self.window_sec * 1_000, 3),
+            "max_batch":      self.max_batch,
+            "batches":        self._batches,
+            "items":          self._items,
+            "mean_batch":     round(self._items / self._batches, 2) if self._batches else 0.0,
+            "max_batch_seen": self._max_seen,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,234 @@
+"""
+MuleHunter AI  ·  Model Export  ·  v1.0
+========================================
+TorchScript export of ``MuleHunterGNN`` for the serving runtime.
+
+Eager PyG layers pay Python dispatch on every call — negligible for the one
+full-graph forward at startup, but most of the cost of the small forwards
+the service runs online (an unseen account's k-hop subgraph, the receptive
+field refreshed by live ingestion).  ``export_model`` traces the model into
+a frozen TorchScript graph with two entry points:
+
+  forward(x, edge_index) → (log-probs, embedding)     full model
+  head(embedding)        → log-probs                  classifier head only
+
+and optionally applies dynamic int8 quantization to the ``torch.nn.Linear``
+layers (the residual skip and the classifier MLP; PyG's own linear layers
+inside the convolutions stay fp32).
+
+Every export is checked against the eager model by ``check_parity`` — on the
+full graph and on a sampled subgraph, so the traced graph is known to work
+for graph sizes other than the one it was traced on — and the report is
+stored in the artifact.  ``load_exported`` refuses artifacts that failed
+parity or were exported from different weights.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import torch
+import torch.nn.functional as F
+
+logger = logging.getLogger("MuleHunter-Export")
+
+EXPORT_FORMAT = 1
+META_FILE     = "export_meta.json"
+
+# Parity tolerances: (max |Δ fraud probability|, min decision agreement).
+FP32_TOLERANCE = (1e-4, 1.0)
+INT8_TOLERANCE = (0.10, 0.995)
+
+Forward = Callable[[torch.Tensor, torch.Tensor], Tuple[torch.Tensor, torch.Tensor]]
+
+
+class ServingGNN(torch.nn.Module):
+    """
+    Inference-only view of a trained ``MuleHunterGNN`` (shares its
+    parameters).  Dropout is dropped and BatchNorm uses running statistics,
+    so the wrapper must stay in eval mode.  This is also the eager runtime
+    the service falls back to when no export is available.
+    """
+
+    def __init__(self, model: torch.nn.Module) -> None:
+        super().__init__()
+        self.skip       = model.skip
+        self.conv1      = model.conv1
+        self.bn1        = model.bn1
+        self.conv2      = model.conv2
+        self.bn2        = model.bn2
+        self.conv3      = model.conv3
+        self.bn3        = model.bn3
+        self.classifier = model.classifier
+        self.eval()
+
+    def forward(self, x: torch.Tensor, edge_index: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        identity  = self.skip(x)
+        x = F.relu(self.bn1(self.conv1(x, edge_index)))
+        x = F.relu(self.bn2(self.conv2(x, edge_index)))
+        x = F.relu(self.bn3(self.conv3(x, edge_index)))
+        embedding = x + identity
+        return self.head(embedding), embedding
+
+    def head(self, embedding: torch.Tensor) -> torch.Tensor:
+        return F.log_softmax(self.classifier(embedding), dim=1)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PARITY
+# ──────────────────────────────────────────────────────────────────────────────
+
+def sample_subgraph(
+    x:          torch.Tensor,
+    edge_index: torch.Tensor,
+    num_edges:  int = 512,
+    seed:       int = 0,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Random edge sample, relabelled to its endpoints: (x_sub, edge_index_sub)."""
+    gen   = torch.Generator().manual_seed(seed)
+    pick  = torch.randperm(edge_index.size(1), generator=gen)[:num_edges]
+    edges = edge_index[:, pick]
+    nodes, local = torch.unique(edges, return_inverse=True)
+    return x[nodes], local.reshape(2, -1)
+
+
+def check_parity(
+    reference:  Forward,
+    candidate:  Forward,
+    x:          torch.Tensor,
+    edge_index: torch.Tensor,
+    threshold:  float = 0.5,
+    tolerance:  Tuple[float, float] = FP32_TOLERANCE,
+) -> Dict[str, Any]:
+    """
+    Compare two ``(x, edge_index) → (log-probs, embedding)`` callables on the
+    full graph and on a sampled subgraph.  Differences are the worst over
+    both; ``decision_agreement`` is the share of nodes classified the same
+    way at ``threshold``.
+    """
+    report: Dict[str, Any] = {
+        "max_prob_diff":      0.0,
+        "max_logprob_diff":   0.0,
+        "max_embedding_diff": 0.0,
+        "decision_agreement": 1.0,
+        "threshold":          float(threshold),
+    }
+    inputs = {"full": (x, edge_index), "subgraph": sample_subgraph(x, edge_index)}
+    with torch.no_grad():
+        for name, (xi, ei) in inputs.items():
+            ref_lp, ref_emb = reference(xi, ei)
+            can_lp, can_emb = candidate(xi, ei)
+            ref_p, can_p    = ref_lp.exp()[:, 1], can_lp.exp()[:, 1]
+            agree = ((ref_p >= threshold) == (can_p >= threshold)).float().mean().item()
+            report["max_prob_diff"]      = max(report["max_prob_diff"], (ref_p - can_p).abs().max().item())
+            report["max_logprob_diff"]   = max(report["max_logprob_diff"], (ref_lp - can_lp).abs().max().item())
+            report["max_embedding_diff"] = max(report["max_embedding_diff"], (ref_emb - can_emb).abs().max().item())
+            report["decision_agreement"] = min(report["decision_agreement"], agree)
+            report[f"{name}_nodes"]      = int(xi.size(0))
+    prob_atol, min_agreement = tolerance
+    report["passed"] = (
+        report["max_prob_diff"] <= prob_atol and report["decision_agreement"] >= min_agreement
+    )
+    return report
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# EXPORT / LOAD
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _freeze(traced: torch.jit.ScriptModule) -> torch.jit.ScriptModule:
+    frozen = torch.jit.freeze(traced, preserved_attrs=["head"])
+    try:
+        return torch.jit.optimize_for_inference(frozen)
+    except Exception as exc:                  # backend-specific passes are best-effort
+        logger.warning("optimize_for_inference skipped (%s)", exc)
+        return frozen
+
+
+def export_model(
+    model:      torch.nn.Module,
+    x:          torch.Tensor,
+    edge_index: torch.Tensor,
+    path:       Path,
+    quantize:   bool = False,
+    threshold:  float = 0.5,
+    source:     Any = None,
+) -> Dict[str, Any]:
+    """
+    Trace ``model`` on (x, edge_index), freeze it, check parity against the
+    eager model and save to ``path`` with the report embedded.  ``source``
+    identifies the weights (the content hash of mule_model.pth,
+    see ``artifact_watcher.content_signature``).  Returns the stored metadata; an artifact that fails
+    parity is still written, and ``load_exported`` will refuse it.
+    """
+    model = model.cpu().eval()
+    eager = ServingGNN(model)
+    x, edge_index = x.cpu(), edge_index.cpu()
+
+    runtime: torch.nn.Module = ServingGNN(model)
+    if quantize:
+        runtime = torch.ao.quantization.quantize_dynamic(runtime, {torch.nn.Linear}, dtype=torch.qint8)
+
+    with torch.no_grad():
+        _, embedding = eager(x, edge_index)
+        traced = torch.jit.trace_module(
+            runtime, {"forward": (x, edge_index), "head": (embedding[:8],)}, check_trace=False,
+        )
+    exported = _freeze(traced)
+
+    parity = check_parity(
+        eager, exported, x, edge_index, threshold,
+        INT8_TOLERANCE if quantize else FP32_TOLERANCE,
+    )
+    meta = {
+        "format":     EXPORT_FORMAT,
+        "created_at": datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "runtime":    "torchscript-int8" if quantize else "torchscript",
+        "quantized":  quantize,
+        "torch":      torch.__version__,
+        "source":     source,
+        "parity":     parity,
+    }
+    torch.jit.save(exported, str(path), _extra_files={META_FILE: json.dumps(meta)})
+    log = logger.info if parity["passed"] else logger.warning
+    log(
+        "Exported %s → %s | parity %s (max Δp=%.2e, agreement=%.4f)",
+        meta["runtime"], Path(path).name, "OK" if parity["passed"] else "FAILED",
+        parity["max_prob_diff"], parity["decision_agreement"],
+    )
+    return meta
+
+
+def load_exported(path: Path, source: Any = None) -> Optional[Tuple[torch.jit.ScriptModule, Dict[str, Any]]]:
+    """
+    (module, metadata) for a usable export at ``path``, else None — missing,
+    older format, failed parity, exported under another torch version, or
+    (when ``source`` is given) exported from other weights.
+    """
+    if not Path(path).exists():
+        return None
+    extra  = {META_FILE: ""}
+    module = torch.jit.load(str(path), map_location="cpu", _extra_files=extra)
+    meta   = json.loads(extra[META_FILE] or "{}")
+    if meta.get("format") != EXPORT_FORMAT or not meta.get("parity", {}).get("passed"):
+        return None
+    if meta.get("torch") != torch.__version__:          # parity was checked on another build
+        return None
+    if source is not None and meta.get("source") != json.loads(json.dumps(source)):
+        return None
+    return module.eval(), meta
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from train_model import export_serving_model
+
+    parser = argparse.ArgumentParser(description="Re-export the trained model for serving")
+    parser.add_argument("--int8", action="store_true", help="dynamic int8 quantization of Linear layers")
+    args = parser.parse_args()
+    export_serving_model(quantize=args.int8)
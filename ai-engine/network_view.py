@@ -0,0 +1,200 @@
+"""
+MuleHunter AI  ·  Network View  ·  v1.0
+========================================
+Precomputed, paginated risk-ordered subgraphs behind ``/network-snapshot``.
+
+The dashboard asks for "the riskiest accounts and the transactions between
+them".  ``NetworkView`` answers that from arrays built once per serving
+snapshot:
+
+  · the risk ordering of every account (stable, so ties keep ``nodes.csv``
+    order exactly like ``DataFrame.nlargest``)
+  · every transaction edge with both ends in the ordering, keyed by
+    ``max(rank(u), rank(v))`` — the page on which the edge's second endpoint
+    appears — and sorted by that key
+
+so a page ``[lo, hi)`` of the ordering and the edges it closes are two
+``searchsorted`` calls, with no pass over the node table or the edge list.
+Concatenating pages yields the subgraph induced by their union, each edge
+exactly once.  Within a page edges keep NetworkX ``edges()`` order.
+
+Filters (community, ring members only, minimum risk) produce their own
+ordering and edge keys; the last ``FILTER_CACHE_MAX`` of those are cached.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from graph_index import ArrayDiGraph
+from node_store import NodeAttributeStore
+from serving_cache import ShardedLRUCache
+
+FILTER_CACHE_MAX = 64
+
+
+class _Ordering:
+    """Rows of one filtered ordering plus its page-keyed induced edges."""
+
+    __slots__ = ("rows", "edge_keys", "edge_ids")
+
+    def __init__(self, rows: np.ndarray, edge_keys: np.ndarray, edge_ids: np.ndarray) -> None:
+        self.rows      = rows
+        self.edge_keys = edge_keys
+        self.edge_ids  = edge_ids
+
+
+class NetworkView:
+    """Read-only apart from its filter cache (thread-safe)."""
+
+    def __init__(
+        self,
+        ids:         List[str],
+        store:       NodeAttributeStore,
+        graph:       ArrayDiGraph,
+        token:       str,
+        total_nodes: int,
+    ) -> None:
+        self.ids      = ids
+        self.graph    = graph
+        self.token    = token
+        self.risk_col = "community_fraud_rate" if "community_fraud_rate" in store else "pagerank"
+
+        n = len(ids)
+
+        def _col(name: str, dtype) -> np.ndarray:
+            return store.column(name).astype(dtype) if name in store else np.zeros(n, dtype=dtype)
+
+        self.risk      = _col(self.risk_col, np.float64)
+        self.pagerank  = _col("pagerank", np.float64)
+        self.is_fraud  = _col("is_fraud", np.int64)
+        self.community = _col("community_id", np.int64)
+        self.ring      = _col("ring_membership", np.float64) > 0
+
+        # node row → transaction-graph index (-1 when the account has no edges)
+        self.graph_idx = np.fromiter(
+            (graph.index.get(nid, -1) for nid in ids), dtype=np.int64, count=n,
+        )
+        self._edge_src = np.repeat(np.arange(len(graph.ids), dtype=np.int64), graph.adj.out_degrees())
+
+        self.stats = {
+            "total_nodes": int(total_nodes),
+            "total_edges": graph.number_of_edges(),
+            "fraud_nodes": int(self.is_fraud.sum()),
+            "fraud_rate":  round(float(self.is_fraud.mean()), 4) if n else 0.0,
+        }
+        self._order    = np.argsort(-self.risk, kind="stable")
+        self._default  = self._ordering(self._order)
+        self._filtered = ShardedLRUCache("network_view_filters", FILTER_CACHE_MAX, shards=1)
+
+    # ── Orderings ────────────────────────────────────────────────────────────
+
+    def _ordering(self, rows: np.ndarray) -> _Ordering:
+        rank = np.full(len(self.graph.ids), -1, dtype=np.int64)
+        gidx = self.graph_idx[rows]
+        has  = gidx >= 0
+        rank[gidx[has]] = np.flatnonzero(has)
+
+        ru, rv = rank[self._edge_src], rank[self.graph.adj.out_nbrs]
+        ids    = np.flatnonzero((ru >= 0) & (rv >= 0))
+        keys   = np.maximum(ru[ids], rv[ids])
+        sort   = np.argsort(keys, kind="stable")        # edge ids stay ascending per key
+        return _Ordering(rows, keys[sort], ids[sort])
+
+    def ordering(
+        self,
+        community: Optional[int]   = None,
+        ring_only: bool            = False,
+        min_risk:  Optional[float] = None,
+    ) -> _Ordering:
+        if community is None and not ring_only and min_risk is None:
+            return self._default
+
+        def _build() -> _Ordering:
+            keep = np.ones(len(self._order), dtype=bool)
+            rows = self._order
+            if community is not None:
+                keep &= self.community[rows] == community
+            if ring_only:
+                keep &= self.ring[rows]
+            if min_risk is not None:
+                keep &= self.risk[rows] >= min_risk
+            return self._ordering(rows[keep])
+
+        return self._filtered.get_or_compute((community, ring_only, min_risk), _build)
+
+    # ── Cursors ──────────────────────────────────────────────────────────────
+
+    def cursor(self, offset: int) -> str:
+        return f"{self.token}.{offset}"
+
+    def parse_cursor(self, cursor: Optional[str]) -> int:
+        """Offset encoded in ``cursor`` (0 when absent); ValueError if stale or malformed."""
+        if not cursor:
+            return 0
+        token, _, offset = cursor.rpartition(".")
+        if token != self.token:
+            raise ValueError("cursor belongs to an earlier snapshot — restart from the first page")
+        if not offset.isdigit():
+            raise ValueError(f"malformed cursor {cursor!r}")
+        return int(offset)
+
+    # ── Pages ────────────────────────────────────────────────────────────────
+
+    def page(
+        self,
+        offset:     int,
+        limit:      int,
+        edge_limit: int,
+        **filters:  Any,
+    ) -> Dict[str, Any]:
+        """
+        Nodes ``[offset, offset + limit)`` of the filtered ordering and the
+        edges joining them to each other or to higher-ranked nodes, at most
+        ``edge_limit``.
+        """
+        ordering = self.ordering(**filters)
+        total    = len(ordering.rows)
+        lo, hi   = min(offset, total), min(offset + limit, total)
+        rows     = ordering.rows[lo:hi]
+
+        a, b   = np.searchsorted(ordering.edge_keys, (lo, hi))
+        edges  = np.sort(ordering.edge_ids[a:b])
+        if edge_limit > 0:
+            edges = edges[:edge_limit]
+        gids   = self.graph.ids
+        src    = self._edge_src[edges].tolist()
+        dst    = self.graph.adj.out_nbrs[edges].tolist()
+        weight = self.graph.adj.out_weights[edges].tolist()
+
+        nodes = [
+            {
+                "id":        self.ids[r],
+                "is_fraud":  f,
+                "risk":      round(k, 4),
+                "ring":      g,
+                "pagerank":  round(p, 6),
+                "community": c,
+            }
+            for r, f, k, g, p, c in zip(
+                rows.tolist(), self.is_fraud[rows].tolist(), self.risk[rows].tolist(),
+                self.ring[rows].tolist(), self.pagerank[rows].tolist(), self.community[rows].tolist(),
+            )
+        ]
+        return {
+            "nodes": nodes,
+            "edges": [
+                {"source": gids[u], "target": gids[v], "weight": round(w, 2)}
+                for u, v, w in zip(src, dst, weight)
+            ],
+            "stats": self.stats,
+            "page":  {
+                "total":       total,
+                "offset":      lo,
+                "limit":       limit,
+                "next_cursor": self.cursor(hi) if hi < total else None,
+                "risk_metric": self.risk_col,
+            },
+        }
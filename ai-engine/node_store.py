@@ -0,0 +1,258 @@
+"""
+MuleHunter AI  ·  Node Attribute Store  ·  v1.0
+================================================
+Columnar per-node attributes for the serving path.
+
+``nodes.csv`` is loaded once into one contiguous NumPy array per column,
+indexed by the integer node index from ``id_map`` (the same row order as
+``processed_graph.pt``).  Every per-node read on the request path is then a
+plain array index instead of a pandas row filter or ``iloc`` call.
+
+Stored columns
+──────────────
+  · every FEATURE_COL present in the frame     float64
+  · community_id                               int64
+  · is_fraud                                   int8
+
+``CommunityTable`` holds the per-community aggregates behind the
+``fraudCluster`` block and ``/cluster-report``; ``LogitTable`` the per-node
+logits, with the rows live ingestion refreshed layered over them.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Non-feature columns the service reads per node.  pagerank and
+# ring_membership are FEATURE_COLS, so they are always stored as features.
+EXTRA_COLS: dict[str, type] = {
+    "community_id": np.int64,
+    "is_fraud":     np.int8,
+}
+
+
+class NodeAttributeStore:
+    """Read-only column store; safe to share between worker threads."""
+
+    __slots__ = ("num_nodes", "feature_cols", "_columns", "_feature_items")
+
+    def __init__(
+        self,
+        columns:      Dict[str, np.ndarray],
+        feature_cols: Iterable[str],
+    ) -> None:
+        self._columns     = columns
+        self.feature_cols: List[str] = [c for c in feature_cols if c in columns]
+        self._feature_items = [(c, columns[c]) for c in self.feature_cols]
+        self.num_nodes    = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_frame(
+        cls,
+        df:           pd.DataFrame,
+        feature_cols: Iterable[str],
+    ) -> "NodeAttributeStore":
+        """Copy the relevant ``df`` columns into contiguous typed arrays."""
+        feature_cols = list(feature_cols)
+        columns: Dict[str, np.ndarray] = {}
+        for col in feature_cols:
+            if col in df.columns:
+                columns[col] = np.ascontiguousarray(
+                    pd.to_numeric(df[col], errors="coerce").fillna(0.0).to_numpy(),
+                    dtype=np.float64,
+                )
+        for col, dtype in EXTRA_COLS.items():
+            if col in df.columns:
+                columns[col] = np.ascontiguousarray(
+                    pd.to_numeric(df[col], errors="coerce").fillna(0).to_numpy(),
+                    dtype=dtype,
+                )
+        return cls(columns, feature_cols)
+
+    # ── Column access ────────────────────────────────────────────────────────
+
+    def __contains__(self, col: str) -> bool:
+        return col in self._columns
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, col: str) -> np.ndarray:
+        return self._columns[col]
+
+    def value(self, col: str, idx: int, default: float = 0.0) -> float:
+        arr = self._columns.get(col)
+        return default if arr is None else arr[idx].item()
+
+    def features(self, idx: int) -> dict:
+        """FEATURE_COLS → float for one node (same shape as the old iloc dict)."""
+        return {col: arr[idx].item() for col, arr in self._feature_items}
+
+    def nbytes(self) -> int:
+        return sum(arr.nbytes for arr in self._columns.values())
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# COMMUNITY AGGREGATES
+# ──────────────────────────────────────────────────────────────────────────────
+
+class CommunityTable:
+    """
+    Per-community aggregates computed once from a ``NodeAttributeStore``.
+
+    One ``np.unique`` + three ``np.bincount`` passes give size, labelled
+    fraud count and mean ``community_fraud_rate`` for every community.
+    Members are stored grouped by community and sorted by descending
+    pagerank, so the top-k members of any community are a slice.
+    """
+
+    __slots__ = (
+        "community_ids", "size", "fraud_count", "mean_fraud_rate",
+        "_node_row", "_row", "_member_offsets", "_members",
+    )
+
+    def __init__(
+        self,
+        community_ids:   np.ndarray,
+        size:            np.ndarray,
+        fraud_count:     np.ndarray,
+        mean_fraud_rate: np.ndarray,
+        node_row:        np.ndarray,
+        member_offsets:  np.ndarray,
+        members:         np.ndarray,
+    ) -> None:
+        self.community_ids   = community_ids
+        self.size            = size
+        self.fraud_count     = fraud_count
+        self.mean_fraud_rate = mean_fraud_rate
+        self._node_row       = node_row
+        self._member_offsets = member_offsets
+        self._members        = members
+        self._row: Dict[int, int] = {
+            cid: i for i, cid in enumerate(community_ids.tolist())
+        }
+
+    @classmethod
+    def from_store(cls, store: NodeAttributeStore) -> "CommunityTable":
+        n = store.num_nodes
+        cids = store.column("community_id") if "community_id" in store else np.zeros(n, np.int64)
+        ids, inverse = np.unique(cids, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        k = len(ids)
+
+        def _col(name: str) -> np.ndarray:
+            return store.column(name) if name in store else np.zeros(n)
+
+        size        = np.bincount(inverse, minlength=k).astype(np.int64)
+        fraud_count = np.bincount(inverse, weights=_col("is_fraud"), minlength=k).astype(np.int64)
+        rate_sum    = np.bincount(inverse, weights=_col("community_fraud_rate"), minlength=k)
+        mean_rate   = rate_sum / np.maximum(size, 1)
+
+        # Primary key: community row; secondary: pagerank descending.
+        members = np.lexsort((-_col("pagerank"), inverse)).astype(np.int32)
+        offsets = np.zeros(k + 1, dtype=np.int64)
+        np.cumsum(size, out=offsets[1:])
+
+        return cls(
+            ids, size, fraud_count, mean_rate,
+            inverse.astype(np.int32), offsets, members,
+        )
+
+    def __len__(self) -> int:
+        return len(self.community_ids)
+
+    # ── Lookups ──────────────────────────────────────────────────────────────
+
+    def row_of_node(self, idx: int) -> int:
+        return int(self._node_row[idx])
+
+    def row(self, community_id: int) -> Optional[int]:
+        return self._row.get(int(community_id))
+
+    def size_of(self, community_id: int) -> int:
+        r = self.row(community_id)
+        return 0 if r is None else int(self.size[r])
+
+    def risk_score(self, community_id: int) -> float:
+        r = self.row(community_id)
+        return 0.0 if r is None else float(self.mean_fraud_rate[r])
+
+    def top_members(self, community_id: int, k: int = 5) -> np.ndarray:
+        """Node indices of the ``k`` highest-pagerank members."""
+        r = self.row(community_id)
+        if r is None:
+            return self._members[:0]
+        start = self._member_offsets[r]
+        return self._members[start:min(start + k, self._member_offsets[r + 1])]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# LOGIT TABLE
+# ──────────────────────────────────────────────────────────────────────────────
+
+class LogitTable:
+    """
+    Per-node (risk, confidence, emb_norm) rows: the table from the last
+    full forward pass plus the rows live ingestion has refreshed since.
+
+    The base array is never written (it may be a read-only snapshot
+    mapping).  ``with_rows`` returns a new table that shares it and copies
+    only the refreshed rows, so an ingest costs O(refreshed) instead of a
+    full-table copy; ``compacted`` folds the refreshed rows into a new base.
+    """
+
+    __slots__ = ("base", "_idx", "_rows")
+
+    def __init__(
+        self,
+        base: np.ndarray,
+        idx:  Optional[np.ndarray] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> None:
+        self.base  = base
+        self._idx  = idx if idx is not None else np.zeros(0, np.int64)
+        self._rows = rows if rows is not None else np.zeros((0, base.shape[1]), base.dtype)
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    @property
+    def refreshed(self) -> int:
+        return len(self._idx)
+
+    def rows(self, idx: np.ndarray) -> np.ndarray:
+        """``(len(idx), 3)`` rows for node indices ``idx``."""
+        idx = np.asarray(idx, dtype=np.int64).reshape(-1)
+        out = self.base[idx]
+        if len(self._idx) and len(idx):
+            pos = np.minimum(np.searchsorted(self._idx, idx), len(self._idx) - 1)
+            hit = self._idx[pos] == idx
+            out[hit] = self._rows[pos[hit]]
+        return out
+
+    def row(self, idx: int) -> tuple[float, float, float]:
+        return tuple(self.rows(np.array([idx]))[0].tolist())
+
+    def with_rows(self, idx: np.ndarray, rows: np.ndarray) -> "LogitTable":
+        """New table where ``idx`` read ``rows``; everything else is shared."""
+        idx  = np.asarray(idx, dtype=np.int64).reshape(-1)
+        keep = ~np.isin(self._idx, idx)
+        all_idx  = np.concatenate((self._idx[keep], idx))
+        all_rows = np.concatenate((self._rows[keep], np.asarray(rows, dtype=self.base.dtype)))
+        order = np.argsort(all_idx, kind="stable")
+        return LogitTable(self.base, all_idx[order], all_rows[order])
+
+    def compacted(self) -> "LogitTable":
+        if not len(self._idx):
+            return self
+        base = np.array(self.base)
+        base[self._idx] = self._rows
+        return LogitTable(base)
+
+    def array(self) -> np.ndarray:
+        """The whole table as one ``(N, 3)`` array."""
+        return self.compacted().base
@@ -0,0 +1,150 @@
+"""
+MuleHunter AI  ·  Ring Pool  ·  v1.0
+=====================================
+Ring enumeration across a process pool, with output identical to the
+serial ``RingEnumerator.rings()``.
+
+The pruned graph — ring-capable SCC edges as CSR/CSC arrays plus the SCC
+labels — is copied once into ``multiprocessing.shared_memory`` blocks, and
+every worker maps them in place (``RingEnumerator.from_arrays``), so
+nothing graph-sized is pickled per task.
+
+Work is cut into chunks: one ring size × a contiguous range of the
+ring-capable roots.  SCCs already decide which nodes are roots and confine
+each root's search to its own component; ranges (rather than whole SCCs)
+keep a giant SCC from landing on one worker.  Every ring is produced by
+exactly one root (its lowest node — the canonical rotation), so chunks
+never overlap and merging needs no deduplication: chunks are consumed in
+(size, root) order, which is the serial order.  A bounded window of chunks
+is in flight, so once the caller's ring budget is met the remaining chunks
+are cancelled instead of computed.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing as mp
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ring_engine import MIN_RING_SIZE, Ring, RingEnumerator
+
+logger = logging.getLogger("MuleHunter-FeatureEng")
+
+PARALLEL_MIN_ROOTS = 256    # below this the pool costs more than it saves
+CHUNKS_PER_WORKER  = 8      # per ring size; small chunks balance uneven roots
+WINDOW_PER_WORKER  = 2      # chunks in flight per worker
+
+Spec = Dict[str, Tuple[str, Tuple[int, ...], str]]
+
+_engine: Optional[RingEnumerator] = None
+_blocks: List[shared_memory.SharedMemory] = []
+
+
+# ── Shared memory ────────────────────────────────────────────────────────────
+
+def _share(arrays: Dict[str, np.ndarray]) -> Tuple[List[shared_memory.SharedMemory], Spec]:
+    blocks: List[shared_memory.SharedMemory] = []
+    spec:   Spec = {}
+    for name, arr in arrays.items():
+        arr = np.ascontiguousarray(arr)
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+        blocks.append(shm)
+        spec[name] = (shm.name, arr.shape, arr.dtype.str)
+    return blocks, spec
+
+
+def _init_worker(spec: Spec, max_len: int) -> None:
+    global _engine
+    arrays: Dict[str, np.ndarray] = {}
+    for name, (shm_name, shape, dtype) in spec.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _blocks.append(shm)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    _engine = RingEnumerator.from_arrays(arrays, max_len)
+
+
+def _run_chunk(size: int, roots: List[int], cap: int) -> List[Ring]:
+    """Rings of ``size`` rooted in ``roots``, in serial order, at most ``cap``."""
+    out: List[Ring] = []
+    for root in roots:
+        for ring in _engine.rings_for(size, root):
+            out.append(ring)
+            if len(out) >= cap:
+                return out
+    return out
+
+
+# ── Driver ───────────────────────────────────────────────────────────────────
+
+def chunks(engine: RingEnumerator, workers: int) -> List[Tuple[int, List[int]]]:
+    """(ring size, roots) work units in serial output order."""
+    roots = engine.roots.tolist()
+    if not roots:
+        return []
+    step  = max(1, math.ceil(len(roots) / (workers * CHUNKS_PER_WORKER)))
+    parts = [roots[i:i + step] for i in range(0, len(roots), step)]
+    return [(size, part) for size in range(MIN_RING_SIZE, engine.max_len + 1) for part in parts]
+
+
+def parallel_rings(engine: RingEnumerator, limit: int, workers: int) -> Iterator[Ring]:
+    """
+    The first ``limit`` rings of ``engine.rings()``, in the same order,
+    enumerated by ``workers`` processes.  Falls back to the serial iterator
+    for small graphs or when no process pool can be started.
+    """
+    if workers <= 1 or len(engine.roots) < PARALLEL_MIN_ROOTS:
+        yield from _take(engine.rings(), limit)
+        return
+
+    work   = chunks(engine, workers)
+    blocks, spec = _share(engine.arrays())
+    pool: Optional[ProcessPoolExecutor] = None
+    try:
+        try:
+            pool = ProcessPoolExecutor(
+                workers, mp_context=mp.get_context("spawn"),
+                initializer=_init_worker, initargs=(spec, engine.max_len),
+            )
+        except Exception as exc:              # no subprocesses here — stay serial
+            logger.warning("  Ring pool unavailable (%s) — enumerating serially", exc)
+            yield from _take(engine.rings(), limit)
+            return
+        logger.info("  Ring enumeration: %d workers, %d chunks", workers, len(work))
+
+        remaining = limit
+        pending: Deque[Future] = deque()
+        queued = iter(work)
+        window = workers * WINDOW_PER_WORKER
+        while remaining > 0:
+            while len(pending) < window:
+                nxt = next(queued, None)
+                if nxt is None:
+                    break
+                pending.append(pool.submit(_run_chunk, nxt[0], nxt[1], remaining))
+            if not pending:
+                break
+            for ring in pending.popleft().result():
+                yield ring
+                remaining -= 1
+                if remaining <= 0:
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _take(rings: Iterator[Ring], limit: int) -> Iterator[Ring]:
+    for i, ring in enumerate(rings):
+        if i >= limit:
+            return
+        yield ring
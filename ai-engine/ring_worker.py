@@ -0,0 +1,260 @@
+"""
+MuleHunter AI  ·  Ring Worker  ·  v1.0
+=======================================
+Bounded ring (short cycle) search over the account subgraph, off the
+request path.
+
+``find_rings`` is the search itself: a deterministic sample of the rings
+``RingEnumerator`` (ring_engine.py) would enumerate, spread over every ring
+size and the whole graph.  The ring budget is split across sizes 3 … 6
+(budget a size leaves unused passes to the larger ones); within a size the
+ring-capable roots are visited in a fixed seeded order and each contributes
+at most one ring, so the cache is not the first few hundred triangles of
+the lowest-index accounts.  There is no wall-clock cut-off — the same graph
+always gives the same rings.  It only needs the CSR arrays, so
+``RingSearch`` can run it in a separate process — the DFS is pure Python
+and would otherwise hold the GIL against request threads.
+
+The worker streams ``("rings", [(path, volume), …])`` batches and
+``("progress", (done, total))`` task counts back over a queue; a
+daemon thread in the service drains it and hands the cumulative result to
+``on_update`` after every batch, so ring fields fill in progressively while
+scoring is already live.
+
+Modes: ``process`` (default), ``thread`` (same search in a daemon thread —
+for platforms without fork/spawn) and ``sync`` (run on the caller's
+thread; used when compiling the serving snapshot, which must contain the
+whole sample).
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ring_engine import MAX_RING_SIZE, MIN_RING_SIZE, Ring, RingEnumerator
+
+logger = logging.getLogger("MuleHunter-Inference")
+
+EMIT_EVERY   = 16        # rings per streamed batch
+PROGRESS_SEC = 0.25      # minimum interval between progress messages
+SAMPLE_SEED  = 42        # root visiting order within each ring size
+
+Emit     = Callable[[str, Any], None]
+OnUpdate = Callable[[List[Ring]], None]
+
+
+def find_rings(
+    out_offsets: np.ndarray,
+    out_nbrs:    np.ndarray,
+    out_weights: np.ndarray,
+    is_account:  np.ndarray,
+    max_rings:   int,
+    emit:        Optional[Emit] = None,
+    seed:        int = SAMPLE_SEED,
+) -> Tuple[List[Ring], Dict[int, int]]:
+    """
+    (rings as (node-index path, volume) in discovery order, rings per size).
+    Sizes come smallest first; each gets an even share of what is left of
+    ``max_rings``, filled by at most one ring per root.
+    """
+    engine = RingEnumerator(out_offsets, out_nbrs, out_weights, is_account, max_len=MAX_RING_SIZE)
+    sizes  = list(range(MIN_RING_SIZE, engine.max_len + 1))
+    roots  = engine.roots[np.random.default_rng(seed).permutation(len(engine.roots))].tolist()
+    total  = len(sizes) * len(roots)
+    rings:   List[Ring]     = []
+    batch:   List[Ring]     = []
+    by_size: Dict[int, int] = {}
+    last_report = 0.0
+
+    for k, size in enumerate(sizes):
+        quota = -(-(max_rings - len(rings)) // (len(sizes) - k))
+        taken = 0
+        for done, root in enumerate(roots):
+            if taken >= quota:
+                break
+            if emit is not None and time.monotonic() - last_report >= PROGRESS_SEC:
+                emit("progress", (k * len(roots) + done, total))
+                last_report = time.monotonic()
+            ring = next(engine.rings_for(size, root), None)
+            if ring is None:
+                continue
+            rings.append(ring)
+            batch.append(ring)
+            taken += 1
+            if emit is not None and len(batch) >= EMIT_EVERY:
+                emit("rings", batch)
+                batch = []
+        by_size[size] = taken
+
+    if emit is not None:
+        if batch:
+            emit("rings", batch)
+        emit("progress", (total, total))
+    return rings, by_size
+
+
+def _process_main(out: "mp.Queue", *args: Any) -> None:
+    try:
+        _, by_size = find_rings(*args, emit=lambda kind, payload: out.put((kind, payload)))
+        out.put(("done", by_size))
+    except BaseException as exc:                   # report, never hang the drainer
+        out.put(("error", repr(exc)))
+
+
+class RingSearch:
+    """
+    One background ring search.  ``status()`` is safe to call from any
+    thread; ``cancel()`` stops the worker (used when the owning snapshot is
+    replaced).
+    """
+
+    def __init__(
+        self,
+        out_offsets: np.ndarray,
+        out_nbrs:    np.ndarray,
+        out_weights: np.ndarray,
+        is_account:  np.ndarray,
+        on_update:   OnUpdate,
+        max_rings:   int,
+        mode:        str = "process",
+    ) -> None:
+        if mode not in ("process", "thread", "sync"):
+            raise ValueError(f"unknown ring search mode {mode!r}")
+        self.mode       = mode
+        self._args      = (
+            np.asarray(out_offsets), np.asarray(out_nbrs), np.asarray(out_weights),
+            np.asarray(is_account, dtype=bool), int(max_rings),
+        )
+        self._on_update = on_update
+        self._rings: List[Ring] = []
+        self._lock      = threading.Lock()
+        self._cancelled = threading.Event()
+        self._done      = threading.Event()
+        self._process: Optional[mp.process.BaseProcess] = None
+        self._thread:  Optional[threading.Thread]        = None
+        self._status: Dict[str, Any] = {
+            "state":     "pending",
+            "mode":      mode,
+            "percent":   0.0,
+            "found":     0,
+            "by_size":   {},
+            "error":     None,
+            "started":   None,
+            "elapsed":   0.0,
+        }
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+
+    def start(self) -> "RingSearch":
+        self._status.update(state="running", started=time.monotonic())
+        if self.mode == "sync":
+            self._run_inline()
+            return self
+        target = self._drain_process if self.mode == "process" else self._run_inline
+        self._thread = threading.Thread(target=target, name="ring-search", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        proc = self._process
+        if proc is not None and proc.is_alive():
+            proc.terminate()
+        if not self._done.is_set():
+            self._finish("cancelled")
+
+    # ── Workers ──────────────────────────────────────────────────────────────
+
+    def _run_inline(self) -> None:
+        try:
+            _, by_size = find_rings(*self._args, emit=self._handle)
+            self._finish("complete", by_size=by_size)
+        except Exception as exc:
+            logger.exception("Ring search failed")
+            self._finish("failed", error=repr(exc))
+
+    def _drain_process(self) -> None:
+        ctx = mp.get_context("spawn")
+        out = ctx.Queue()
+        try:
+            self._process = ctx.Process(
+                target=_process_main, args=(out, *self._args), name="ring-search", daemon=True,
+            )
+            self._process.start()
+        except Exception as exc:                   # no subprocesses here — stay in-process
+            logger.warning("Ring search process unavailable (%s) — using a thread", exc)
+            self.mode = self._status["mode"] = "thread"
+            self._run_inline()
+            return
+
+        while not self._cancelled.is_set():
+            try:
+                kind, payload = out.get(timeout=0.5)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    self._finish("failed", error=f"worker exited with code {self._process.exitcode}")
+                    return
+                continue
+            if kind == "done":
+                self._finish("complete", by_size=payload)
+                break
+            if kind == "error":
+                self._finish("failed", error=payload)
+                break
+            self._handle(kind, payload)
+        self._process.join(timeout=1.0)
+
+    def _handle(self, kind: str, payload: Any) -> None:
+        if self._cancelled.is_set():
+            return
+        if kind == "progress":
+            done, total = payload
+            self._status["percent"] = round(100.0 * done / total, 1) if total else 100.0
+        elif kind == "rings":
+            with self._lock:
+                self._rings = self._rings + [(list(p), float(v)) for p, v in payload]
+                rings = self._rings
+            self._status["found"] = len(rings)
+            self._on_update(rings)
+
+    def _finish(
+        self,
+        state:   str,
+        by_size: Optional[Dict[int, int]] = None,
+        error:   Optional[str] = None,
+    ) -> None:
+        if self._done.is_set():
+            return
+        if state == "complete":
+            self._status["percent"] = 100.0
+        self._status.update(
+            state=state, by_size=by_size or {}, error=error,
+            elapsed=round(time.monotonic() - (self._status["started"] or time.monotonic()), 3),
+        )
+        self._done.set()
+        if state == "complete":
+            logger.info(
+                "Ring search complete: %d rings %s in %.1fs",
+                self._status["found"], self._status["by_size"], self._status["elapsed"],
+            )
+        elif state == "failed":
+            logger.error("Ring search failed: %s", error)
+
+    # ── Telemetry ────────────────────────────────────────────────────────────
+
+    def status(self) -> Dict[str, Any]:
+        st = dict(self._status)
+        st.pop("started", None)
+        if st["state"] == "running" and self._status["started"] is not None:
+            st["elapsed"] = round(time.monotonic() - self._status["started"], 3)
+        return st
@@ -0,0 +1,103 @@
+"""
+MuleHunter AI  ·  Score Encoder  ·  v1.0
+=========================================
+Precompiled JSON encoding for ``/v1/gnn/score`` responses (opt-in via
+``FAST_SCORE_JSON=1``).
+
+The default path validates every response through the ``GnnScoreResponse``
+pydantic model and lets FastAPI re-serialise it.  ``ObjectEncoder`` instead
+writes the response straight to bytes:
+
+  · the key prefixes (``{"model":``, ``,"version":`` …) are encoded once, in
+    schema field order
+  · values wrapped in ``Raw`` are already-encoded JSON and are spliced in
+    unchanged — the service keeps the per-account ``fraudCluster`` and
+    ``muleRingDetection`` objects pre-encoded this way
+  · everything else goes through ``dumps`` — orjson when it is installed,
+    else the stdlib encoder with FastAPI's settings (compact separators,
+    ``ensure_ascii=False``, no NaN)
+
+``utc_timestamp`` formats the response timestamp once per second instead of
+once per request.  The output parses to exactly the same JSON document as
+the pydantic path (key order included); ``compare`` is the check the
+service runs on startup before it enables the fast path.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:              # optional: the stdlib encoder produces the same document
+    orjson = None
+
+ENCODER = "orjson" if orjson is not None else "json"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+dumps: Callable[[Any], bytes] = orjson.dumps if orjson is not None else _stdlib_dumps
+
+
+class Raw(bytes):
+    """An already-encoded JSON value."""
+
+    __slots__ = ()
+
+
+def raw(obj: Any) -> Raw:
+    return Raw(dumps(obj))
+
+
+class ObjectEncoder:
+    """Encodes mappings with a fixed key set, in the order given at construction."""
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.fields = list(fields)
+        self._prefixes: List[Tuple[str, bytes]] = [
+            (name, (b"{" if i == 0 else b",") + dumps(name) + b":")
+            for i, name in enumerate(self.fields)
+        ]
+
+    def encode(self, values: Mapping[str, Any]) -> bytes:
+        parts: List[bytes] = []
+        for name, prefix in self._prefixes:
+            value = values[name]
+            parts.append(prefix)
+            parts.append(value if isinstance(value, Raw) else dumps(value))
+        parts.append(b"}")
+        return b"".join(parts)
+
+
+_clock: Tuple[int, str] = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """``datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")``, formatted once per second."""
+    global _clock
+    now = int(time.time())
+    sec, text = _clock
+    if sec != now:
+        text   = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _clock = (now, text)
+    return text
+
+
+def compare(expected: bytes, actual: bytes, ignore: Sequence[str] = ()) -> Dict[str, Any]:
+    """
+    Semantic comparison of two encoded objects: same keys in the same order
+    and equal values after parsing.  Keys in ``ignore`` (the timestamp) only
+    have to be present.
+    """
+    a, b = json.loads(expected), json.loads(actual)
+    diffs = [k for k in a if k not in ignore and a[k] != b.get(k)]
+    return {
+        "same_order": list(a) == list(b),
+        "diff_keys":  diffs,
+        "passed":     list(a) == list(b) and not diffs,
+    }
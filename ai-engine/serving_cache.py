@@ -0,0 +1,140 @@
+"""
+MuleHunter AI  ·  Serving Cache  ·  v1.0
+=========================================
+Bounded, thread-safe LRU cache with per-entry TTL for per-account lookups.
+
+FastAPI runs sync endpoints on a thread pool, so any memo shared between
+requests must be locked.  One global lock would serialise every request on
+the cache, so keys are spread over N independent shards, each an
+``OrderedDict`` (true LRU order via ``move_to_end``) guarded by its own lock.
+
+Counters (hits / misses / evictions / expirations) are kept per shard under
+the shard lock and summed on read for ``/health``.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_MISSING = object()
+
+
+class _Shard:
+    __slots__ = ("lock", "data", "hits", "misses", "evictions", "expirations")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.data: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+
+class ShardedLRUCache:
+    """
+    ``max_size`` is split evenly across shards (rounded up), so eviction is
+    LRU per shard — approximately LRU overall for well-spread keys.  ``ttl_sec=None``
+    disables expiry.
+    """
+
+    def __init__(
+        self,
+        name:     str,
+        max_size: int,
+        ttl_sec:  Optional[float] = None,
+        shards:   int = 16,
+        clock:    Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.name      = name
+        self.max_size  = int(max_size)
+        self.ttl_sec   = ttl_sec
+        self._clock    = clock
+        self._shards   = [_Shard() for _ in range(max(1, int(shards)))]
+        self._per_shard = max(1, -(-self.max_size // len(self._shards)))
+
+    def _shard(self, key: Hashable) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    # ── Core API ─────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.data.get(key, _MISSING)
+            if entry is _MISSING:
+                shard.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at and expires_at <= self._clock():
+                del shard.data[key]
+                shard.expirations += 1
+                shard.misses += 1
+                return default
+            shard.data.move_to_end(key)
+            shard.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = self._clock() + self.ttl_sec if self.ttl_sec else 0.0
+        shard = self._shard(key)
+        with shard.lock:
+            shard.data[key] = (value, expires_at)
+            shard.data.move_to_end(key)
+            while len(shard.data) > self._per_shard:
+                shard.data.popitem(last=False)
+                shard.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value or compute and store it.  ``compute`` runs
+        outside the shard lock, so two threads may race on a cold key; the
+        last writer wins, which is fine for deterministic lookups.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.data.pop(key, None)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+
+    def __len__(self) -> int:
+        return sum(len(s.data) for s in self._shards)
+
+    # ── Telemetry ────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        hits = misses = evictions = expirations = size = 0
+        for shard in self._shards:
+            with shard.lock:
+                hits        += shard.hits
+                misses      += shard.misses
+                evictions   += shard.evictions
+                expirations += shard.expirations
+                size        += len(shard.data)
+        lookups = hits + misses
+        return {
+            "size":        size,
+            "max_size":    self.max_size,
+            "ttl_sec":     self.ttl_sec,
+            "hits":        hits,
+            "misses":      misses,
+            "evictions":   evictions,
+            "expirations": expirations,
+            "hit_rate":    round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def cache_stats(caches: List[ShardedLRUCache]) -> Dict[str, Dict[str, Any]]:
+    return {c.name: c.stats() for c in caches}
@@ -0,0 +1,178 @@
+"""
+MuleHunter AI  ·  Serving Snapshot  ·  v1.0
+============================================
+Single-file, memory-mappable bundle of named NumPy arrays plus a JSON header.
+
+``inference_service.compile_serving_snapshot`` writes everything the service
+would otherwise rebuild at startup (id table, CSR arrays, node attribute
+columns, logits, embedding index, ring index, model weights) into one file;
+``load_assets`` maps it back with ``np.memmap`` and wraps the arrays without
+copying, so startup cost is page-cache I/O rather than CSV parsing, graph
+construction, ring search and a full forward pass.
+
+Layout
+──────
+  [0:8)     magic  b"MHSNAP01"
+  [8:16)    header length, little-endian uint64
+  [16:…)    header JSON (utf-8), zero-padded to a 64-byte boundary
+  […]       array payloads, each starting on a 64-byte boundary
+
+The header holds ``{"format", "created_at", "sources", "meta", "arrays"}``,
+where ``arrays`` maps name → ``{"dtype", "shape", "offset"}`` (offset from
+the start of the file).  ``sources`` holds the content hash of every artifact
+the bundle was compiled from; a bundle whose sources no longer match the
+bytes on disk is stale and is ignored by the service.
+
+The file is written to a temporary name and moved into place with
+``os.replace``, so a reader never maps a half-written bundle, and a process
+that still maps the previous bundle keeps a valid view of it.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+MAGIC     = b"MHSNAP01"
+FORMAT    = 3          # bumped whenever the set of compiled arrays changes
+ALIGNMENT = 64
+
+
+class SnapshotError(ValueError):
+    """The file is not a readable serving snapshot."""
+
+
+def _align(n: int) -> int:
+    return -(-n // ALIGNMENT) * ALIGNMENT
+
+
+def encode_strings(values: List[str]) -> np.ndarray:
+    """Newline-joined utf-8 bytes as a uint8 array (ids never contain newlines)."""
+    if any("\n" in v for v in values):
+        raise ValueError("snapshot strings must not contain newlines")
+    return np.frombuffer("\n".join(values).encode("utf-8"), dtype=np.uint8)
+
+
+def decode_strings(arr: np.ndarray, count: int) -> List[str]:
+    if count == 0:
+        return []
+    values = arr.tobytes().decode("utf-8").split("\n")
+    if len(values) != count:
+        raise SnapshotError(f"string table has {len(values)} entries, expected {count}")
+    return values
+
+
+def write_snapshot(
+    path:    Path,
+    arrays:  Dict[str, np.ndarray],
+    meta:    Dict[str, Any],
+    sources: Dict[str, Any],
+) -> int:
+    """Write ``arrays`` + ``meta`` to ``path`` atomically.  Returns the file size."""
+    arrays = {name: np.ascontiguousarray(arr) for name, arr in arrays.items()}
+    layout: Dict[str, Dict[str, Any]] = {
+        name: {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": 0}
+        for name, arr in arrays.items()
+    }
+    header = {
+        "format":     FORMAT,
+        "created_at": datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "sources":    sources,
+        "meta":       meta,
+        "arrays":     layout,
+    }
+
+    # Offsets depend on the header size, which depends on the offsets'
+    # digits; iterate until the header stops growing (twice at most).
+    header_len = 0
+    while True:
+        offset = _align(16 + header_len)
+        for name, arr in arrays.items():
+            layout[name]["offset"] = offset
+            offset = _align(offset + arr.nbytes)
+        blob = json.dumps(header).encode("utf-8")
+        if len(blob) <= header_len:
+            break
+        header_len = len(blob)
+    blob = blob.ljust(header_len, b" ")
+
+    tmp = Path(f"{path}.tmp-{os.getpid()}")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", header_len))
+        f.write(blob)
+        for name, arr in arrays.items():
+            f.seek(layout[name]["offset"])
+            f.write(arr.tobytes())
+        f.truncate(max(_align(16 + header_len), offset))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return os.path.getsize(path)
+
+
+class ServingSnapshot:
+    """
+    Read side of a snapshot file.  ``array(name)`` returns a zero-copy view
+    into a private copy-on-write mapping: callers may treat arrays as
+    ordinary (writable) NumPy arrays, and writes never reach the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if f.read(8) != MAGIC:
+                raise SnapshotError(f"{self.path.name}: bad magic")
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            try:
+                self.header: Dict[str, Any] = json.loads(f.read(header_len))
+            except ValueError as exc:
+                raise SnapshotError(f"{self.path.name}: corrupt header") from exc
+        if self.header.get("format") != FORMAT:
+            raise SnapshotError(f"{self.path.name}: format {self.header.get('format')} != {FORMAT}")
+        self._map    = np.memmap(self.path, dtype=np.uint8, mode="c")
+        self._layout = self.header["arrays"]
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self.header["meta"]
+
+    @property
+    def sources(self) -> Dict[str, Any]:
+        return self.header.get("sources", {})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._layout
+
+    def names(self, prefix: str = "") -> List[str]:
+        return [n for n in self._layout if n.startswith(prefix)]
+
+    def array(self, name: str) -> np.ndarray:
+        spec  = self._layout[name]
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        count = int(np.prod(shape, dtype=np.int64))
+        start = spec["offset"]
+        return self._map[start:start + count * dtype.itemsize].view(dtype).reshape(shape)
+
+    def nbytes(self) -> int:
+        return len(self._map)
+
+
+def open_snapshot(path: Path, sources: Optional[Dict[str, Any]] = None) -> Optional[ServingSnapshot]:
+    """
+    Map ``path`` if it exists and — when ``sources`` is given — was compiled
+    from exactly those artifacts.  Returns None otherwise.
+    """
+    if not path.exists():
+        return None
+    snap = ServingSnapshot(path)
+    if sources is not None and snap.sources != json.loads(json.dumps(sources)):
+        return None
+    return snap
@@ -0,0 +1,127 @@
+"""
+MuleHunter AI  ·  Single Flight  ·  v1.0
+=========================================
+Request coalescing for concurrent work on the same key.
+
+In a fraud burst many transactions from one mule account reach
+``/v1/gnn/score`` at the same moment, on different worker threads.  Their
+amount-independent scoring state (the account's score, node metadata,
+cluster, ring and neighbour exposure) is identical, so ``SingleFlight`` lets
+the first caller for a key compute it while every concurrent caller for the
+same key waits and receives the same result.  Nothing is kept once the
+computation finishes — persistence is the caches' job; this only stops
+concurrent cold misses from multiplying the work.
+
+``do_many`` does the same for a group of keys: keys already in flight are
+awaited, the rest are computed together in one call (one inductive forward
+pass for all of a batch's unseen accounts).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done  = threading.Event()
+        self.value: Any = None
+        self.error: Any = None
+
+    def result(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class SingleFlight:
+    """Thread-safe; one instance per serving snapshot."""
+
+    def __init__(self, name: str) -> None:
+        self.name   = name
+        self._lock  = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._led       = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """(value, leader) — ``leader`` is False when the value came from another caller's computation."""
+        with self._lock:
+            call   = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._led += 1
+            else:
+                self._coalesced += 1
+        if not leader:
+            return call.result(), False
+
+        try:
+            call.value = compute()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.value, True
+
+    def do_many(
+        self,
+        keys:    Sequence[Hashable],
+        compute: Callable[[List[Hashable]], List[Any]],
+    ) -> List[Any]:
+        """
+        One value per key, in order (keys must be distinct).  ``compute``
+        receives the keys this caller leads and returns their values in the
+        same order.
+        """
+        owned:   List[Tuple[int, _Call]] = []
+        waiting: List[Tuple[int, _Call]] = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    owned.append((i, call))
+                else:
+                    waiting.append((i, call))
+            self._led       += len(owned)
+            self._coalesced += len(waiting)
+
+        results: List[Any] = [None] * len(keys)
+        if owned:
+            try:
+                values = compute([keys[i] for i, _ in owned])
+                for (i, call), value in zip(owned, values):
+                    call.value = results[i] = value
+            except BaseException as exc:
+                for _, call in owned:
+                    call.error = exc
+                raise
+            finally:
+                with self._lock:
+                    for i, _ in owned:
+                        self._calls.pop(keys[i], None)
+                for _, call in owned:
+                    call.done.set()
+        for i, call in waiting:
+            results[i] = call.result()
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._led + self._coalesced
+            return {
+                "name":          self.name,
+                "computed":      self._led,
+                "coalesced":     self._coalesced,
+                "in_flight":     len(self._calls),
+                "coalesce_rate": round(self._coalesced / total, 4) if total else 0.0,
+            }
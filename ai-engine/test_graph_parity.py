@@ -0,0 +1,276 @@
+"""
+MuleHunter AI  ·  Graph Parity Checks
+============================================
+Run:
+    python test_graph_parity.py
+
+Checks the array-based graph code in the offline pipeline against the
+NetworkX implementations it replaced, on small seeded random graphs.
+Needs numpy, scipy, pandas and networkx only — no API, no torch.
+
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from communities import louvain, modularity, undirected_adjacency
+from graph_metrics import (
+    TransactionMatrix, load_vector, neighbour_fraud_rate, node_metrics, pagerank, save_vector,
+)
+from ring_engine import MAX_RING_SIZE, MIN_RING_SIZE, RingEnumerator
+from ring_pool import PARALLEL_MIN_ROOTS, parallel_rings
+
+SEED = 7
+
+PASS    = "✅"
+FAIL    = "❌"
+results: list[tuple[str, str, str]] = []
+
+
+def check(name: str, condition: bool, detail: str = "") -> bool:
+    status = PASS if condition else FAIL
+    results.append((status, name, detail))
+    suffix = f" — {detail}" if detail else ""
+    print(f"  {status}  {name}{suffix}")
+    return condition
+
+
+def section(title: str) -> None:
+    print(f"\n{'─' * 60}")
+    print(f"  {title}")
+    print(f"{'─' * 60}")
+
+
+def random_frame(n: int, m: int, seed: int = SEED) -> pd.DataFrame:
+    """``m`` transactions over ``n`` accounts, with repeats and self-loops."""
+    rng = np.random.default_rng(seed)
+    df  = pd.DataFrame({
+        "source": rng.integers(0, n, m).astype(str),
+        "target": rng.integers(0, n, m).astype(str),
+        "amount": rng.gamma(2.0, 500.0, m).round(2),
+    })
+    df.loc[:9, "amount"] = 0.0
+    return df
+
+
+def nx_graph(df: pd.DataFrame, node_ids: list[str]) -> nx.DiGraph:
+    """The graph feature_engineering.py used to build."""
+    G = nx.from_pandas_edgelist(
+        df.rename(columns={"amount": "weight"}),
+        source="source", target="target", edge_attr="weight",
+        create_using=nx.DiGraph(),
+    )
+    G.add_nodes_from(node_ids)
+    return G
+
+
+NODES = [str(i) for i in range(640)]          # 40 accounts with no transactions
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 1. TRANSACTION MATRIX  vs  per-node NetworkX loop
+# ──────────────────────────────────────────────────────────────────────────────
+def check_transaction_matrix(df: pd.DataFrame) -> None:
+    section("1. TRANSACTION MATRIX")
+    G, tx = nx_graph(df, NODES), TransactionMatrix.from_frame(df, NODES)
+
+    check("node order matches DiGraph",  tx.ids == list(G.nodes()))
+    check("edge count matches DiGraph",  tx.num_edges == G.number_of_edges(),
+          f"{tx.num_edges} vs {G.number_of_edges()}")
+
+    metrics = node_metrics(tx)
+    rows    = tx.rows(NODES)
+    io_bad = rs_bad = 0
+    for k, nid in zip(rows, NODES):
+        out_amt = sum(d.get("weight", 0.0) for _, _, d in G.out_edges(nid, data=True))
+        in_amt  = sum(d.get("weight", 0.0) for _, _, d in G.in_edges(nid, data=True))
+        succ, pred = set(G.successors(nid)), set(G.predecessors(nid))
+        io_bad += in_amt / (out_amt + 1e-5) != metrics["in_out_ratio"][k]
+        rs_bad += len(succ & pred) / (len(succ) + 1) != metrics["reciprocity_score"][k]
+    check("in_out_ratio bit-identical",      io_bad == 0, f"{io_bad} mismatches")
+    check("reciprocity_score bit-identical", rs_bad == 0, f"{rs_bad} mismatches")
+
+    fraud_set = set(np.random.default_rng(SEED).choice(NODES, 60, replace=False).tolist())
+    rates     = neighbour_fraud_rate(tx, np.array([nid in fraud_set for nid in tx.ids]))
+    sh_bad = 0
+    for k, nid in zip(rows, NODES):
+        neighbours = list(G.successors(nid)) + list(G.predecessors(nid))
+        expected   = sum(1 for n in neighbours if n in fraud_set) / len(neighbours) if neighbours else 0.0
+        sh_bad += expected != rates[k]
+    check("second_hop_fraud_rate fallback bit-identical", sh_bad == 0, f"{sh_bad} mismatches")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 2. PAGERANK  vs  nx.pagerank
+# ──────────────────────────────────────────────────────────────────────────────
+def check_pagerank(df: pd.DataFrame) -> None:
+    section("2. PAGERANK")
+    G, tx = nx_graph(df, NODES), TransactionMatrix.from_frame(df, NODES)
+
+    # Both stop once an iteration changes the vector by less than N·tol in L1
+    # norm, so they agree to within that bound, not to each other's last digit.
+    bound  = tx.num_nodes * 1e-6
+    ref    = nx.pagerank(G, alpha=0.85, max_iter=200, weight="weight")
+    pr, it = pagerank(tx)
+    diff   = np.abs(np.array([ref[nid] for nid in tx.ids]) - pr).sum()
+    check("cold start within tolerance", diff < bound, f"L1 {diff:.2e} after {it} iterations")
+    check("sums to 1",                   abs(pr.sum() - 1.0) < 1e-9)
+
+    # Warm start on a slightly changed graph (one new account, two new edges)
+    df2  = pd.concat([df, pd.DataFrame({
+        "source": ["9999", "1"], "target": ["1", "9999"], "amount": [10.0, 20.0],
+    })], ignore_index=True)
+    tx2  = TransactionMatrix.from_frame(df2, NODES)
+    ref2 = nx.pagerank(nx_graph(df2, NODES), alpha=0.85, max_iter=200, weight="weight")
+    with tempfile.TemporaryDirectory() as tmp:
+        save_vector(Path(tmp) / "pagerank_state.npz", tx, pr)
+        start = load_vector(Path(tmp) / "pagerank_state.npz", tx2)
+    check("saved vector realigned",       start is not None and np.isnan(start).sum() == 1)
+    pr2, it2 = pagerank(tx2, start=start)
+    diff2 = np.abs(np.array([ref2[nid] for nid in tx2.ids]) - pr2).sum()
+    check("warm start within tolerance",  diff2 < bound, f"L1 {diff2:.2e}")
+    check("warm start converges faster",  it2 < it, f"{it2} vs {it} iterations")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 3. RING ENUMERATION  vs  nx.simple_cycles
+# ──────────────────────────────────────────────────────────────────────────────
+def ring_engine(df: pd.DataFrame, accounts: set[str]) -> tuple[TransactionMatrix, RingEnumerator]:
+    tx   = TransactionMatrix.from_frame(df)
+    A    = tx.adjacency
+    mask = np.array([nid in accounts for nid in tx.ids])
+    return tx, RingEnumerator(A.indptr, A.indices, A.data, mask, max_len=MAX_RING_SIZE)
+
+
+def check_rings(df: pd.DataFrame) -> None:
+    section("3. RING ENUMERATION")
+    accounts = {str(i) for i in range(800) if i % 7}       # every 7th id is a location
+    tx, engine = ring_engine(df, accounts)
+    rings = list(engine.rings())
+
+    G   = nx_graph(df, [])
+    sub = G.subgraph(nid for nid in G if nid in accounts)
+    ref = {
+        frozenset(c) for c in nx.simple_cycles(sub, length_bound=MAX_RING_SIZE)
+        if len(c) >= MIN_RING_SIZE
+    }
+    got = {frozenset(tx.ids[i] for i in path) for path, _ in rings}
+    check("same ring node sets as simple_cycles", got == ref, f"{len(got)} vs {len(ref)} rings")
+    check("each ring produced once",             len(got) == len(rings))
+
+    canonical = all(min(path) == path[0] and len(set(path)) == len(path) for path, _ in rings)
+    check("rings start at their lowest node",    canonical)
+    bad_vol = 0
+    for path, volume in rings:
+        ids = [tx.ids[i] for i in path]
+        bad_vol += abs(sum(G[u][v]["weight"] for u, v in zip(ids, ids[1:] + ids[:1])) - volume) > 1e-6
+    check("ring volumes match edge amounts",     bad_vol == 0, f"{bad_vol} mismatches")
+    check("rings smallest first",                [len(p) for p, _ in rings] == sorted(len(p) for p, _ in rings))
+    check("deterministic",                       rings == list(ring_engine(df, accounts)[1].rings()))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 4. PARALLEL RINGS  vs  serial order
+# ──────────────────────────────────────────────────────────────────────────────
+def check_parallel_rings(df: pd.DataFrame) -> None:
+    section("4. PARALLEL RINGS")
+    _, engine = ring_engine(df, set(df["source"]) | set(df["target"]))
+    check("graph large enough for the pool", len(engine.roots) >= PARALLEL_MIN_ROOTS,
+          f"{len(engine.roots)} roots")
+
+    serial = list(engine.rings())
+    for limit in (len(serial) + 1, len(serial) // 3, 7):
+        par = list(parallel_rings(engine, limit, workers=2))
+        check(f"limit {limit:,}: same rings in serial order", par == serial[:limit],
+              f"{len(par):,} rings")
+
+    shm = Path("/dev/shm")
+    before = set(shm.iterdir()) if shm.is_dir() else set()
+    gen = parallel_rings(engine, len(serial), workers=2)
+    first = next(gen)
+    gen.close()                                   # shuts the pool, unlinks shared memory
+    leaked = (set(shm.iterdir()) if shm.is_dir() else set()) - before
+    check("early close frees shared memory", first == serial[0] and not leaked,
+          f"{len(leaked)} blocks left")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 5. LOUVAIN  vs  nx.community
+# ──────────────────────────────────────────────────────────────────────────────
+def partition(labels: np.ndarray, ids: list[str]) -> list[set[str]]:
+    groups: dict[int, set[str]] = {}
+    for nid, c in zip(ids, labels.tolist()):
+        groups.setdefault(c, set()).add(nid)
+    return list(groups.values())
+
+
+def check_louvain(df: pd.DataFrame) -> None:
+    section("5. LOUVAIN")
+    tx  = TransactionMatrix.from_frame(df, NODES)
+    U   = nx_graph(df, NODES).to_undirected()
+    adj = undirected_adjacency(tx)
+    labels = louvain(adj)
+
+    check("same partition on every run", all(np.array_equal(labels, louvain(adj)) for _ in range(3)))
+
+    ours = modularity(adj, labels)
+    ref  = nx.community.modularity(U, partition(labels, tx.ids), weight=None)
+    check("modularity matches NetworkX", abs(ours - ref) < 1e-12, f"{ours:.6f} vs {ref:.6f}")
+    for gamma in (0.5, 2.0):
+        g_ours = modularity(adj, labels, resolution=gamma)
+        g_ref  = nx.community.modularity(U, partition(labels, tx.ids), weight=None, resolution=gamma)
+        check(f"modularity matches at resolution {gamma}", abs(g_ours - g_ref) < 1e-12)
+
+    sizes = np.bincount(labels)
+    check("ids numbered largest community first", bool(np.all(np.diff(sizes) <= 0)))
+    n_pieces = sum(nx.number_connected_components(U.subgraph(c)) for c in partition(labels, tx.ids))
+    check("every community connected", n_pieces == len(sizes))
+
+    karate = nx.karate_club_graph()
+    k_adj  = nx.to_scipy_sparse_array(karate, weight=None, format="csr")
+    k_lab  = louvain(k_adj)
+    k_ids  = list(karate.nodes())
+    greedy = nx.community.modularity(
+        karate, nx.community.greedy_modularity_communities(karate, weight=None), weight=None,
+    )
+    k_q = nx.community.modularity(karate, partition(k_lab, k_ids), weight=None)
+    check("karate club at least as good as greedy", k_q >= greedy - 1e-12, f"Q {k_q:.4f} vs {greedy:.4f}")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# SUMMARY
+# ──────────────────────────────────────────────────────────────────────────────
+def main() -> None:
+    df = random_frame(600, 4000)
+    check_transaction_matrix(df)
+    check_pagerank(df)
+    check_rings(random_frame(800, 3200, seed=SEED + 1))
+    check_parallel_rings(random_frame(2000, 7000, seed=SEED + 2))
+    check_louvain(df)
+
+    print(f"\n{'═' * 60}")
+    passed = sum(1 for s, _, _ in results if s == PASS)
+    failed = sum(1 for s, _, _ in results if s == FAIL)
+    print(f"  RESULT:  {passed}/{len(results)} passed   |   {failed} failed")
+    print(f"{'═' * 60}")
+
+    if failed > 0:
+        print("\n  Failed checks:")
+        for s, name, detail in results:
+            if s == FAIL:
+                suffix = f" — {detail}" if detail else ""
+                print(f"    ❌  {name}{suffix}")
+        print()
+
+    sys.exit(0 if failed == 0 else 1)
+
+
+if __name__ == "__main__":      # ring_pool workers re-import this module
+    main()
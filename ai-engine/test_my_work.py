@@ -13,9 +13,12 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
+import networkx as nx
+import numpy as np
 import pandas as pd
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -112,9 +115,22 @@ fraud_node_id = str(fraud_rows.iloc[0]["node_id"]) if len(fraud_rows) > 0 else r
 safe_rows     = df[df["is_fraud"] == 0]
 safe_node_id  = str(safe_rows.iloc[0]["node_id"]) if len(safe_rows) > 0 else real_node_id
 
+# Transactions between nodes.csv accounts — the edges of processed_graph.pt,
+# repeats included, in file order
+tx_df     = pd.read_csv(SHARED / "transactions.csv", dtype={"source": str, "target": str})
+known_ids = set(df["node_id"].astype(str))
+tx_known  = tx_df[tx_df["source"].isin(known_ids) & tx_df["target"].isin(known_ids)]
+succ: dict[str, list[str]] = {}
+pred: dict[str, list[str]] = {}
+for u, v in zip(tx_known["source"], tx_known["target"]):
+    succ.setdefault(u, []).append(v)
+    pred.setdefault(v, []).append(u)
+busy_node_id = max(succ, key=lambda a: len(set(succ[a])))
+
 print(f"\n  Test node (real):   {real_node_id}")
 print(f"  Test node (fraud):  {fraud_node_id}")
 print(f"  Test node (safe):   {safe_node_id}")
+print(f"  Test node (busy):   {busy_node_id}")
 
 # Verify norm_params matches feature column count
 with open(SHARED / "norm_params.json") as f:
@@ -176,6 +192,10 @@ try:
           f"{data.get('rings_cached')} rings")
     check("logit_cache_size present",   "logit_cache_size" in data,
           f"{data.get('logit_cache_size')} nodes cached")
+    ready = data.get("readiness", {})
+    check("readiness breakdown",        ready.get("model") is True and ready.get("logits") is True
+          and "percent" in ready.get("rings", {}),
+          f"rings {ready.get('rings', {}).get('state')} {ready.get('rings', {}).get('percent')}%")
 except Exception as exc:
     check("API is reachable", False, str(exc))
     print(f"\n  {WARN}  API is not running. Start it with:")
@@ -213,6 +233,14 @@ check("has nested 'muleRingDetection'", "muleRingDetection" in d)
 check("has 'riskFactors' list",       isinstance(d.get("riskFactors"), list))
 check("has 'embedding.embeddingNorm'","embeddingNorm" in d.get("embedding", {}))
 check("has 'timestamp'",       bool(d.get("timestamp")))
+check("schema field order",    list(d) == [
+    "model", "version", "entity", "scores", "fraudCluster", "networkMetrics",
+    "muleRingDetection", "riskFactors", "embedding", "timestamp", "gnnScore",
+    "confidence", "fraudClusterId", "embeddingNorm", "sourceAccountId", "targetAccountId",
+], "fast encoder must match the GnnScoreResponse layout")
+encoding = get("/health").json().get("score_encoding", {})
+check("score encoding compatible", encoding.get("mode") == "pydantic" or not encoding.get("failures"),
+      f"{encoding.get('mode')} ({encoding.get('encoder', '-')}, {encoding.get('checked', 0)} checked)")
 
 gnn_score = d.get("gnnScore", -1)
 conf      = d.get("confidence", -1)
@@ -247,6 +275,37 @@ check("missing graphFeatures ok",  r4.status_code == 200)
 r5 = post("/v1/gnn/score", {"accountId": ""})
 check("empty accountId → 422",     r5.status_code == 422)
 
+# 5f. Concurrent burst from one account — coalesced, same account state
+with ThreadPoolExecutor(max_workers=8) as pool:
+    burst = list(pool.map(
+        lambda amt: post("/v1/gnn/score", {"accountId": fraud_node_id, "transactionAmount": amt}),
+        [100.0 * (k + 1) for k in range(16)],
+    ))
+check("burst requests all 200", all(b.status_code == 200 for b in burst))
+check("burst shares account state",
+      len({json.dumps(b.json().get("muleRingDetection"), sort_keys=True) for b in burst}) == 1)
+flight = get("/health").json().get("single_flight", {})
+check("single_flight stats exposed", "coalesced" in flight,
+      f"computed={flight.get('computed')} coalesced={flight.get('coalesced')}")
+
+# 5g. Live fraud exposure — distinct fraud neighbours counted from the raw file
+fraud_ids = set(df.loc[df["is_fraud"] == 1, "node_id"].astype(str))
+
+def linked_to(acc: str) -> set[str]:
+    return (set(succ.get(acc, [])) | set(pred.get(acc, []))) - {acc}
+
+exposed_id = max(succ, key=lambda a: len(set(succ[a]) & fraud_ids))
+hop1 = linked_to(exposed_id)
+hop2 = set().union(*(linked_to(b) for b in hop1)) - hop1 - {exposed_id}
+nm   = post("/v1/gnn/score", {"accountId": exposed_id, "graphFeatures": {}}).json().get("networkMetrics", {})
+check("suspiciousNeighbors = fraud successors", nm.get("suspiciousNeighbors") == len(set(succ[exposed_id]) & fraud_ids),
+      f"{exposed_id}: {nm.get('suspiciousNeighbors')}")
+check("fraudNeighbors1Hop matches",  nm.get("fraudNeighbors1Hop") == len(hop1 & fraud_ids))
+check("fraudNeighbors2Hop matches",  nm.get("fraudNeighbors2Hop") == len(hop2 & fraud_ids),
+      f"{nm.get('fraudNeighbors2Hop')} of {len(hop2)}")
+check("twoHopFraudDensity matches",
+      nm.get("twoHopFraudDensity") == (round(len(hop2 & fraud_ids) / len(hop2), 4) if hop2 else 0.0))
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 6. /analyze-transaction
@@ -270,6 +329,16 @@ check("latency < 500ms",           d.get("latency_ms", 9999) < 500,  f"{d.get('l
 check("latency < 50ms (target)",   d.get("latency_ms", 9999) < 50,
       f"{'HIT' if d.get('latency_ms', 9999) < 50 else 'optimise further'}")
 
+# Degrees and linked accounts come from the CSR index — compare with the raw file
+r = post("/analyze-transaction", {"source_id": busy_node_id, "target_id": "some_dest", "amount": 100})
+d = r.json()
+check("out_degree = outgoing transactions", d.get("out_degree") == len(succ[busy_node_id]),
+      f"{d.get('out_degree')} vs {len(succ[busy_node_id])}")
+check("in_degree = incoming transactions",  d.get("in_degree") == len(pred.get(busy_node_id, [])),
+      f"{d.get('in_degree')} vs {len(pred.get(busy_node_id, []))}")
+check("linked_accounts = first 10 distinct counterparties",
+      d.get("linked_accounts") == list(dict.fromkeys(succ[busy_node_id]))[:10])
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 7. /analyze-batch
@@ -289,6 +358,24 @@ check("has 'count' = 3",        d.get("count") == 3)
 check("has 'flagged' field",    "flagged" in d)
 check("has 'results' list (3)", len(d.get("results", [])) == 3)
 
+big = [{"source_id": real_node_id, "target_id": "dst1", "amount": 1000}] * 250
+r = post("/analyze-batch", {"transactions": big})
+check("no 100-tx cap (250 in → 250 out)", r.status_code == 200 and r.json().get("count") == 250)
+
+r = httpx.post(f"{BASE}/analyze-batch", params={"stream": "true"},
+               json={"transactions": big}, timeout=30.0)
+lines = [json.loads(l) for l in r.text.splitlines() if l.strip()]
+check("stream=true returns NDJSON",  r.headers.get("content-type", "").startswith("application/x-ndjson"))
+check("NDJSON: 250 rows + summary",  len(lines) == 251 and lines[-1].get("count") == 250)
+
+body = "\n".join(json.dumps(t) for t in big[:5]) + "\nnot-json\n"
+r = httpx.post(f"{BASE}/analyze-batch/ndjson", content=body.encode(),
+               headers={"content-type": "application/x-ndjson"}, timeout=30.0)
+lines = [json.loads(l) for l in r.text.splitlines() if l.strip()]
+check("/analyze-batch/ndjson returns 200", r.status_code == 200)
+check("bad line reported in place",        len(lines) == 7 and "error" in lines[5],
+      f"summary={lines[-1] if lines else None}")
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 8. /detect-rings  [FIX 2] explicit timeout
@@ -303,6 +390,49 @@ check("has high_risk_nodes field",  "high_risk_nodes" in d)
 check("rings list present",         isinstance(d.get("rings"), list))
 print(f"  ℹ️   rings found in cache: {d.get('rings_detected', 0)}")
 
+# Shape, hub and roles are precomputed per ring — recompute them with NetworkX
+r = get("/detect-rings", timeout=30.0)
+rings = r.json().get("rings", []) if r.status_code == 200 else []
+tx_nx = nx.from_pandas_edgelist(tx_df, "source", "target", edge_attr="amount", create_using=nx.DiGraph())
+closed = shaped = roled = summed = 0
+for ring in rings:
+    nodes = ring["nodes"]
+    hops  = list(zip(nodes, nodes[1:] + nodes[:1]))
+    if all(tx_nx.has_edge(u, v) for u, v in hops):
+        closed += 1
+        volume  = sum(tx_nx[u][v]["amount"] for u, v in hops)         # last amount per pair
+        summed += abs(ring.get("volume", -1.0) - volume) <= 0.01 * len(nodes) + 1e-6 * volume
+    sub      = tx_nx.subgraph(nodes)
+    n        = len(nodes)
+    out_degs = [sub.out_degree(nd) for nd in nodes]
+    shape = (
+        "STAR" if max(out_degs) >= n * 0.6
+        else "DENSE_CLUSTER" if sub.number_of_edges() / (n * (n - 1)) >= 0.6
+        else "CHAIN" if sum(1 for k in out_degs if k <= 1) >= n * 0.4
+        else "CYCLE"
+    )
+    shaped += ring.get("shape") == shape
+    hub    = nodes[out_degs.index(max(out_degs))]
+    bc     = nx.betweenness_centrality(sub)
+    avg_bc = sum(bc[nd] for nd in nodes) / n
+    roles  = {nd: "HUB" if nd == hub else "BRIDGE" if bc[nd] > avg_bc * 2.0 else "MULE" for nd in nodes}
+    roled += ring.get("hub") == hub and ring.get("roles") == roles
+check("rings are closed cycles",        bool(rings) and closed == len(rings), f"{closed}/{len(rings)}")
+check("ring shapes match NetworkX",     shaped == len(rings), f"{shaped}/{len(rings)}")
+check("hub and roles match NetworkX",   roled == len(rings),  f"{roled}/{len(rings)}")
+check("ring volumes match amounts",     summed == len(rings), f"{summed}/{len(rings)}")
+
+if rings:
+    top_ring = rings[0]
+    mr = post("/v1/gnn/score", {"accountId": top_ring["hub"]}).json().get("muleRingDetection", {})
+    by_id = {ring.get("ring_id"): ring for ring in rings}
+    picked = by_id.get(mr.get("ringId"), {})
+    check("muleRingDetection reads the ring index",
+          mr.get("isMuleRingMember") is True and picked.get("volume") == top_ring["volume"]
+          and mr.get("ringAccounts") == picked.get("nodes") and mr.get("hubAccount") == picked.get("hub")
+          and mr.get("role") == picked.get("roles", {}).get(top_ring["hub"]),
+          f"ring {mr.get('ringId')} role {mr.get('role')}")
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 9. /cluster-report
@@ -316,6 +446,34 @@ check("has total_clusters",       "total_clusters"     in d)
 check("has high_risk_clusters",   "high_risk_clusters" in d)
 check("has top_clusters list",    isinstance(d.get("top_clusters"), list))
 
+# Aggregates come from the precomputed community table — compare with nodes.csv
+top     = (d.get("top_clusters") or [{}])[0]
+members = df[df["community_id"] == top.get("community_id")]
+check("total_clusters = distinct community_id", d.get("total_clusters") == df["community_id"].nunique(),
+      f"{d.get('total_clusters')} clusters")
+check("cluster_size matches nodes.csv",        top.get("cluster_size") == len(members),
+      f"community {top.get('community_id')}: {top.get('cluster_size')} vs {len(members)}")
+check("cluster_fraud_count matches nodes.csv", top.get("cluster_fraud_count") == int(members["is_fraud"].sum()))
+ranks = members.set_index(members["node_id"].astype(str))["pagerank"]
+tops  = top.get("cluster_top_members", [])
+check("cluster_top_members by pagerank",
+      bool(tops) and set(tops) <= set(ranks.index)
+      and ranks[tops].tolist() == sorted(ranks[tops], reverse=True)
+      and ranks[tops].min() >= ranks.nlargest(len(tops)).min())
+
+r  = post("/v1/gnn/score", {"accountId": top.get("node_id", real_node_id)})
+fc = r.json().get("fraudCluster", {})
+check("fraudCluster agrees with /cluster-report",
+      fc.get("clusterId") == top.get("community_id") and fc.get("clusterSize") == top.get("cluster_size"))
+
+busy_cid = int(df.loc[df["node_id"].astype(str) == busy_node_id, "community_id"].iloc[0])
+members  = df[df["community_id"] == busy_cid]
+fc = post("/v1/gnn/score", {"accountId": busy_node_id}).json().get("fraudCluster", {})
+check("fraudCluster matches nodes.csv",
+      fc.get("clusterId") == busy_cid and fc.get("clusterSize") == len(members)
+      and abs(fc.get("clusterRiskScore", -1.0) - members["community_fraud_rate"].mean()) <= 1e-4,
+      f"community {busy_cid}: {len(members)} members")
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 10. /network-snapshot  [FIX 4] new test
@@ -330,6 +488,31 @@ check("has 'edges' list",       isinstance(d.get("edges"), list))
 check("has 'stats' dict",       isinstance(d.get("stats"), dict))
 check("stats has fraud_rate",   "fraud_rate" in d.get("stats", {}))
 
+cursor = d.get("page", {}).get("next_cursor")
+check("next_cursor on first page", bool(cursor))
+r2 = get("/network-snapshot", timeout=10.0, limit=50, cursor=cursor)
+d2 = r2.json() if r2.status_code == 200 else {}
+ids1 = {n["id"] for n in d["nodes"]}
+check("second page is disjoint", r2.status_code == 200 and d2.get("nodes")
+      and not ids1 & {n["id"] for n in d2["nodes"]})
+risks = [n["risk"] for n in d["nodes"] + d2.get("nodes", [])]
+check("pages in risk order",     risks == sorted(risks, reverse=True))
+
+# Edges come from the array-backed graph in NetworkX edges() order
+r = get("/network-snapshot", timeout=10.0, limit=1000)
+page  = r.json() if r.status_code == 200 else {}
+on    = {n["id"] for n in page.get("nodes", [])}
+want  = [(u, v, a) for u in tx_nx for v, a in tx_nx.succ[u].items() if u in on and v in on]
+edges = [(e["source"], e["target"], e["weight"]) for e in page.get("edges", [])]
+check("snapshot edges in NetworkX order", bool(edges)
+      and [e[:2] for e in edges] == [(u, v) for u, v, _ in want[:len(edges)]]
+      and all(abs(w - a["amount"]) <= 0.01 + 1e-6 * a["amount"] for (_, _, w), (_, _, a) in zip(edges, want)),
+      f"{len(edges)} of {len(want)} induced edges")
+r = get("/network-snapshot", timeout=10.0, limit=20, ring_only="true")
+check("ring_only filter",        r.status_code == 200 and all(n["ring"] for n in r.json().get("nodes", [])))
+r = get("/network-snapshot", timeout=10.0, cursor="0.50")
+check("stale cursor → 400",      r.status_code == 400)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 11. /metrics
@@ -389,6 +572,207 @@ check(
 )
 
 
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 14. LIVE INGESTION  (mutates the serving graph — section 15 reloads it)
+# ──────────────────────────────────────────────────────────────────────────────
+section("14. /v1/graph/ingest")
+
+r = post("/v1/graph/ingest", {
+    "transactions": [{"source_id": "ingest_probe_acc", "target_id": real_node_id, "amount": 2500}],
+})
+check("returns 200 (unseen account)", r.status_code == 200)
+d = r.json()
+check("kept as unseen link",          d.get("unseen_edges") == 1 and d.get("graph_edges") == 0)
+
+r = post("/v1/gnn/score", {"accountId": "ingest_probe_acc", "transactionAmount": 2500})
+check("ingested unseen account scores", r.status_code == 200 and 0.0 <= r.json().get("gnnScore", -1) <= 1.0)
+
+r = post("/v1/graph/ingest", {
+    "transactions": [{"source_id": fraud_node_id, "target_id": real_node_id, "amount": 2500}],
+})
+d = r.json()
+check("known → known edge added",     r.status_code == 200 and d.get("graph_edges") == 1)
+check("receptive field refreshed",    d.get("nodes_refreshed", 0) >= 1,
+      f"{d.get('nodes_refreshed')} nodes in {d.get('latency_ms')} ms")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 15. /admin/reload  (hot snapshot swap)
+# ──────────────────────────────────────────────────────────────────────────────
+section("15. /admin/reload")
+
+before = get("/health").json().get("snapshot", {}).get("current", {})
+r = httpx.post(f"{BASE}/admin/reload", params={"wait": "true"}, timeout=180.0)
+check("returns 200",                  r.status_code == 200, r.text[:120] if r.status_code != 200 else "")
+d = r.json() if r.status_code == 200 else {}
+check("new snapshot published",       d.get("status") == "RELOADED")
+after = get("/health").json().get("snapshot", {})
+check("/health reports both versions",
+      after.get("current", {}).get("snapshot_id", 0) > before.get("snapshot_id", 0)
+      and after.get("previous") is not None,
+      f"#{before.get('snapshot_id')} → #{after.get('current', {}).get('snapshot_id')} "
+      f"built in {after.get('current', {}).get('build_sec')}s")
+
+r = post("/v1/gnn/score", {"accountId": real_node_id, "transactionAmount": 5000})
+check("scores after reload",          r.status_code == 200 and 0.0 <= r.json().get("gnnScore", -1) <= 1.0)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 16. /metrics/runtime  (Prometheus text)
+# ──────────────────────────────────────────────────────────────────────────────
+section("16. /metrics/runtime")
+
+r = get("/metrics/runtime", timeout=10.0)
+check("returns 200",                  r.status_code == 200)
+check("text exposition format",       r.headers.get("content-type", "").startswith("text/plain"))
+samples = {}
+for line in r.text.splitlines():
+    if line and not line.startswith("#"):
+        name, _, value = line.rpartition(" ")
+        samples[name] = float(value)
+
+def sample(prefix: str) -> float:
+    return next((v for k, v in samples.items() if k.startswith(prefix)), -1.0)
+
+check("request counters",             sample('mulehunter_requests_total{endpoint="gnn_score"}') > 0
+      and sample('mulehunter_requests_total{endpoint="analyze"}') > 0)
+stages = {"blend", "context_blend", "node_metadata", "cluster", "network_metrics",
+          "ring_lookup", "risk_factors", "serialization"}
+seen = {s for s in stages
+        if sample(f'mulehunter_stage_latency_seconds_count{{endpoint="gnn_score",stage="{s}"}}') > 0}
+check("gnn_score stage histograms",   seen == stages, f"missing: {sorted(stages - seen)}" if seen != stages else "")
+check("logit cache hit counter",      sample('mulehunter_logit_cache_lookups_total{result="hit"}') > 0)
+p99 = sample('mulehunter_request_latency_seconds_quantile{endpoint="analyze",quantile="0.99"}')
+check("analyze p99 exported",         p99 > 0, f"{p99 * 1_000:.2f} ms")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 17. /v1/gnn/similar  (embedding nearest neighbours)
+# ──────────────────────────────────────────────────────────────────────────────
+section("17. /v1/gnn/similar")
+
+r = get("/v1/gnn/similar", accountId=fraud_node_id, k=10)
+check("returns 200",                  r.status_code == 200, r.text[:120] if r.status_code != 200 else "")
+d = r.json() if r.status_code == 200 else {}
+nbrs = d.get("neighbors", [])
+check("k neighbours returned",        len(nbrs) == 10)
+check("query account excluded",       all(n["accountId"] != fraud_node_id for n in nbrs))
+sims = [n["similarity"] for n in nbrs]
+check("sorted by similarity",         sims == sorted(sims, reverse=True) and all(-1.01 <= s <= 1.01 for s in sims))
+n_nodes = get("/health").json().get("nodes_count", 0)
+check("sublinear scan",               0 < d.get("scanned", 0) < n_nodes,
+      f"{d.get('scanned')} of {n_nodes} rows in {d.get('latency_ms')} ms")
+r = get("/v1/gnn/similar", accountId="no_such_account_xyz")
+check("unknown account → 404",        r.status_code == 404)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 18. INDUCTIVE PARITY  (offline — loads the model from shared-data, needs torch)
+# ──────────────────────────────────────────────────────────────────────────────
+section("18. INDUCTIVE PARITY  (held-out accounts, offline)")
+
+
+def offline_model():
+    """(graph, eager ServingGNN) built from shared-data, or None without torch/PyG."""
+    try:
+        import torch
+        from inference_service import MuleHunterGNN
+        from model_export import ServingGNN
+    except ImportError as exc:
+        print(f"  {WARN}  offline checks skipped — {exc}")
+        return None
+    graph  = torch.load(SHARED / "processed_graph.pt", map_location="cpu", weights_only=False)
+    hidden = 128
+    if (SHARED / "model_meta.json").exists():
+        with open(SHARED / "model_meta.json") as f:
+            hidden = json.load(f).get("hidden_channels", 128)
+    model = MuleHunterGNN(in_channels=graph.x.shape[1], hidden=hidden)
+    model.load_state_dict(torch.load(SHARED / "mule_model.pth", map_location="cpu", weights_only=True))
+    return graph, ServingGNN(model.eval()).eval()
+
+
+offline = offline_model()
+if offline is not None:
+    import torch
+    from graph_index import CSRAdjacency
+    from inductive import InductiveScorer, UnseenLinks
+    from node_store import NodeAttributeStore
+    from serving_cache import ShardedLRUCache
+
+    graph, runtime = offline
+    ei    = graph.edge_index.cpu().numpy()
+    ew    = (
+        graph.edge_weight.cpu().numpy() if getattr(graph, "edge_weight", None) is not None
+        else np.ones(ei.shape[1], dtype=np.float32)
+    )
+    store = NodeAttributeStore.from_frame(df, norm["feature_cols"])
+    loops = ei[0] == ei[1]
+    outs  = np.bincount(ei[0][~loops], minlength=graph.num_nodes)
+    ins   = np.bincount(ei[1][~loops], minlength=graph.num_nodes)
+    held  = np.flatnonzero((outs > 0) & (ins > 0))[:5]
+
+    # Hold each account out of the graph, score it inductively (no fan-out
+    # cap), and compare with a full-graph forward that has it added back.
+    worst_p = worst_e = 0.0
+    for v in held.tolist():
+        out_e  = (ei[0] == v) & ~loops
+        in_e   = (ei[1] == v) & ~loops
+        keep   = (ei[0] != v) & (ei[1] != v)
+        scorer = InductiveScorer(
+            runtime, graph.x, CSRAdjacency.from_edge_index(ei[:, keep], graph.num_nodes, ew[keep]),
+            store, norm, ShardedLRUCache("held_out", 4096), hops=3, fanout=0,
+        )
+        links = UnseenLinks(ei[1][out_e], ew[out_e], ei[0][in_e], ew[in_e])
+        risk, conf, emb_norm = scorer.score([links])[0]
+
+        x_ref = graph.x.clone()
+        x_ref[v] = torch.from_numpy(scorer.features(links)).to(x_ref.dtype)
+        with torch.no_grad():
+            logp, emb = runtime(x_ref, torch.from_numpy(ei[:, keep | out_e | in_e]))
+        prob = logp[v].exp()
+        ref_norm = emb[v].norm().item()
+        worst_p = max(worst_p, abs(risk - prob[1].item()), abs(conf - (prob[1] - prob[0]).abs().item()))
+        worst_e = max(worst_e, abs(emb_norm - ref_norm) / max(ref_norm, 1e-12))
+    check("held-out accounts match full-graph forward", len(held) > 0 and worst_p <= 1e-5,
+          f"max |Δp| {worst_p:.1e} over {len(held)} accounts")
+    check("held-out embedding norms match",            worst_e <= 1e-5, f"max rel Δ {worst_e:.1e}")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 19. TORCHSCRIPT EXPORT PARITY  (offline — re-checks the saved artifact)
+# ──────────────────────────────────────────────────────────────────────────────
+section("19. TORCHSCRIPT EXPORT PARITY  (offline)")
+
+export_path = SHARED / "mule_model.torchscript.pt"
+if offline is None:
+    print(f"  {WARN}  skipped — no torch")
+elif not export_path.exists():
+    print(f"  {WARN}  skipped — {export_path.name} not exported")
+else:
+    from artifact_watcher import content_signature
+    from model_export import FP32_TOLERANCE, INT8_TOLERANCE, check_parity, load_exported
+
+    graph, runtime = offline
+    weights = SHARED / "mule_model.pth"
+    loaded  = load_exported(export_path, content_signature([weights])[weights.name])
+    served  = get("/health").json().get("model_runtime", {}).get("runtime")
+    check("export loads for the current weights", loaded is not None,
+          "stale, failed or other torch build" if loaded is None else loaded[1]["runtime"])
+    if loaded is None:
+        check("service falls back to eager", served == "eager", f"runtime={served}")
+    else:
+        module, meta = loaded
+        # Recompute parity now rather than trusting the report stored at export
+        parity = check_parity(
+            runtime, module, graph.x, graph.edge_index, float(report.get("optimal_threshold", 0.5)),
+            INT8_TOLERANCE if meta["quantized"] else FP32_TOLERANCE,
+        )
+        check("export matches the eager model", parity["passed"],
+              f"max |Δp| {parity['max_prob_diff']:.1e}, agreement {parity['decision_agreement']:.4f}")
+        check("service runs the export",       served == meta["runtime"], f"runtime={served}")
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # SUMMARY
 # ──────────────────────────────────────────────────────────────────────────────
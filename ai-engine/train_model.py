@@ -56,6 +56,7 @@ MODEL_PATH  = SHARED_DATA / "mule_model.pth"
 GRAPH_PATH  = SHARED_DATA / "processed_graph.pt"
 EVAL_REPORT = SHARED_DATA / "eval_report.json"
 MODEL_META  = SHARED_DATA / "model_meta.json"
+SERVING_MODEL_PATH = SHARED_DATA / "mule_model.torchscript.pt"
 
 HIDDEN_CHANNELS = 128
 OUT_CHANNELS    = 2
@@ -413,5 +414,56 @@ def train() -> None:
     logger.info("TRAINING COMPLETE — MuleHunter V5")
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# SERVING EXPORT
+# ──────────────────────────────────────────────────────────────────────────────
+
+def export_serving_model(quantize: bool | None = None) -> None:
+    """
+    Trace the saved model to TorchScript for the inference service, with a
+    parity check against the eager model (see model_export.py).  int8
+    quantization of the Linear layers is opt-in via ``quantize`` or
+    EXPORT_INT8=1.
+    """
+    if quantize is None:
+        quantize = os.getenv("EXPORT_INT8", "0") == "1"
+    try:
+        from artifact_watcher import content_signature
+        from model_export import export_model
+
+        data  = torch.load(GRAPH_PATH, map_location="cpu", weights_only=False)
+        model = MuleHunterGNN(in_channels=data.x.shape[1], hidden=HIDDEN_CHANNELS, out=OUT_CHANNELS)
+        model.load_state_dict(torch.load(MODEL_PATH, map_location="cpu", weights_only=True))
+        threshold = 0.5
+        if MODEL_META.exists():
+            with open(MODEL_META) as f:
+                threshold = float(json.load(f).get("optimal_threshold", 0.5))
+        export_model(
+            model, data.x, data.edge_index, SERVING_MODEL_PATH,
+            quantize=quantize, threshold=threshold,
+            source=content_signature([MODEL_PATH])[MODEL_PATH.name],
+        )
+    except Exception as exc:
+        logger.warning("Serving model not exported (%s) — the service will run the eager model", exc)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# SERVING SNAPSHOT
+# ──────────────────────────────────────────────────────────────────────────────
+
+def compile_serving_snapshot() -> None:
+    """
+    Bake the freshly trained model, its logits and the graph precomputes
+    into shared-data/serving_snapshot.bin for fast service startup.
+    """
+    try:
+        from inference_service import compile_serving_snapshot as _compile
+        _compile()
+    except Exception as exc:
+        logger.warning("Serving snapshot not compiled (%s) — the service will do a full build", exc)
+
+
 if __name__ == "__main__":
-    train()
\ No newline at end of file
+    train()
+    export_serving_model()
+    compile_serving_snapshot()